@@ -37,6 +37,7 @@ setup(
     entry_points={
         "console_scripts": [
             "mastermind = mastermind.main.main:main",
+            "mastermind-simulate = mastermind.simulation.__main__:main",
         ],
     },
 )
@@ -3,6 +3,7 @@ from typing import Optional
 from mastermind.game.game_flow import GameFlow
 from mastermind.game.game_parameter import GameParameter
 from mastermind.game.player_logic import PlayerLogic
+from mastermind.solver import SolverSettings
 
 
 class Game:
@@ -14,14 +15,22 @@ class Game:
         number_of_dots (int): The number of dots in each combination.
         maximum_attempts (int): The maximum number of attempts allowed in the game.
         game_mode (str): The game mode, such as "HvH", "HvAI", "AIvH", or "AIvAI".
+        solver_settings (Optional[SolverSettings]): The settings of the AI solver, if any.
     """
 
-    def __init__(self, number_of_colors, number_of_dots, maximum_attempts, game_mode):
+    def __init__(
+        self,
+        number_of_colors,
+        number_of_dots,
+        maximum_attempts,
+        game_mode,
+        solver_settings: Optional[SolverSettings] = None,
+    ):
         self._state = GameParameter(
             number_of_colors, number_of_dots, maximum_attempts, game_mode
         )
         self._board = self._state._board
-        self._player_logic = PlayerLogic(self._state)
+        self._player_logic = PlayerLogic(self._state, solver_settings)
         self._game_flow = GameFlow(self._state, self._player_logic)
 
     def start_game(self) -> Optional[str]:
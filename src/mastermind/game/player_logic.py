@@ -8,6 +8,7 @@ from mastermind.players import (
     HumanCodeCracker,
     HumanCodeSetter,
 )
+from mastermind.solver import SolverSettings
 
 
 class PlayerLogic:
@@ -16,10 +17,16 @@ class PlayerLogic:
 
     Args:
         game (GameState): The state of the game.
+        solver_settings (Optional[SolverSettings]): The settings of the AI solver, if any.
     """
 
-    def __init__(self, game_state: GameParameter) -> None:
+    def __init__(
+        self,
+        game_state: GameParameter,
+        solver_settings: Optional[SolverSettings] = None,
+    ) -> None:
         self.game_state = game_state
+        self.solver_settings = solver_settings or SolverSettings()
 
     @property
     def GAME_MODE(self) -> str:
@@ -56,8 +56,14 @@ class GameController:
     @classmethod
     def resume_game(cls, game_index: int) -> None:
         """Resume a saved game."""
-        # Retrieve game
-        game = UserDataManager().saved_games[game_index]["game"]
+        # Retrieve game, loading its payload only now
+        meta_data = UserDataManager().saved_games[game_index]
+        game = GameHistoryManager.load_game(meta_data)
+        if game is None:  # the payload is missing or cannot be loaded
+            print("This saved game is unavailable and has been removed.")
+            UserDataManager().saved_games.pop(game_index)
+            GameHistoryManager.delete_game(meta_data)
+            return
 
         # Resume game and retrieve exit state
         exit_state = game.resume_game()
@@ -65,7 +71,8 @@ class GameController:
         # Update saved games if not game discarded
         if exit_state == "d":  # or delete it if discarded
             UserDataManager().saved_games.pop(game_index)
+            GameHistoryManager.delete_game(meta_data)
         else:
-            UserDataManager().saved_games[game_index] = (
-                GameHistoryManager().generate_meta_data(game)
+            UserDataManager().saved_games[game_index] = GameHistoryManager.store_game(
+                game, meta_data.get("game_id")
             )
@@ -1,10 +1,16 @@
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 
 from mastermind.game.game import Game
-from mastermind.main.game_storage import list_continuable_games, retrieve_stored_games
+from mastermind.main.game_storage import (
+    list_continuable_games,
+    list_stored_games,
+    retrieve_stored_games,
+)
 from mastermind.storage.user_data import UserDataManager
+from mastermind.utils import encode_codes, encode_feedback, fits_int64
 
 
 def game_list_to_pandas(games: List[dict]) -> Optional[pd.DataFrame]:
@@ -41,7 +47,25 @@ class GameHistoryManager:
 
     @staticmethod
     def generate_meta_data(game: Game) -> dict:
-        """Generate meta data for the game."""
+        """
+        Generate meta data for the game.
+
+        The guesses and feedback are stored oldest first as integer arrays (see mastermind.utils.code_codec and encode_feedback), which pickle far more compactly than stacks of tuples. When the code indices of the dimension do not fit in 64 bits, the guesses are stored as a list of tuples instead. The Game object itself is not included; see store_game.
+        """
+        number_of_dots = game._state.number_of_dots
+        number_of_colors = game._state.number_of_colors
+        entries = [game._board[i] for i in range(len(game) - 1, -1, -1)]
+        feedback = np.array([feedback for _, feedback in entries], dtype=np.int64)
+        if fits_int64(number_of_colors, number_of_dots):
+            guesses = encode_codes(
+                np.array([guess for guess, _ in entries], dtype=np.int64).reshape(
+                    -1, number_of_dots
+                ),
+                number_of_colors,
+            )
+        else:
+            guesses = [tuple(guess) for guess, _ in entries]
+
         return {
             "game_mode": game._state.GAME_MODE,
             "number_of_dots": game._state.number_of_dots,
@@ -49,11 +73,44 @@ class GameHistoryManager:
             "amount_attempted": len(game),
             "amount_allowed": game._state.MAXIMUM_ATTEMPTS,
             "win_status": game._state.win_status,
-            "guesses": game._board._guesses,
-            "feedback": game._board._feedbacks,
-            **({"game": game} if game._state.win_status is None else {}),
+            "guesses": guesses,
+            "feedback": encode_feedback(*feedback.reshape(-1, 2).T, number_of_dots),
         }
 
+    @staticmethod
+    def store_game(game: Game, game_id: Optional[str] = None) -> dict:
+        """
+        Generate the meta data of the game, storing an unfinished game as a separate payload.
+
+        Only the payload key is kept in the meta data under "game_id", so listing the saved games never unpickles a Game. The payload of a finished game is deleted.
+
+        Args:
+            game (Game): The game to store.
+            game_id (Optional[str]): The payload key the game was previously stored under, if any.
+
+        Returns:
+            dict: The meta data of the game.
+        """
+        meta_data = GameHistoryManager.generate_meta_data(game)
+        if game._state.win_status is None:
+            meta_data["game_id"] = UserDataManager.save_payload(game, game_id)
+        elif game_id is not None:
+            UserDataManager.delete_payload(game_id)
+        return meta_data
+
+    @staticmethod
+    def load_game(meta_data: dict) -> Optional[Game]:
+        """Load the Game of an unfinished game from its payload."""
+        if "game" in meta_data:  # stored inline by earlier versions
+            return meta_data["game"]
+        return UserDataManager.load_payload(meta_data["game_id"])
+
+    @staticmethod
+    def delete_game(meta_data: dict) -> None:
+        """Delete the payload of a saved game, if it has one."""
+        if "game_id" in meta_data:
+            UserDataManager.delete_payload(meta_data["game_id"])
+
     @staticmethod
     def save_game(game: Game) -> None:
         """Save the game to a file."""
@@ -61,12 +118,12 @@ class GameHistoryManager:
             UserDataManager().saved_games = []  # initialize the list
 
         UserDataManager().saved_games.append(
-            GameHistoryManager.generate_meta_data(game)
+            GameHistoryManager.store_game(game)
         )  # store the meta data
 
     @staticmethod
     def retrieve_game_history() -> Optional[pd.DataFrame]:
-        return game_list_to_pandas(retrieve_stored_games())
+        return game_list_to_pandas(list_stored_games(retrieve_stored_games()))
 
     @staticmethod
     def retrieve_continuable_games() -> Optional[pd.DataFrame]:
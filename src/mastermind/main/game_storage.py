@@ -1,3 +1,4 @@
+from mastermind.storage.game_database import SavedGames
 from mastermind.storage.user_data import UserDataManager
 
 
@@ -7,10 +8,19 @@ def retrieve_stored_games():
     return saved_games or []
 
 
+def list_stored_games(stored_games):
+    """Return the listing fields of the stored games, without loading whole rows from a database."""
+    if isinstance(stored_games, SavedGames):  # indexed query
+        return stored_games.listing()
+    return list(stored_games)
+
+
 def list_continuable_games_index(stored_games):
     """Return a list of indexes of the stored games that can be continued."""
     if not stored_games:  # no games
         return []
+    if isinstance(stored_games, SavedGames):  # indexed query
+        return stored_games.continuable_indices()
     return [
         index for index, game in enumerate(stored_games) if game["win_status"] is None
     ]
@@ -20,4 +30,6 @@ def list_continuable_games(stored_games):
     """Return a list of the stored games that can be continued."""
     if not stored_games:  # no games
         return []
+    if isinstance(stored_games, SavedGames):  # indexed query
+        return stored_games.listing(continuable_only=True)
     return [game for game in stored_games if game["win_status"] is None]
@@ -53,12 +53,10 @@ class MainUI:
             GameController.start_new_game("HvAI")
             return True
         elif choice == "AI vs You":
-            # GameController.start_new_game("AIvH")
-            print("This feature  is not implemented yet.")
+            GameController.start_new_game("AIvH")
             return True
         elif choice == "Solve External Game":
-            # GameController.start_new_game("AIvAI")
-            print("This feature  is not implemented yet.")
+            GameController.start_new_game("AIvAI")
             return True
         elif choice == "Return to Main Menu":
             return False  # terminate the loop
@@ -83,7 +81,7 @@ class MainUI:
         while self.main_menu():
             pass  # keep calling self.main_menu() until it return False
         print("Thank you for playing!")
-        UserDataManager().save_data()
+        UserDataManager().flush()
 
 
 def main():
@@ -1,6 +1,9 @@
+import time
 from random import randint
+from typing import List, Union
 
 from mastermind.players.abstract_player import CodeCracker, CodeSetter
+from mastermind.solver import Solver
 from mastermind.utils import generate_feedback
 
 
@@ -22,10 +25,27 @@ class AICodeSetter(CodeSetter):
 
 class AICodeCracker(CodeCracker):
     def __init__(self, player_logic: "PlayerLogic") -> None:  # type: ignore  # noqa: F821
-        win_message = "Congratulations! You won in {step} steps!"
-        lose_message = "Sorry, you lost. The secret code was {step}."
+        win_message = "The AI cracked the code in {step} steps!"
+        lose_message = "The AI could not crack the code in {step} steps."
         super().__init__(player_logic, win_message, lose_message)
+        self._solver = Solver(
+            self.game_state.number_of_colors,
+            self.game_state.number_of_dots,
+            player_logic.solver_settings,
+        )
+        self.move_times: List[float] = []  # Seconds spent choosing each guess
+        self.move_complete: List[bool] = []  # Whether each guess was fully computed
+
+    def obtain_guess(self) -> Union[tuple, str]:
+        start = time.perf_counter()
+        try:
+            guess = self._solver.next_guess(self.game_state._board)
+        except Solver.InconsistentFeedbackError as e:
+            print(e)
+            print("Undoing the last feedback, please check it and enter it again.")
+            return "u"
 
-    def obtain_guess(self) -> tuple:
-        # TODO: Implement AI solver logic to generate guess.
-        pass
+        self.move_times.append(time.perf_counter() - start)
+        self.move_complete.append(self._solver.last_move_complete)
+        print(f"AI guess: {guess}")
+        return guess
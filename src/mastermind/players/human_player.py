@@ -1,7 +1,11 @@
+import time
+from copy import copy
 from getpass import getpass
+from itertools import islice
 from typing import Optional, Union
 
 from mastermind.players.abstract_player import CodeCracker, CodeSetter
+from mastermind.solver import Solver
 from mastermind.utils import generate_feedback
 from mastermind.validation import ValidCombination
 from mastermind.validation.base.exceptions import (
@@ -69,10 +73,65 @@ class HumanCodeSetter(CodeSetter):
 
 
 class HumanCodeCracker(CodeCracker):
+    HINT_CODES = 5  # Consistent codes listed by a hint
+    HINT_COUNT_LIMIT = 1000  # Codes counted at most when they cannot be enumerated
+    HINT_TIME = 0.1  # Seconds the listing, and then the suggested guess, may take
+
     def __init__(self, player_logic: "PlayerLogic") -> None:  # type: ignore  # noqa: F821
         win_message = "Congratulations! You won in {step} steps!"
         lose_message = "Sorry, you lost. The secret code was {step}."
         super().__init__(player_logic, win_message, lose_message)
+        self._solver_settings = player_logic.solver_settings
+        self._solver: Optional[Solver] = None  # Created by the first hint
+
+    def hint(self) -> None:
+        """
+        Prints the number of codes still consistent with the board, a few of them, and the solver's suggested guess.
+
+        The solver is kept between hints and follows the board incrementally, so a hint only filters by the guesses made since the previous one. Counting and listing the codes share a deadline of HINT_TIME seconds; when it passes, the count shown is a lower bound. The suggestion is bounded to HINT_TIME seconds as well, through the sampling time budget and the move deadline.
+        """
+        if self._solver is None:
+            settings = copy(self._solver_settings)
+            settings.time_budget = min(
+                settings.time_budget or self.HINT_TIME, self.HINT_TIME
+            )
+            settings.move_deadline = min(
+                settings.move_deadline or self.HINT_TIME, self.HINT_TIME
+            )
+            self._solver = Solver(
+                self.game_state.number_of_colors,
+                self.game_state.number_of_dots,
+                settings,
+            )
+
+        board = self.game_state._board
+        deadline = time.monotonic() + self.HINT_TIME
+        count, exact = self._solver.count_candidates(
+            board, self.HINT_COUNT_LIMIT, deadline
+        )
+        if exact and count == 0:
+            print("No code is consistent with the feedback given.")
+            return
+
+        if exact:
+            print(f"{count} possible codes remain, such as:")
+        elif count > self.HINT_COUNT_LIMIT:
+            print(f"More than {self.HINT_COUNT_LIMIT} possible codes remain, such as:")
+        elif count > 0:
+            print(f"At least {count} possible codes remain, such as:")
+        else:
+            print("No possible code was found in time.")
+        if count > 0:
+            codes = self._solver.iter_candidates(board, deadline)
+            for code in islice(codes, self.HINT_CODES):
+                print(f"  {code}")
+
+        try:
+            guess = self._solver.next_guess(board)
+        except Solver.InconsistentFeedbackError:
+            print("No code is consistent with the feedback given.")
+            return
+        print(f"Suggested guess: {guess}")
 
     def obtain_guess(self) -> Union[tuple, str]:
         valid_guess = ValidCombination(
@@ -89,6 +148,7 @@ class HumanCodeCracker(CodeCracker):
                 For example, a 6-digit 4-color code can be 123412, or 1,2,3,4,1,2
                 Or, you can enter a command:
                 (?) for help
+                (h) for a hint
                 (d) to discard the game
                 (q) to save and quit
                 (u) to undo
@@ -97,6 +157,10 @@ class HumanCodeCracker(CodeCracker):
                 print(hint)
                 continue
 
+            if guess == "h":  # hint
+                self.hint()
+                continue
+
             if guess == "d":
                 print("Game discarded.")
                 return "d"
@@ -0,0 +1,4 @@
+from mastermind.simulation.simulator import Simulator
+from mastermind.simulation.tournament import Tournament
+
+__all__ = ["Simulator", "Tournament"]
@@ -0,0 +1,52 @@
+import argparse
+from typing import List, Optional
+
+from mastermind.simulation.simulator import Simulator
+from mastermind.solver import STRATEGIES, SolverSettings
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Runs a headless AI versus AI simulation from the command line and prints its report.
+    """
+    parser = argparse.ArgumentParser(
+        prog="mastermind-simulate",
+        description="Play AI versus AI Mastermind games without any interaction.",
+    )
+    parser.add_argument("colors", type=int, help="number of colors")
+    parser.add_argument("dots", type=int, help="number of dots")
+    parser.add_argument(
+        "-n",
+        "--games",
+        type=int,
+        help="number of games against random secrets (default: every secret once)",
+    )
+    parser.add_argument("--attempts", type=int, default=20, help="maximum attempts")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="minimax")
+    parser.add_argument("--seed", type=int, help="seed of the random secrets")
+    parser.add_argument(
+        "--move-deadline", type=float, help="seconds an exhaustive move may take"
+    )
+    parser.add_argument("-o", "--output", help="CSV file to write every game to")
+    args = parser.parse_args(argv)
+
+    simulator = Simulator(
+        args.colors,
+        args.dots,
+        args.attempts,
+        SolverSettings(
+            strategy=args.strategy, seed=args.seed, move_deadline=args.move_deadline
+        ),
+    )
+    results = simulator.run(number_of_games=args.games, seed=args.seed)
+    if args.output:
+        results.to_csv(args.output, index=False)
+
+    print(Simulator.summary(results).to_string())
+    print()
+    print("Guesses  Games")
+    print(Simulator.guess_distribution(results).to_string(header=False))
+
+
+if __name__ == "__main__":
+    main()
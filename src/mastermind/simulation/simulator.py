@@ -0,0 +1,156 @@
+import io
+from contextlib import redirect_stdout
+from random import Random
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from mastermind.game.game import Game
+from mastermind.players import AICodeSetter
+from mastermind.solver import SolverSettings
+from mastermind.utils import decode_codes, encode_code
+
+
+class Simulator:
+    """
+    Plays AI versus AI games headlessly to measure how the solver performs.
+
+    Each game goes through the regular Game and GameFlow machinery, with an AICodeCracker guessing and an AICodeSetter holding a known secret and giving the feedback. Everything the players print is discarded, so millions of games can run as a batch job.
+
+    Args:
+        number_of_colors (int): The number of colors in the game.
+        number_of_dots (int): The number of dots in each combination.
+        maximum_attempts (int): The maximum number of attempts allowed in each game.
+        solver_settings (Optional[SolverSettings]): The settings of the AI solver, defaults to SolverSettings().
+    """
+
+    def __init__(
+        self,
+        number_of_colors: int,
+        number_of_dots: int,
+        maximum_attempts: int = 20,
+        solver_settings: Optional[SolverSettings] = None,
+    ) -> None:
+        self.NUMBER_OF_COLORS = number_of_colors
+        self.NUMBER_OF_DOTS = number_of_dots
+        self.MAXIMUM_ATTEMPTS = maximum_attempts
+        self.solver_settings = solver_settings or SolverSettings()
+
+    def play(self, secret: Tuple[int, ...]) -> dict:
+        """
+        Plays one game against the given secret.
+
+        Args:
+            secret (Tuple[int, ...]): The secret code to crack.
+
+        Returns:
+            dict: The result of the game, with the keys "secret" (the code index), "guesses", "win", "move_time" (seconds spent choosing guesses), "max_move_time" (seconds for the slowest guess) and "truncated_moves" (guesses cut off by the move deadline or sampled).
+        """
+        game = Game(
+            self.NUMBER_OF_COLORS,
+            self.NUMBER_OF_DOTS,
+            self.MAXIMUM_ATTEMPTS,
+            "AIvAI",
+            self.solver_settings,
+        )
+        player_logic = game._player_logic
+        player_logic.initialize_players()
+        player_logic.PLAYER_SETTER = AICodeSetter(player_logic)
+        player_logic.PLAYER_SETTER.SECRET_CODE = tuple(secret)
+        game._state.game_started = True
+
+        with redirect_stdout(io.StringIO()):
+            game.resume_game()
+
+        move_times = player_logic.PLAYER_CRACKER.move_times
+        move_complete = player_logic.PLAYER_CRACKER.move_complete
+        return {
+            "secret": encode_code(secret, self.NUMBER_OF_COLORS),
+            "guesses": len(game),
+            "win": bool(game._state.win_status),
+            "move_time": sum(move_times),
+            "max_move_time": max(move_times, default=0.0),
+            "truncated_moves": move_complete.count(False),
+        }
+
+    def run(
+        self,
+        number_of_games: Optional[int] = None,
+        secrets: Optional[Iterable[Tuple[int, ...]]] = None,
+        seed: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Plays a batch of games and collects one row per game.
+
+        Args:
+            number_of_games (Optional[int]): The number of games against random secrets. If neither this nor secrets is given, every possible secret is played once.
+            secrets (Optional[Iterable[Tuple[int, ...]]]): The secrets to play against.
+            seed (Optional[int]): The seed of the random secrets.
+
+        Returns:
+            pd.DataFrame: The results of the games, with the columns described in play.
+        """
+        if secrets is None:
+            secrets = self._secrets(number_of_games, seed)
+        return pd.DataFrame(
+            [self.play(secret) for secret in secrets],
+            columns=[
+                "secret",
+                "guesses",
+                "win",
+                "move_time",
+                "max_move_time",
+                "truncated_moves",
+            ],
+        )
+
+    def _secrets(
+        self, number_of_games: Optional[int], seed: Optional[int]
+    ) -> Iterable[Tuple[int, ...]]:
+        """
+        Yields random secrets, or every secret if number_of_games is None.
+        """
+        if number_of_games is None:
+            total = self.NUMBER_OF_COLORS**self.NUMBER_OF_DOTS
+            for code in decode_codes(
+                np.arange(total), self.NUMBER_OF_COLORS, self.NUMBER_OF_DOTS
+            ):
+                yield tuple(int(dot) for dot in code)
+            return
+
+        rng = Random(seed)
+        for _ in range(number_of_games):
+            yield tuple(
+                rng.randint(1, self.NUMBER_OF_COLORS)
+                for _ in range(self.NUMBER_OF_DOTS)
+            )
+
+    @staticmethod
+    def guess_distribution(results: pd.DataFrame) -> pd.Series:
+        """
+        Returns how many games were won in each number of guesses, from 1 to the worst case.
+        """
+        guesses = results.loc[results["win"], "guesses"]
+        counts = guesses.value_counts().sort_index()
+        return counts.reindex(range(1, guesses.max() + 1), fill_value=0)
+
+    @staticmethod
+    def summary(results: pd.DataFrame) -> pd.Series:
+        """
+        Returns aggregate statistics of a batch of games.
+
+        The statistics are the number of games and wins, the average and worst number of guesses of won games, and the average and worst time per guess in seconds.
+        """
+        won = results.loc[results["win"], "guesses"]
+        return pd.Series(
+            {
+                "games": len(results),
+                "wins": int(results["win"].sum()),
+                "average_guesses": won.mean(),
+                "worst_guesses": won.max(),
+                "average_move_time": results["move_time"].sum()
+                / max(results["guesses"].sum(), 1),
+                "max_move_time": results["max_move_time"].max(),
+            }
+        )
@@ -0,0 +1,266 @@
+import glob
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from mastermind.simulation.simulator import Simulator
+from mastermind.solver import Solver, SolverSettings
+from mastermind.solver.opening_book import OpeningBook
+from mastermind.storage.feedback_table import FeedbackTableManager
+from mastermind.storage.persistent_cache import PersistentCacheManager
+from mastermind.utils import decode_codes
+
+_COLUMNS = [
+    "secret",
+    "guesses",
+    "win",
+    "move_time",
+    "max_move_time",
+    "truncated_moves",
+]
+
+
+def _initialize_worker(cache_directory: str, dimensions: List[Tuple[int, int]]) -> None:
+    """
+    Points a worker process at the shared cache and maps the feedback tables of the prepared dimensions once.
+    """
+    PersistentCacheManager._cache_directory = cache_directory
+    for number_of_colors, number_of_dots in dimensions:
+        FeedbackTableManager.get_table(number_of_colors, number_of_dots, build=False)
+
+
+def _play_shard(
+    strategy: str,
+    number_of_colors: int,
+    number_of_dots: int,
+    maximum_attempts: int,
+    secrets: np.ndarray,
+    file_path: str,
+) -> str:
+    """
+    Plays the games of one shard and writes their results as a columnar .npz file.
+
+    The file is written under a temporary name and renamed into place once complete, so an interrupted shard leaves no result behind and is simply played again on resume.
+    """
+    simulator = Simulator(
+        number_of_colors,
+        number_of_dots,
+        maximum_attempts,
+        SolverSettings(strategy=strategy),
+    )
+    codes = decode_codes(secrets, number_of_colors, number_of_dots)
+    results = simulator.run(secrets=[tuple(int(dot) for dot in code) for code in codes])
+
+    temp_path = f"{file_path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        np.savez(file, **{column: results[column].to_numpy() for column in _COLUMNS})
+    os.replace(temp_path, file_path)
+    return file_path
+
+
+class Tournament:
+    """
+    Compares solver strategies over a grid of game dimensions with a pool of worker processes.
+
+    The secrets of each dimension are split into shards, and each (strategy, dimension, shard) is played by a worker, which writes the results of its games to its own .npz file in the output directory. Shards that already have a file are skipped, so an interrupted tournament resumes where it stopped when run again with the same parameters.
+
+    Feedback tables and opening books are built once in the parent process before the pool starts, and each worker maps the tables once when it starts. Dimensions whose moves are sampled get neither, since their solver never reads them.
+
+    Args:
+        output_directory (str): The directory holding the shard files and the summary.
+        strategies (Sequence[str]): The names of the strategies to compare.
+        dimensions (Sequence[Tuple[int, int]]): The (number_of_colors, number_of_dots) settings to play.
+        number_of_games (Optional[int]): The number of random secrets per dimension, shared by every strategy. If None, every possible secret is played.
+        maximum_attempts (int): The maximum number of attempts allowed in each game.
+        shard_size (int): The number of games per shard.
+        seed (int): The seed of the random secrets.
+        max_workers (Optional[int]): The number of worker processes, None uses every core.
+
+    Raises:
+        ValueError: If the output directory holds a tournament with different parameters.
+    """
+
+    def __init__(
+        self,
+        output_directory: str,
+        strategies: Sequence[str],
+        dimensions: Sequence[Tuple[int, int]],
+        number_of_games: Optional[int] = None,
+        maximum_attempts: int = 20,
+        shard_size: int = 256,
+        seed: int = 0,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        for strategy in strategies:
+            SolverSettings(strategy=strategy)  # fail early on unknown strategies
+
+        self.output_directory = output_directory
+        self.parameters = {
+            "strategies": list(strategies),
+            "dimensions": [list(dimension) for dimension in dimensions],
+            "number_of_games": number_of_games,
+            "maximum_attempts": maximum_attempts,
+            "shard_size": shard_size,
+            "seed": seed,
+        }
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._check_manifest()
+
+    def _check_manifest(self) -> None:
+        """
+        Records the parameters in the output directory, or checks that they match the recorded ones.
+        """
+        os.makedirs(self.output_directory, exist_ok=True)
+        manifest = os.path.join(self.output_directory, "tournament.json")
+        if os.path.exists(manifest):
+            with open(manifest, "r") as file:
+                if json.load(file) != self.parameters:
+                    raise ValueError(
+                        f"{self.output_directory} holds a tournament with different parameters"
+                    )
+            return
+
+        with open(manifest, "w") as file:
+            json.dump(self.parameters, file)
+
+    def _secrets(self, number_of_colors: int, number_of_dots: int) -> np.ndarray:
+        """
+        Returns the secret indices played in a dimension.
+        """
+        total = number_of_colors**number_of_dots
+        number_of_games = self.parameters["number_of_games"]
+        if number_of_games is None:
+            return np.arange(total, dtype=np.int64)
+
+        rng = np.random.default_rng(
+            [self.parameters["seed"], number_of_colors, number_of_dots]
+        )
+        return rng.integers(0, total, number_of_games, dtype=np.int64)
+
+    def shards(self) -> List[tuple]:
+        """
+        Returns the shards of the tournament.
+
+        Returns:
+            List[tuple]: One (strategy, number_of_colors, number_of_dots, secrets, file_path) tuple per shard.
+        """
+        shards = []
+        shard_size = self.parameters["shard_size"]
+        for number_of_colors, number_of_dots in self.parameters["dimensions"]:
+            secrets = self._secrets(number_of_colors, number_of_dots)
+            for strategy in self.parameters["strategies"]:
+                for start in range(0, len(secrets), shard_size):
+                    file_name = f"{strategy}_{number_of_colors}x{number_of_dots}_{start // shard_size:06d}.npz"
+                    shards.append(
+                        (
+                            strategy,
+                            number_of_colors,
+                            number_of_dots,
+                            secrets[start : start + shard_size],
+                            os.path.join(self.output_directory, file_name),
+                        )
+                    )
+        return shards
+
+    def _prepared_dimensions(self) -> List[Tuple[int, int]]:
+        """
+        Returns the dimensions whose feedback tables and opening books are worth preparing, i.e. those whose moves are not sampled.
+        """
+        return [
+            (number_of_colors, number_of_dots)
+            for number_of_colors, number_of_dots in self.parameters["dimensions"]
+            if not Solver.samples_opening(number_of_colors, number_of_dots)
+        ]
+
+    def _prepare(self) -> None:
+        """
+        Builds the feedback tables and opening books the workers share.
+        """
+        for number_of_colors, number_of_dots in self._prepared_dimensions():
+            FeedbackTableManager.get_table(number_of_colors, number_of_dots)
+            for strategy in self.parameters["strategies"]:
+                book = OpeningBook.get(number_of_colors, number_of_dots, strategy)
+                if len(book) == 0:
+                    book.build(SolverSettings(strategy=strategy))
+
+    def run(self) -> pd.DataFrame:
+        """
+        Plays every shard that has no result yet, then merges the shards.
+
+        Returns:
+            pd.DataFrame: The summary of the tournament, also written to summary.csv in the output directory.
+        """
+        for temp_file in glob.glob(os.path.join(self.output_directory, "*.tmp")):
+            os.remove(temp_file)  # left behind by an interrupted run
+
+        pending = [shard for shard in self.shards() if not os.path.exists(shard[-1])]
+        if pending:
+            self._prepare()
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_initialize_worker,
+                initargs=(
+                    PersistentCacheManager._cache_directory,
+                    self._prepared_dimensions(),
+                ),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _play_shard,
+                        strategy,
+                        number_of_colors,
+                        number_of_dots,
+                        self.parameters["maximum_attempts"],
+                        secrets,
+                        file_path,
+                    )
+                    for strategy, number_of_colors, number_of_dots, secrets, file_path in pending
+                ]
+                for future in as_completed(futures):
+                    future.result()  # surface worker errors
+
+        summary = self.summary(self.merge(self.output_directory))
+        summary.to_csv(os.path.join(self.output_directory, "summary.csv"))
+        return summary
+
+    @staticmethod
+    def merge(output_directory: str) -> pd.DataFrame:
+        """
+        Reads every shard file of a tournament into one table of games.
+
+        Args:
+            output_directory (str): The directory holding the shard files.
+
+        Returns:
+            pd.DataFrame: One row per game, with the strategy, colors and dots columns followed by the columns of Simulator.play.
+        """
+        frames = []
+        for file_path in sorted(glob.glob(os.path.join(output_directory, "*.npz"))):
+            strategy, dimension, _ = os.path.basename(file_path).rsplit("_", 2)
+            number_of_colors, number_of_dots = map(int, dimension.split("x"))
+            with np.load(file_path) as shard:
+                frame = pd.DataFrame(
+                    {column: shard[column] for column in _COLUMNS if column in shard}
+                )  # shards written by earlier versions lack some columns
+            frame.insert(0, "dots", number_of_dots)
+            frame.insert(0, "colors", number_of_colors)
+            frame.insert(0, "strategy", strategy)
+            frames.append(frame)
+
+        if not frames:
+            return pd.DataFrame(columns=["strategy", "colors", "dots", *_COLUMNS])
+        return pd.concat(frames, ignore_index=True)
+
+    @staticmethod
+    def summary(results: pd.DataFrame) -> pd.DataFrame:
+        """
+        Returns the Simulator.summary statistics of each strategy and dimension.
+        """
+        groups = results.groupby(["strategy", "colors", "dots"])
+        return pd.DataFrame(
+            {key: Simulator.summary(group) for key, group in groups}
+        ).T.rename_axis(["strategy", "colors", "dots"])
@@ -0,0 +1,18 @@
+from mastermind.solver.candidate_set import CandidateSet
+from mastermind.solver.consistent_codes import iter_consistent_codes
+from mastermind.solver.decision_tree import DecisionTree
+from mastermind.solver.optimal import OptimalSolver
+from mastermind.solver.settings import SolverSettings
+from mastermind.solver.solver import Solver
+from mastermind.solver.strategies import STRATEGIES, register_strategy
+
+__all__ = [
+    "CandidateSet",
+    "DecisionTree",
+    "OptimalSolver",
+    "Solver",
+    "SolverSettings",
+    "STRATEGIES",
+    "iter_consistent_codes",
+    "register_strategy",
+]
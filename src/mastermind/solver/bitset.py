@@ -0,0 +1,86 @@
+from typing import Iterator
+
+import numpy as np
+
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+
+class CodeBitset:
+    """
+    A set of code indices stored as one bit per code of the dimension.
+
+    Bit i of the packed array (in np.packbits order) is set when code index i is in the set, so a set over the 8**6 codes takes 32 KiB whatever its size. Intersection is a bitwise AND, and the size is a popcount through a byte lookup table.
+
+    Args:
+        size (int): The number of codes of the dimension.
+        bits (np.ndarray): The packed uint8 array of ceil(size / 8) bytes, with the padding bits cleared.
+    """
+
+    def __init__(self, size: int, bits: np.ndarray) -> None:
+        self.size = size
+        self.bits = bits
+
+    @classmethod
+    def full(cls, size: int) -> "CodeBitset":
+        """
+        Returns the set of every code index below size.
+        """
+        return cls(size, np.packbits(np.ones(size, dtype=bool)))
+
+    @classmethod
+    def from_mask(cls, mask: np.ndarray) -> "CodeBitset":
+        """
+        Returns the set of the positions where a boolean array is True.
+        """
+        return cls(len(mask), np.packbits(mask))
+
+    @classmethod
+    def from_indices(cls, size: int, indices: np.ndarray) -> "CodeBitset":
+        """
+        Returns the set of the given code indices.
+        """
+        mask = np.zeros(size, dtype=bool)
+        mask[indices] = True
+        return cls.from_mask(mask)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of codes in the set.
+        """
+        return int(_POPCOUNT[self.bits].sum())
+
+    def __contains__(self, index: int) -> bool:
+        """
+        Checks if the given code index is in the set.
+        """
+        if not 0 <= index < self.size:
+            return False
+        return bool(self.bits[index >> 3] & (0x80 >> (index & 7)))
+
+    def __and__(self, other: "CodeBitset") -> "CodeBitset":
+        """
+        Returns the intersection of two sets over the same codes.
+        """
+        return CodeBitset(self.size, self.bits & other.bits)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Checks if two sets hold the same codes.
+        """
+        if not isinstance(other, CodeBitset):
+            return NotImplemented
+        return self.size == other.size and np.array_equal(self.bits, other.bits)
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Yields the code indices of the set in increasing order.
+        """
+        yield from self.indices().tolist()
+
+    def indices(self) -> np.ndarray:
+        """
+        Returns the sorted int64 array of the code indices in the set.
+        """
+        return np.flatnonzero(np.unpackbits(self.bits, count=self.size)).astype(
+            np.int64
+        )
@@ -0,0 +1,242 @@
+from collections import OrderedDict
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+from mastermind.solver.bitset import CodeBitset
+from mastermind.storage.feedback_table import FeedbackTableManager
+from mastermind.utils.code_codec import decode_code, decode_codes, encode_code
+from mastermind.utils.get_feedback import encode_feedback, generate_feedback_matrix
+
+_CHUNK_SIZE = 1 << 20  # Number of code indices decoded at a time
+_MAX_BITSET_CODES = 8**6  # Largest code space whose candidates are kept as a bitset
+_MAX_MASKS = 256  # Feedback masks memoized (8 MiB at 8**6 codes)
+
+_masks: "OrderedDict[tuple, CodeBitset]" = OrderedDict()  # Recently used feedback masks
+
+
+def _feedback_mask(
+    number_of_colors: int,
+    number_of_dots: int,
+    guess: Tuple[int, ...],
+    code: int,
+    build: bool = True,
+) -> Optional[CodeBitset]:
+    """
+    Returns the bitset of the codes giving the encoded feedback to the guess.
+
+    Games keep replaying the same opening guesses, so the most recently used masks are memoized: filtering by a known (guess, feedback) pair is then a single bitwise AND.
+
+    Returns:
+        Optional[CodeBitset]: The mask, or None if it is not memoized and build is False.
+    """
+    key = (number_of_colors, number_of_dots, guess, code)
+    if key in _masks:
+        _masks.move_to_end(key)
+        return _masks[key]
+    if not build:
+        return None
+
+    everything = CandidateSet(number_of_colors, number_of_dots)
+    feedback = np.concatenate(
+        [
+            everything.feedback_against(guess, chunk)
+            for chunk in everything._iter_chunks()
+        ]
+    )
+    _masks[key] = CodeBitset.from_mask(feedback == code)
+    if len(_masks) > _MAX_MASKS:
+        _masks.popitem(last=False)
+    return _masks[key]
+
+
+class CandidateSet:
+    """
+    The set of codes that are still consistent with every guess and feedback seen so far.
+
+    The set is stored as a sorted array of code indices. Before the first feedback it is not materialized at all, so large code spaces are never enumerated up front; each call to filter then narrows the set incrementally instead of rebuilding it from the whole history.
+
+    Code spaces of up to 8**6 codes are filtered as a CodeBitset instead: the codes giving each (guess, feedback) pair are a memoized mask, filtering is a bitwise AND with it, and the sorted indices are only unpacked when they are read.
+
+    Args:
+        number_of_colors (int): The number of colors in the game.
+        number_of_dots (int): The number of dots in each combination.
+    """
+
+    def __init__(self, number_of_colors: int, number_of_dots: int) -> None:
+        self.NUMBER_OF_COLORS = number_of_colors
+        self.NUMBER_OF_DOTS = number_of_dots
+        self.TOTAL = number_of_colors**number_of_dots
+        self._indices: Optional[np.ndarray] = None  # None means every code
+        self._bits: Optional[CodeBitset] = None  # the set when filtered as a bitset
+
+    @classmethod
+    def from_indices(
+        cls, number_of_colors: int, number_of_dots: int, indices: np.ndarray
+    ) -> "CandidateSet":
+        """
+        Creates a candidate set holding the given sorted code indices.
+        """
+        candidates = cls(number_of_colors, number_of_dots)
+        candidates._indices = np.asarray(indices, dtype=np.int64)
+        return candidates
+
+    def __len__(self) -> int:
+        """
+        Returns the number of consistent codes.
+        """
+        if self._indices is None and self._bits is not None:
+            return len(self._bits)
+        return self.TOTAL if self._indices is None else len(self._indices)
+
+    def __contains__(self, code: Tuple[int, ...]) -> bool:
+        """
+        Checks if the given code is still consistent.
+        """
+        if self._bits is not None:
+            return self.encode(code) in self._bits
+        if self._indices is None:
+            return True
+        index = self.encode(code)
+        position = np.searchsorted(self._indices, index)
+        return position < len(self._indices) and self._indices[position] == index
+
+    @property
+    def is_full(self) -> bool:
+        """
+        Returns whether no feedback has been applied yet.
+        """
+        return self._indices is None and self._bits is None
+
+    @property
+    def indices(self) -> np.ndarray:
+        """
+        Returns the sorted array of consistent code indices, materializing it if needed.
+        """
+        if self._unpack() is None:
+            return np.arange(self.TOTAL, dtype=np.int64)
+        return self._indices
+
+    def _unpack(self) -> Optional[np.ndarray]:
+        """
+        Returns the sorted consistent indices, unpacking the bitset if needed, or None if the set is full.
+        """
+        if self._indices is None and self._bits is not None:
+            self._indices = self._bits.indices()
+        return self._indices
+
+    def encode(self, code: Tuple[int, ...]) -> int:
+        """
+        Returns the index of the given code.
+        """
+        return encode_code(code, self.NUMBER_OF_COLORS)
+
+    def decode(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Returns the codes of the given indices as an array of shape (n, number_of_dots).
+        """
+        return decode_codes(indices, self.NUMBER_OF_COLORS, self.NUMBER_OF_DOTS)
+
+    def code_at(self, position: int) -> Tuple[int, ...]:
+        """
+        Returns the consistent code at the given position of the sorted set.
+        """
+        indices = self._unpack()
+        index = position if indices is None else indices[position]
+        return decode_code(index, self.NUMBER_OF_COLORS, self.NUMBER_OF_DOTS)
+
+    def reset(self) -> None:
+        """
+        Restores the set to every possible code.
+        """
+        self._indices = None
+        self._bits = None
+
+    def snapshot(self) -> tuple:
+        """
+        Returns the current state of the set, to be restored later in constant time.
+
+        Filtering always replaces the stored arrays instead of modifying them, so the snapshot only holds references.
+        """
+        return self._indices, self._bits
+
+    def restore(self, snapshot: tuple) -> None:
+        """
+        Restores a state returned by snapshot.
+        """
+        self._indices, self._bits = snapshot
+
+    def filter(self, guess: Tuple[int, ...], feedback: Tuple[int, int]) -> None:
+        """
+        Removes the codes that would not have produced the given feedback for the given guess.
+
+        Args:
+            guess (Tuple[int, ...]): The guess that was made.
+            feedback (Tuple[int, int]): The feedback received for the guess.
+        """
+        code = encode_feedback(*feedback, self.NUMBER_OF_DOTS)
+        if self.TOTAL <= _MAX_BITSET_CODES:
+            self._filter_bits(tuple(guess), code)
+            return
+
+        kept = [
+            chunk[self.feedback_against(guess, chunk) == code]
+            for chunk in self._iter_chunks()
+        ]
+        self._indices = np.concatenate(kept) if kept else np.empty(0, np.int64)
+
+    def _filter_bits(self, guess: Tuple[int, ...], code: int) -> None:
+        """
+        Filters the bitset by the mask of the (guess, feedback) pair.
+
+        A mask costs a feedback computation over the whole code space, so it is only built when the set is still full or the feedback table is mapped. Otherwise, unless the mask is already memoized, only the remaining candidates are compared against the guess.
+        """
+        table = FeedbackTableManager.get_table(
+            self.NUMBER_OF_COLORS, self.NUMBER_OF_DOTS, build=False
+        )
+        mask = _feedback_mask(
+            self.NUMBER_OF_COLORS,
+            self.NUMBER_OF_DOTS,
+            guess,
+            code,
+            build=self.is_full or table is not None,
+        )
+        if mask is not None:
+            if self._bits is None and self._indices is not None:
+                self._bits = CodeBitset.from_indices(self.TOTAL, self._indices)
+            self._bits = mask if self._bits is None else self._bits & mask
+        else:
+            indices = self.indices
+            kept = indices[self.feedback_against(guess, indices) == code]
+            self._bits = CodeBitset.from_indices(self.TOTAL, kept)
+        self._indices = None
+
+    def feedback_against(
+        self, guess: Tuple[int, ...], indices: np.ndarray
+    ) -> np.ndarray:
+        """
+        Returns the encoded feedback of the given guess against each of the given code indices.
+
+        The feedback is read from the memory-mapped feedback table when it has been built for this dimension, and computed otherwise.
+        """
+        table = FeedbackTableManager.get_table(
+            self.NUMBER_OF_COLORS, self.NUMBER_OF_DOTS, build=False
+        )
+        if table is not None:
+            return table[self.encode(guess)][indices]
+
+        return generate_feedback_matrix(
+            np.array([guess]), self.decode(indices), self.NUMBER_OF_COLORS
+        )[0]
+
+    def _iter_chunks(self) -> Iterator[np.ndarray]:
+        """
+        Yields the consistent code indices in bounded-size chunks.
+        """
+        if self._unpack() is not None:
+            for start in range(0, len(self._indices), _CHUNK_SIZE):
+                yield self._indices[start : start + _CHUNK_SIZE]
+            return
+
+        for start in range(0, self.TOTAL, _CHUNK_SIZE):
+            yield np.arange(start, min(start + _CHUNK_SIZE, self.TOTAL), dtype=np.int64)
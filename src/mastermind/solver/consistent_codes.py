@@ -0,0 +1,130 @@
+"""
+This module defines a lazy enumeration of the codes consistent with a board history.
+
+Codes are built one position at a time and a branch is abandoned as soon as some past feedback can no longer be matched, so only a tiny fraction of the code space is visited and nothing is materialized. This makes it usable for dimensions whose code space does not fit in memory.
+"""
+
+import time
+from typing import Generator, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+_DEADLINE_CHECK_INTERVAL = 1024  # Search nodes visited between two deadline checks
+
+
+def iter_consistent_codes(
+    history: List[Tuple[tuple, tuple]],
+    number_of_colors: int,
+    number_of_dots: int,
+    rng: Optional[np.random.Generator] = None,
+    deadline: Optional[float] = None,
+) -> Generator[Tuple[int, ...], None, bool]:
+    """
+    Yields the codes consistent with every (guess, feedback) entry of the history.
+
+    The search backtracks position by position and prunes with:
+
+    - positional exclusions: a guess with no black peg rules out each of its colors at its position, and a guess with no peg at all rules out its colors everywhere;
+    - per-color count bounds: a color appearing more often in a guess than that guess's total number of pegs appears at most that often in the code;
+    - peg bounds: for every guess, the black pegs and total pegs of the partial code may neither exceed the feedback nor fall short of it once the remaining positions are filled as favorably as possible.
+
+    Take the first N codes with itertools.islice to stop early. Once exhausted, the generator returns (as StopIteration.value) whether the deadline cut the search short, which tells an incomplete search from one that found every code.
+
+    Args:
+        history (List[Tuple[tuple, tuple]]): The (guess, feedback) entries on the board.
+        number_of_colors (int): The number of colors in the game.
+        number_of_dots (int): The number of dots in each combination.
+        rng (Optional[np.random.Generator]): If given, the colors of each position are tried in random order instead of ascending order, so that restarting the search yields varied codes.
+        deadline (Optional[float]): The time.monotonic() value after which the search stops.
+
+    Yields:
+        Tuple[int, ...]: The consistent codes, in lexicographic order unless rng is given.
+
+    Returns:
+        bool: Whether the deadline passed before the search was complete.
+    """
+    guesses = [tuple(guess) for guess, _ in history]
+    blacks = [feedback[0] for _, feedback in history]
+    totals = [feedback[0] + feedback[1] for _, feedback in history]
+    entries = range(len(history))
+
+    # Colors counted per guess, indexed by color
+    guess_counts = [
+        [guess.count(color) for color in range(number_of_colors + 1)]
+        for guess in guesses
+    ]
+
+    allowed = [set(range(1, number_of_colors + 1)) for _ in range(number_of_dots)]
+    max_counts = [number_of_dots] * (number_of_colors + 1)
+    for guess, black, total, counts in zip(guesses, blacks, totals, guess_counts):
+        for position, color in enumerate(guess):
+            if black == 0:
+                allowed[position].discard(color)
+            if total == 0:
+                for colors in allowed:
+                    colors.discard(color)
+        for color in set(guess):
+            if counts[color] > total:
+                max_counts[color] = min(max_counts[color], total)
+    options = [sorted(colors) for colors in allowed]
+
+    # Most black pegs each guess can still gain from a position onwards
+    reachable = [[0] * (number_of_dots + 1) for _ in entries]
+    for entry in entries:
+        for position in range(number_of_dots - 1, -1, -1):
+            reachable[entry][position] = reachable[entry][position + 1] + (
+                guesses[entry][position] in allowed[position]
+            )
+
+    code = [0] * number_of_dots
+    counts = [0] * (number_of_colors + 1)
+    black = [0] * len(history)
+    total = [0] * len(history)
+    nodes = 0
+    expired = False
+
+    def extend(position: int) -> Iterator[Tuple[int, ...]]:
+        nonlocal nodes, expired
+        if position == number_of_dots:
+            yield tuple(code)
+            return
+
+        colors = options[position]
+        if rng is not None:
+            colors = rng.permutation(colors).tolist()
+        remaining = number_of_dots - position - 1
+
+        for color in colors:
+            if counts[color] >= max_counts[color]:
+                continue
+
+            nodes += 1
+            if deadline is not None and nodes % _DEADLINE_CHECK_INTERVAL == 0:
+                expired = time.monotonic() >= deadline
+            if expired:
+                return
+
+            for entry in entries:
+                total[entry] += counts[color] < guess_counts[entry][color]
+                black[entry] += guesses[entry][position] == color
+            counts[color] += 1
+            code[position] = color
+
+            if all(
+                blacks[entry] - reachable[entry][position + 1]
+                <= black[entry]
+                <= blacks[entry]
+                and totals[entry] - remaining <= total[entry] <= totals[entry]
+                for entry in entries
+            ):
+                yield from extend(position + 1)
+
+            counts[color] -= 1
+            for entry in entries:
+                total[entry] -= counts[color] < guess_counts[entry][color]
+                black[entry] -= guesses[entry][position] == color
+            if expired:
+                return
+
+    yield from extend(0)
+    return expired
@@ -0,0 +1,263 @@
+from copy import copy
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from mastermind.solver.candidate_set import CandidateSet
+from mastermind.solver.settings import SolverSettings
+from mastermind.utils.code_codec import decode_code, encode_code
+from mastermind.utils.get_feedback import (
+    decode_feedback,
+    encode_feedback,
+    feedback_dtype,
+)
+
+
+class DecisionTree:
+    """
+    The complete strategy of the solver for a game dimension: the guess it makes after every possible sequence of feedback.
+
+    Node 0 is the first guess. Each node stores the guess made there, the number of secrets reaching it, and one edge per feedback other than the winning one, leading to the node of the next guess. Positions leaving the same set of candidates share a single node, so the tree is stored as a directed acyclic graph in compressed sparse row form: the edges of node i are offsets[i] to offsets[i + 1] of feedbacks and children.
+
+    Args:
+        number_of_colors (int): The number of colors in the game.
+        number_of_dots (int): The number of dots in each combination.
+        guesses (np.ndarray): The index of the guess made at each node.
+        sizes (np.ndarray): The number of secrets reaching each node.
+        offsets (np.ndarray): The first edge of each node, followed by the number of edges.
+        feedbacks (np.ndarray): The encoded feedback of each edge.
+        children (np.ndarray): The node each edge leads to.
+    """
+
+    _trees: Dict[str, "DecisionTree"] = {}  # Trees loaded by this process, by path
+
+    def __init__(
+        self,
+        number_of_colors: int,
+        number_of_dots: int,
+        guesses: np.ndarray,
+        sizes: np.ndarray,
+        offsets: np.ndarray,
+        feedbacks: np.ndarray,
+        children: np.ndarray,
+    ) -> None:
+        self.NUMBER_OF_COLORS = number_of_colors
+        self.NUMBER_OF_DOTS = number_of_dots
+        self.guesses = guesses
+        self.sizes = sizes
+        self.offsets = offsets
+        self.feedbacks = feedbacks
+        self.children = children
+
+    @classmethod
+    def build(
+        cls,
+        number_of_colors: int,
+        number_of_dots: int,
+        settings: Optional[SolverSettings] = None,
+    ) -> "DecisionTree":
+        """
+        Builds the decision tree of the solver by recursively partitioning the candidates by feedback.
+
+        The guess of each node is chosen exactly as Solver.next_guess would choose it, so the tree certifies the behavior of the AI. Subtrees are memoized by candidate set: the guess only depends on the candidates, so positions reached through different feedback paths that leave the same candidates share one node.
+
+        Args:
+            number_of_colors (int): The number of colors in the game.
+            number_of_dots (int): The number of dots in each combination.
+            settings (Optional[SolverSettings]): The solver settings, defaults to SolverSettings(). Sampling, the opening book and the move deadline are turned off, since the tree must be deterministic and only depend on the solver.
+
+        Returns:
+            DecisionTree: The decision tree.
+        """
+        # Imported here because the solver plays from decision trees itself
+        from mastermind.solver.solver import Solver
+
+        settings = copy(settings or SolverSettings())
+        settings.mode = "exhaustive"
+        settings.decision_tree = None  # build from the solver, not an older tree
+        settings.use_opening_book = False  # neither read nor write the stored book
+        settings.move_deadline = None
+        solver = Solver(number_of_colors, number_of_dots, settings)
+        return cls.from_strategy(number_of_colors, number_of_dots, solver.choose_guess)
+
+    @classmethod
+    def from_strategy(
+        cls,
+        number_of_colors: int,
+        number_of_dots: int,
+        choose_guess: Callable[[CandidateSet, List[Tuple[tuple, tuple]]], tuple],
+        by_depth: bool = False,
+    ) -> "DecisionTree":
+        """
+        Builds the decision tree of a deterministic strategy by recursively partitioning the candidates by feedback.
+
+        Subtrees are memoized by candidate set, so the strategy must choose its guess from the candidates alone: positions reached through different feedback paths that leave the same candidates share one node. Strategies that also depend on the number of guesses made set by_depth, so that only positions at the same depth are shared.
+
+        Args:
+            number_of_colors (int): The number of colors in the game.
+            number_of_dots (int): The number of dots in each combination.
+            choose_guess (Callable[[CandidateSet, List[Tuple[tuple, tuple]]], tuple]): Returns the guess to make given the candidates and the (guess, feedback) history that left them.
+            by_depth (bool): Whether the guess also depends on the length of the history.
+
+        Returns:
+            DecisionTree: The decision tree.
+        """
+        win = encode_feedback(number_of_dots, 0, number_of_dots)
+
+        guesses: List[int] = []
+        sizes: List[int] = []
+        edges: List[List[Tuple[int, int]]] = []
+        nodes: Dict[bytes, int] = {}  # node of each candidate set already expanded
+
+        def expand(candidates: CandidateSet, history: List[Tuple[tuple, tuple]]) -> int:
+            key = candidates.indices.tobytes()
+            if by_depth:
+                key += len(history).to_bytes(2, "little")
+            if key in nodes:
+                return nodes[key]
+
+            guess = choose_guess(candidates, history)
+            node = nodes[key] = len(guesses)
+            guesses.append(encode_code(guess, number_of_colors))
+            sizes.append(len(candidates))
+            edges.append([])
+
+            indices = candidates.indices
+            feedback = candidates.feedback_against(guess, indices)
+            for code in np.unique(feedback).tolist():
+                if code == win:
+                    continue
+                child = CandidateSet.from_indices(
+                    number_of_colors, number_of_dots, indices[feedback == code]
+                )
+                entry = (guess, decode_feedback(code, number_of_dots))
+                edges[node].append((code, expand(child, history + [entry])))
+            return node
+
+        expand(CandidateSet(number_of_colors, number_of_dots), [])
+
+        offsets = np.cumsum([0] + [len(node_edges) for node_edges in edges])
+        flat = [edge for node_edges in edges for edge in node_edges]
+        return cls(
+            number_of_colors,
+            number_of_dots,
+            np.array(guesses, dtype=np.int64),
+            np.array(sizes, dtype=np.int64),
+            offsets.astype(np.int64),
+            np.array([code for code, _ in flat], dtype=feedback_dtype(number_of_dots)),
+            np.array([child for _, child in flat], dtype=np.int64),
+        )
+
+    def __len__(self) -> int:
+        """
+        Returns the number of nodes of the tree.
+        """
+        return len(self.guesses)
+
+    def _child(self, node: int, code: int) -> Optional[int]:
+        """
+        Returns the node reached from the given node by the encoded feedback, if any.
+        """
+        start, stop = self.offsets[node], self.offsets[node + 1]
+        position = np.flatnonzero(self.feedbacks[start:stop] == code)
+        return int(self.children[start + position[0]]) if len(position) else None
+
+    def lookup(self, history: List[Tuple[tuple, tuple]]) -> Optional[Tuple[int, ...]]:
+        """
+        Returns the guess the tree makes after the given board history, without any computation.
+
+        Args:
+            history (List[Tuple[tuple, tuple]]): The (guess, feedback) entries on the board, oldest first.
+
+        Returns:
+            Optional[Tuple[int, ...]]: The next guess, or None if the history leaves the tree (a guess differs from the tree's, or the feedback is impossible or winning).
+        """
+        node = 0
+        for guess, feedback in history:
+            if self.guesses[node] != encode_code(guess, self.NUMBER_OF_COLORS):
+                return None
+            node = self._child(node, encode_feedback(*feedback, self.NUMBER_OF_DOTS))
+            if node is None:
+                return None
+        return decode_code(
+            int(self.guesses[node]), self.NUMBER_OF_COLORS, self.NUMBER_OF_DOTS
+        )
+
+    def guess_distribution(self) -> pd.Series:
+        """
+        Returns how many secrets the tree cracks in each number of guesses, from 1 to the worst case.
+        """
+        distributions: Dict[int, np.ndarray] = {}
+
+        def distribution(node: int) -> np.ndarray:
+            # counts[k] is the number of secrets cracked k + 1 guesses after reaching the node
+            if node in distributions:
+                return distributions[node]
+            children = self.children[self.offsets[node] : self.offsets[node + 1]]
+            below = [distribution(int(child)) for child in children]
+            counts = np.zeros(1 + max((len(b) for b in below), default=0), np.int64)
+            counts[0] = self.sizes[node] - sum(int(self.sizes[c]) for c in children)
+            for child_counts in below:
+                counts[1 : len(child_counts) + 1] += child_counts
+            distributions[node] = counts
+            return counts
+
+        counts = distribution(0)
+        return pd.Series(counts, index=range(1, len(counts) + 1))
+
+    @property
+    def max_depth(self) -> int:
+        """
+        Returns the worst-case number of guesses.
+        """
+        return len(self.guess_distribution())
+
+    @property
+    def average_guesses(self) -> float:
+        """
+        Returns the average number of guesses over every secret.
+        """
+        distribution = self.guess_distribution()
+        return float((distribution.index * distribution).sum() / distribution.sum())
+
+    def save(self, file_path: str) -> None:
+        """
+        Writes the tree to a compressed .npz file.
+        """
+        with open(file_path, "wb") as file:
+            np.savez_compressed(
+                file,
+                dimension=np.array([self.NUMBER_OF_COLORS, self.NUMBER_OF_DOTS]),
+                guesses=self.guesses,
+                sizes=self.sizes,
+                offsets=self.offsets,
+                feedbacks=self.feedbacks,
+                children=self.children,
+            )
+
+    @classmethod
+    def get(cls, file_path: str) -> "DecisionTree":
+        """
+        Returns the tree stored in the given file, loading it on first use.
+        """
+        if file_path not in cls._trees:
+            cls._trees[file_path] = cls.load(file_path)
+        return cls._trees[file_path]
+
+    @classmethod
+    def load(cls, file_path: str) -> "DecisionTree":
+        """
+        Reads a tree written by save.
+        """
+        with np.load(file_path) as data:
+            number_of_colors, number_of_dots = data["dimension"].tolist()
+            return cls(
+                number_of_colors,
+                number_of_dots,
+                data["guesses"],
+                data["sizes"],
+                data["offsets"],
+                data["feedbacks"],
+                data["children"],
+            )
@@ -0,0 +1,167 @@
+import atexit
+from copy import copy
+from typing import Dict, List, Optional, Tuple
+
+from mastermind.storage.persistent_cache import PersistentCacheManager
+from mastermind.utils.get_feedback import decode_feedback
+
+
+class OpeningBook:
+    """
+    Caches the first two moves of the solver for a (number_of_colors, number_of_dots, strategy) combination.
+
+    The first guess, and the second guess for each feedback to the first one, are the most expensive moves because the candidate set is still the whole code space. They are also fully deterministic, so they are computed once, stored through PersistentCacheManager and looked up afterwards.
+
+    The book maps the tuple of feedbacks received so far to the next guess: () maps to the first guess, and (feedback,) maps to the second guess after that feedback.
+
+    Recorded moves are kept in memory and persisted in batches: build saves the book once complete, and the moves recorded during play are saved by save_all, which runs when the program exits.
+
+    Args:
+        number_of_colors (int): The number of colors in the game.
+        number_of_dots (int): The number of dots in each combination.
+        strategy (str): The name of the scoring strategy the moves were computed with.
+    """
+
+    _books: Dict[str, "OpeningBook"] = {}  # Books loaded by this process, by key
+    _exit_hook_registered = False  # Whether save_all runs when the program exits
+
+    def __init__(
+        self, number_of_colors: int, number_of_dots: int, strategy: str
+    ) -> None:
+        self.NUMBER_OF_COLORS = number_of_colors
+        self.NUMBER_OF_DOTS = number_of_dots
+        self.STRATEGY = strategy
+        self.key = self._key(number_of_colors, number_of_dots, strategy)
+        self._moves: Dict[tuple, Tuple[int, ...]] = (
+            PersistentCacheManager.__getattr__(self.key) or {}
+        )
+        self._unsaved = False  # Whether moves were recorded since the last save
+
+    @staticmethod
+    def _key(number_of_colors: int, number_of_dots: int, strategy: str) -> str:
+        """
+        Returns the PersistentCacheManager key of the given combination.
+        """
+        return f"opening_book_{number_of_colors}x{number_of_dots}_{strategy}"
+
+    @classmethod
+    def get(
+        cls, number_of_colors: int, number_of_dots: int, strategy: str
+    ) -> "OpeningBook":
+        """
+        Returns the opening book of the given combination, loading it on first use.
+        """
+        book = cls._books.get(cls._key(number_of_colors, number_of_dots, strategy))
+        if book is None:
+            book = cls(number_of_colors, number_of_dots, strategy)
+            cls._books[book.key] = book
+        return book
+
+    @classmethod
+    def save_all(cls) -> None:
+        """
+        Persists the moves recorded in every loaded book since it was last saved.
+        """
+        for book in cls._books.values():
+            book.save()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of moves stored in the book.
+        """
+        return len(self._moves)
+
+    def _path(self, history: List[Tuple[tuple, tuple]]) -> Optional[tuple]:
+        """
+        Returns the book key of the given board history, or None if the history is out of the book.
+        """
+        if not history:
+            return ()
+        if len(history) == 1 and history[0][0] == self._moves.get(()):
+            return (history[0][1],)
+        return None
+
+    def lookup(self, history: List[Tuple[tuple, tuple]]) -> Optional[Tuple[int, ...]]:
+        """
+        Returns the stored guess for the given board history, if any.
+
+        Args:
+            history (List[Tuple[tuple, tuple]]): The (guess, feedback) entries on the board, oldest first.
+
+        Returns:
+            Optional[Tuple[int, ...]]: The stored guess, or None if the history is out of the book.
+        """
+        path = self._path(history)
+        return None if path is None else self._moves.get(path)
+
+    def record(
+        self, history: List[Tuple[tuple, tuple]], guess: Tuple[int, ...]
+    ) -> None:
+        """
+        Stores the guess computed for the given board history, to be persisted by the next save.
+
+        Histories that are out of the book (longer than one entry, or not starting with the book's first guess) are ignored.
+        """
+        path = self._path(history)
+        if path is None or path in self._moves:
+            return
+        self._moves[path] = tuple(guess)
+        self._unsaved = True
+        if not OpeningBook._exit_hook_registered:
+            atexit.register(OpeningBook.save_all)
+            OpeningBook._exit_hook_registered = True
+
+    def save(self) -> None:
+        """
+        Persists the book if moves were recorded since it was last saved.
+        """
+        if self._unsaved:
+            PersistentCacheManager.set(self.key, self._moves)
+            self._unsaved = False
+
+    def build(self, settings: "SolverSettings") -> None:  # type: ignore  # noqa: F821
+        """
+        Precomputes the first guess and the second guess after every possible feedback.
+
+        The book is persisted once, after every move is recorded. Only complete moves are recorded: a second move that is sampled, or scored over part of the pool only, is left out of the book and computed again during play.
+
+        Args:
+            settings (SolverSettings): The settings of the solver computing the moves. The strategy must match the book.
+
+        Raises:
+            ValueError: If the first move of the dimension is sampled with these settings.
+        """
+        # Imported here to avoid a circular import through mastermind.game
+        from mastermind.game.board import GameBoard
+        from mastermind.solver.solver import Solver
+
+        settings = copy(settings)
+        settings.use_opening_book = False  # compute every move from scratch
+        settings.move_deadline = None  # the book only holds complete moves
+        settings.time_budget = None
+        if Solver.samples_opening(self.NUMBER_OF_COLORS, self.NUMBER_OF_DOTS, settings):
+            raise ValueError(
+                f"The moves of {self.NUMBER_OF_COLORS}x{self.NUMBER_OF_DOTS} games are sampled and cannot be stored in an opening book"
+            )
+
+        board = GameBoard(self.NUMBER_OF_COLORS, self.NUMBER_OF_DOTS)
+        solver = Solver(self.NUMBER_OF_COLORS, self.NUMBER_OF_DOTS, settings)
+        first_guess = solver.next_guess(board)
+        if not solver.last_move_complete:
+            return
+        self.record([], first_guess)
+
+        feedbacks = solver.candidates.feedback_against(
+            first_guess, solver.candidates.indices
+        )
+        for code in sorted(set(feedbacks.tolist())):
+            feedback = decode_feedback(code, self.NUMBER_OF_DOTS)
+            if feedback == (self.NUMBER_OF_DOTS, 0):
+                continue  # the game is already won
+
+            board.clear()
+            board.add_guess(first_guess, feedback)
+            guess = solver.next_guess(board)
+            if solver.last_move_complete:
+                self.record([(first_guess, feedback)], guess)
+        self.save()
@@ -0,0 +1,359 @@
+"""
+This module defines the optimal solver, which searches for the strategy minimizing the expected number of guesses with a depth-first branch-and-bound.
+
+The cost of a set of candidates is the total number of guesses needed to crack every one of them from there on, so the cost of the full code space divided by its size is the expected number of guesses. A guess costs one guess per candidate plus the cost of each partition it leaves, and a guess is pruned as soon as a lower bound on that sum reaches the best cost found so far.
+"""
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from itertools import permutations
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from mastermind.solver.candidate_set import CandidateSet
+from mastermind.solver.decision_tree import DecisionTree
+from mastermind.solver.partition import feedback_block, partition_histograms
+from mastermind.solver.symmetry import canonical_guesses
+from mastermind.utils.code_codec import decode_code, decode_codes, encode_codes
+from mastermind.utils.get_feedback import encode_feedback
+
+_MAX_GROUP_ENTRIES = 1 << 22  # Largest symmetry table (permutations x codes) to build
+
+Entry = Tuple[float, bool]  # (cost, whether exact or only a lower bound)
+
+
+def _symmetry_table(number_of_colors: int, number_of_dots: int) -> np.ndarray:
+    """
+    Returns the image of every code under every permutation of colors and positions.
+
+    Returns:
+        np.ndarray: An array of shape (number_of_colors! * number_of_dots!, number_of_colors ** number_of_dots) where row i maps each code index to its image under the i-th permutation.
+    """
+    codes = decode_codes(
+        np.arange(number_of_colors**number_of_dots), number_of_colors, number_of_dots
+    ).astype(np.int64)
+    colors = np.array(list(permutations(range(1, number_of_colors + 1))))
+    images = [
+        encode_codes(
+            colors[:, codes[:, list(positions)] - 1].reshape(-1, number_of_dots),
+            number_of_colors,
+        )
+        for positions in permutations(range(number_of_dots))
+    ]
+    return np.concatenate(images).reshape(-1, len(codes)).astype(np.int32)
+
+
+def _solve_root_branch(
+    number_of_colors: int,
+    number_of_dots: int,
+    max_depth: Optional[int],
+    guess_index: int,
+) -> Tuple[float, Dict[tuple, Entry]]:
+    """
+    Computes the cost of one first guess, used as the unit of work of the worker processes.
+
+    Returns:
+        Tuple[float, Dict[tuple, Entry]]: The cost of the guess and the transposition table filled while computing it.
+    """
+    solver = OptimalSolver(number_of_colors, number_of_dots, max_depth)
+    indices = np.arange(number_of_colors**number_of_dots, dtype=np.int64)
+    lower = solver._guess_bounds(np.array([guess_index]), indices, max_depth)[0]
+    if math.isinf(lower):
+        return lower, {}
+    cost = solver._guess_cost(guess_index, indices, [], max_depth, lower, math.inf)
+    return cost, solver._table
+
+
+class OptimalSolver:
+    """
+    Finds a strategy minimizing the expected number of guesses, optionally within a maximum number of guesses.
+
+    The search scores every guess at every position, so it is meant to run offline for small dimensions: its result is a DecisionTree that the AI plays from through SolverSettings.decision_tree.
+
+    Three techniques keep the search tractable:
+        - Lower-bound pruning: the n candidates of a set need at least one guess each, at most one of them is cracked by the next guess and at most b ** (k - 1) by the k-th guess, where b is the number of non-winning feedbacks. Guesses are tried in order of the bound their partition sizes give, and the search of a guess stops as soon as its bound exceeds the best guess found.
+        - A transposition table: the cost of a set does not depend on how it was reached, nor on relabeling colors or permuting positions, so it is stored under the lexicographically smallest image of the set under these permutations. Sets where the search was cut off store the lower bound that was proven instead.
+        - Parallel root branches: the first guesses are evaluated by a pool of worker processes, whose transposition tables are merged to build the tree.
+
+    Args:
+        number_of_colors (int): The number of colors in the game.
+        number_of_dots (int): The number of dots in each combination.
+        max_depth (Optional[int]): The maximum number of guesses allowed, None for no limit.
+        max_workers (int): The number of processes evaluating the first guesses, 1 searches in-process.
+    """
+
+    def __init__(
+        self,
+        number_of_colors: int,
+        number_of_dots: int,
+        max_depth: Optional[int] = None,
+        max_workers: int = 1,
+    ) -> None:
+        self.NUMBER_OF_COLORS = number_of_colors
+        self.NUMBER_OF_DOTS = number_of_dots
+        self.max_depth = max_depth
+        self.max_workers = max_workers
+
+        self._all = np.arange(number_of_colors**number_of_dots, dtype=np.int64)
+        self._win = encode_feedback(number_of_dots, 0, number_of_dots)
+        self._table: Dict[tuple, Entry] = {}
+        self._bounds: Dict[Optional[int], np.ndarray] = {}
+
+        group_size = math.factorial(number_of_colors) * math.factorial(number_of_dots)
+        self._symmetries = (
+            _symmetry_table(number_of_colors, number_of_dots)
+            if group_size * len(self._all) <= _MAX_GROUP_ENTRIES
+            else None  # too large, sets are only keyed as they are
+        )
+
+    def _lower_bounds(self, depth_left: Optional[int]) -> np.ndarray:
+        """
+        Returns the lower bound on the cost of a set of each size, within depth_left guesses.
+
+        Returns:
+            np.ndarray: A float array where entry n bounds the cost of n candidates, infinite when they cannot all be cracked in time.
+        """
+        if depth_left not in self._bounds:
+            d = self.NUMBER_OF_DOTS
+            branches = (d + 1) * (
+                d + 2
+            ) // 2 - 2  # feedbacks other than (d, 0) and (d - 1, 1)
+            bounds = np.full(len(self._all) + 1, math.inf)
+            bounds[0] = cost = 0
+            guesses = capacity = 1
+            size = 0
+            while size < len(self._all) and (
+                depth_left is None or guesses <= depth_left
+            ):
+                for _ in range(min(capacity, len(self._all) - size)):
+                    size += 1
+                    cost += guesses
+                    bounds[size] = cost
+                guesses += 1
+                capacity *= branches
+            self._bounds[depth_left] = bounds
+        return self._bounds[depth_left]
+
+    def _key(self, indices: np.ndarray, depth_left: Optional[int]) -> tuple:
+        """
+        Returns the transposition table key of a sorted set of candidates.
+        """
+        if self._symmetries is None:
+            return indices.tobytes(), depth_left
+        images = np.sort(self._symmetries[:, indices], axis=1)
+        smallest = images[np.lexsort(images.T[::-1])[0]]
+        return smallest.tobytes(), depth_left
+
+    def _guess_bounds(
+        self, pool: np.ndarray, indices: np.ndarray, depth_left: Optional[int]
+    ) -> np.ndarray:
+        """
+        Returns the lower bound on the cost of making each guess of the pool, infinite for guesses that do not split the candidates.
+        """
+        child_bounds = self._lower_bounds(
+            None if depth_left is None else depth_left - 1
+        )
+        histograms = partition_histograms(
+            pool, indices, self.NUMBER_OF_COLORS, self.NUMBER_OF_DOTS
+        )
+        histograms[:, self._win] = 0
+        bounds = len(indices) + child_bounds[histograms].sum(axis=1)
+        bounds[(histograms == len(indices)).any(axis=1)] = math.inf
+        return bounds
+
+    def _guess_cost(
+        self,
+        guess_index: int,
+        indices: np.ndarray,
+        guesses: List[Tuple[int, ...]],
+        depth_left: Optional[int],
+        lower: float,
+        upper: float,
+    ) -> float:
+        """
+        Computes the cost of making a guess, searching its partitions from the largest.
+
+        Returns:
+            float: The exact cost if it is below upper, otherwise a lower bound of at least upper.
+        """
+        child_depth = None if depth_left is None else depth_left - 1
+        child_bounds = self._lower_bounds(child_depth)
+        feedback = feedback_block(
+            np.array([guess_index]), indices, self.NUMBER_OF_COLORS, self.NUMBER_OF_DOTS
+        )[0]
+        codes, counts = np.unique(feedback, return_counts=True)
+        guesses = guesses + [
+            decode_code(guess_index, self.NUMBER_OF_COLORS, self.NUMBER_OF_DOTS)
+        ]
+
+        total = lower
+        for position in np.argsort(-counts, kind="stable"):
+            if codes[position] == self._win:
+                continue
+            bound = child_bounds[counts[position]]
+            cost = self._cost(
+                indices[feedback == codes[position]],
+                guesses,
+                child_depth,
+                upper - (total - bound),
+            )
+            total += cost - bound
+            if total >= upper:
+                break
+        return total
+
+    def _cost(
+        self,
+        indices: np.ndarray,
+        guesses: List[Tuple[int, ...]],
+        depth_left: Optional[int],
+        upper: float,
+    ) -> float:
+        """
+        Computes the cost of a set of candidates by branch-and-bound over every guess.
+
+        Args:
+            indices (np.ndarray): The sorted indices of the candidates.
+            guesses (List[Tuple[int, ...]]): The guesses made so far, used for symmetry reduction.
+            depth_left (Optional[int]): The number of guesses left, None for no limit.
+            upper (float): The cost above which the exact value is not needed.
+
+        Returns:
+            float: The exact cost if it is below upper, otherwise a lower bound of at least upper.
+        """
+        n = len(indices)
+        if n <= 2:
+            return self._lower_bounds(depth_left)[n]  # guessing a candidate is optimal
+
+        key = self._key(indices, depth_left)
+        value, exact = self._table.get(key, (self._lower_bounds(depth_left)[n], False))
+        if exact or value >= upper:
+            return value
+
+        pool = canonical_guesses(
+            self._all, guesses, self.NUMBER_OF_COLORS, self.NUMBER_OF_DOTS
+        )
+        bounds = self._guess_bounds(pool, indices, depth_left)
+        best = upper
+        for position in np.argsort(bounds, kind="stable"):
+            if bounds[position] >= best:
+                break
+            cost = self._guess_cost(
+                int(pool[position]),
+                indices,
+                guesses,
+                depth_left,
+                bounds[position],
+                best,
+            )
+            best = min(best, cost)
+
+        if best < upper:
+            self._table[key] = (best, True)
+        else:
+            self._table[key] = (max(upper, bounds.min()), False)
+        return self._table[key][0]
+
+    def _merge(self, table: Dict[tuple, Entry]) -> None:
+        """
+        Adds the entries of another transposition table, keeping the most informative entry of each key.
+        """
+        for key, (value, exact) in table.items():
+            current = self._table.get(key)
+            if current is None or (exact and not current[1]):
+                self._table[key] = (value, exact)
+            elif not current[1] and not exact:
+                self._table[key] = (max(value, current[0]), False)
+
+    def _solve_root(self) -> float:
+        """
+        Evaluates the first guesses in worker processes and returns the cost of the full code space.
+        """
+        pool = canonical_guesses(
+            self._all, [], self.NUMBER_OF_COLORS, self.NUMBER_OF_DOTS
+        )
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _solve_root_branch,
+                    self.NUMBER_OF_COLORS,
+                    self.NUMBER_OF_DOTS,
+                    self.max_depth,
+                    int(guess_index),
+                )
+                for guess_index in pool
+            ]
+            costs = []
+            for future in futures:
+                cost, table = future.result()
+                costs.append(cost)
+                self._merge(table)
+
+        best = min(costs)
+        self._table[self._key(self._all, self.max_depth)] = (best, True)
+        return best
+
+    def cost(self) -> int:
+        """
+        Returns the total number of guesses of the optimal strategy over every secret.
+
+        Raises:
+            ValueError: If no strategy cracks every secret within max_depth guesses.
+        """
+        if self.max_workers > 1:
+            key = self._key(self._all, self.max_depth)
+            if not self._table.get(key, (0, False))[1]:
+                self._solve_root()
+        total = self._cost(self._all, [], self.max_depth, math.inf)
+        if math.isinf(total):
+            raise ValueError(
+                f"No strategy cracks every {self.NUMBER_OF_COLORS}x{self.NUMBER_OF_DOTS} secret in {self.max_depth} guesses"
+            )
+        return int(total)
+
+    def _choose_guess(
+        self, candidates: CandidateSet, history: List[Tuple[tuple, tuple]]
+    ) -> Tuple[int, ...]:
+        """
+        Returns the lowest-index guess of the pool achieving the optimal cost of the candidates.
+        """
+        indices = candidates.indices
+        if len(indices) <= 2:
+            return candidates.code_at(0)
+
+        depth_left = None if self.max_depth is None else self.max_depth - len(history)
+        guesses = [guess for guess, _ in history]
+        target = self._cost(indices, guesses, depth_left, math.inf)
+        pool = canonical_guesses(
+            self._all, guesses, self.NUMBER_OF_COLORS, self.NUMBER_OF_DOTS
+        )
+        bounds = self._guess_bounds(pool, indices, depth_left)
+        for guess_index, bound in zip(pool.tolist(), bounds):
+            if bound <= target:
+                cost = self._guess_cost(
+                    guess_index, indices, guesses, depth_left, bound, target + 1
+                )
+                if cost == target:
+                    return decode_code(
+                        guess_index, self.NUMBER_OF_COLORS, self.NUMBER_OF_DOTS
+                    )
+        raise AssertionError("the optimal cost has no guess achieving it")
+
+    def solve(self) -> DecisionTree:
+        """
+        Searches the optimal strategy and returns it as a decision tree.
+
+        Returns:
+            DecisionTree: The optimal strategy, whose average_guesses is the minimal expected number of guesses.
+
+        Raises:
+            ValueError: If no strategy cracks every secret within max_depth guesses.
+        """
+        self.cost()
+        return DecisionTree.from_strategy(
+            self.NUMBER_OF_COLORS,
+            self.NUMBER_OF_DOTS,
+            self._choose_guess,
+            by_depth=self.max_depth is not None,
+        )
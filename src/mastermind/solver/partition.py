@@ -0,0 +1,190 @@
+"""
+This module defines the partition kernel of the solver, which counts how a set of candidate codes would be split by the feedback of each guess.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict
+
+import numpy as np
+
+from mastermind.solver.strategies import get_strategy
+from mastermind.storage.feedback_table import FeedbackTableManager
+from mastermind.utils.code_codec import decode_codes
+from mastermind.utils.get_feedback import generate_feedback_matrix
+
+_CHUNK_ELEMENTS = 1 << 22  # Upper bound on guess x candidate pairs per chunk
+_PARALLEL_THRESHOLD = 1 << 22  # Fewer pairs than this are scored in-process
+
+_executors: Dict[int, ProcessPoolExecutor] = {}  # Worker pools by worker count
+
+
+def feedback_block(
+    guess_indices: np.ndarray,
+    candidate_indices: np.ndarray,
+    number_of_colors: int,
+    number_of_dots: int,
+) -> np.ndarray:
+    """
+    Returns the encoded feedback of every guess against every candidate.
+
+    The feedback is read from the memory-mapped feedback table when it has been built for this dimension, and computed otherwise.
+
+    Args:
+        guess_indices (np.ndarray): The indices of the guesses.
+        candidate_indices (np.ndarray): The indices of the candidates.
+        number_of_colors (int): The number of colors in the game.
+        number_of_dots (int): The number of dots in each combination.
+
+    Returns:
+        np.ndarray: An array of shape (n_guesses, n_candidates) with the encoded feedback.
+    """
+    table = FeedbackTableManager.get_table(
+        number_of_colors, number_of_dots, build=False
+    )
+    if table is not None:
+        return table[np.ix_(guess_indices, candidate_indices)]
+
+    return generate_feedback_matrix(
+        decode_codes(guess_indices, number_of_colors, number_of_dots),
+        decode_codes(candidate_indices, number_of_colors, number_of_dots),
+        number_of_colors,
+    )
+
+
+def _count_partitions(feedback: np.ndarray, partitions: int) -> np.ndarray:
+    """
+    Counts the encoded feedback of each row into a histogram of the given number of partitions.
+    """
+    # Offset each row into its own range of bins so one bincount covers the block
+    offsets = np.arange(len(feedback), dtype=np.int64)[:, None] * partitions
+    return np.bincount(
+        (feedback + offsets).ravel(), minlength=len(feedback) * partitions
+    ).reshape(len(feedback), partitions)
+
+
+def partition_histograms(
+    guess_indices: np.ndarray,
+    candidate_indices: np.ndarray,
+    number_of_colors: int,
+    number_of_dots: int,
+) -> np.ndarray:
+    """
+    Counts, for each guess, how many candidates fall into each feedback partition.
+
+    Args:
+        guess_indices (np.ndarray): The indices of the guesses.
+        candidate_indices (np.ndarray): The indices of the candidates.
+        number_of_colors (int): The number of colors in the game.
+        number_of_dots (int): The number of dots in each combination.
+
+    Returns:
+        np.ndarray: An array of shape (n_guesses, (number_of_dots + 1) ** 2) where entry [i, f] is the number of candidates giving encoded feedback f to guess i.
+    """
+    partitions = (number_of_dots + 1) ** 2
+    histograms = np.empty((len(guess_indices), partitions), dtype=np.int64)
+    step = max(1, _CHUNK_ELEMENTS // max(len(candidate_indices), 1))
+
+    for start in range(0, len(guess_indices), step):
+        chunk = guess_indices[start : start + step]
+        feedback = feedback_block(
+            chunk, candidate_indices, number_of_colors, number_of_dots
+        )
+        histograms[start : start + len(chunk)] = _count_partitions(feedback, partitions)
+
+    return histograms
+
+
+def _score_chunk(
+    guess_indices: np.ndarray,
+    candidate_indices: np.ndarray,
+    number_of_colors: int,
+    number_of_dots: int,
+    strategy: str,
+) -> np.ndarray:
+    """
+    Scores a chunk of guesses, used as the unit of work of the worker processes.
+    """
+    return get_strategy(strategy)(
+        partition_histograms(
+            guess_indices, candidate_indices, number_of_colors, number_of_dots
+        )
+    )
+
+
+def _get_executor(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Returns the shared worker pool of the given size, creating it on first use.
+    """
+    if max_workers not in _executors:
+        _executors[max_workers] = ProcessPoolExecutor(max_workers=max_workers)
+    return _executors[max_workers]
+
+
+def score_guesses(
+    guess_indices: np.ndarray,
+    candidate_indices: np.ndarray,
+    number_of_colors: int,
+    number_of_dots: int,
+    strategy: str = "minimax",
+    max_workers: int = 1,
+) -> np.ndarray:
+    """
+    Scores every guess against the candidates, optionally spreading the work across processes.
+
+    Args:
+        guess_indices (np.ndarray): The indices of the guesses to score.
+        candidate_indices (np.ndarray): The indices of the consistent candidates.
+        number_of_colors (int): The number of colors in the game.
+        number_of_dots (int): The number of dots in each combination.
+        strategy (str): The name of the registered scoring strategy.
+        max_workers (int): The number of worker processes to use. 1 scores in the current process.
+
+    Returns:
+        np.ndarray: The score of each guess, lower is better.
+    """
+    arguments = (candidate_indices, number_of_colors, number_of_dots, strategy)
+    pairs = len(guess_indices) * len(candidate_indices)
+    if max_workers <= 1 or pairs < _PARALLEL_THRESHOLD:
+        return _score_chunk(guess_indices, *arguments)
+
+    shards = np.array_split(guess_indices, max_workers * 4)  # keep workers busy
+    results = _get_executor(max_workers).map(
+        _score_chunk, shards, *(repeat(argument) for argument in arguments)
+    )
+    return np.concatenate(list(results))
+
+
+def score_codes(
+    guess_codes: np.ndarray,
+    candidate_codes: np.ndarray,
+    number_of_colors: int,
+    strategy: str = "minimax",
+) -> np.ndarray:
+    """
+    Scores guesses against candidates that are given as codes rather than indices.
+
+    No code index is involved, so this also works for dimensions whose indices do not fit in 64 bits.
+
+    Args:
+        guess_codes (np.ndarray): An array of shape (n_guesses, number_of_dots) of guesses.
+        candidate_codes (np.ndarray): An array of shape (n_candidates, number_of_dots) of consistent codes.
+        number_of_colors (int): The number of colors in the game.
+        strategy (str): The name of the registered scoring strategy.
+
+    Returns:
+        np.ndarray: The score of each guess, lower is better.
+    """
+    partitions = (guess_codes.shape[1] + 1) ** 2
+    histograms = np.empty((len(guess_codes), partitions), dtype=np.int64)
+    step = max(1, _CHUNK_ELEMENTS // max(len(candidate_codes), 1))
+
+    for start in range(0, len(guess_codes), step):
+        feedback = generate_feedback_matrix(
+            guess_codes[start : start + step], candidate_codes, number_of_colors
+        )
+        histograms[start : start + len(feedback)] = _count_partitions(
+            feedback, partitions
+        )
+
+    return get_strategy(strategy)(histograms)
@@ -0,0 +1,161 @@
+"""
+This module defines the sampling mode of the solver, which keeps the game playable when the code space is too large to score exhaustively.
+
+Instead of scoring every code against every consistent code, a random sample of guesses is scored against a random sample of consistent codes, within a time budget per move.
+"""
+
+import time
+from itertools import islice
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from mastermind.solver.candidate_set import CandidateSet
+from mastermind.solver.consistent_codes import iter_consistent_codes
+from mastermind.solver.partition import score_codes
+from mastermind.utils.get_feedback import encode_feedback, generate_feedback_matrix
+
+_BATCH_SIZE = 1 << 14  # Random codes drawn when rejection sampling
+_SCORING_CHUNK = 64  # Guesses scored between two deadline checks
+_MAX_INDEXED_CODES = np.iinfo(np.int64).max  # Largest code space drawn by index
+
+
+def random_codes(
+    number_of_colors: int, number_of_dots: int, size: int, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Draws codes uniformly at random, dot by dot.
+
+    Unlike drawing a code index, this works whatever the size of the code space.
+
+    Returns:
+        np.ndarray: A uint8 array of shape (size, number_of_dots) with colors from 1.
+    """
+    return rng.integers(1, number_of_colors + 1, (size, number_of_dots), dtype=np.uint8)
+
+
+def sample_consistent(
+    candidates: CandidateSet,
+    history: List[Tuple[tuple, tuple]],
+    size: int,
+    rng: np.random.Generator,
+    deadline: float,
+) -> Tuple[np.ndarray, Optional[Tuple[int, ...]]]:
+    """
+    Draws up to size distinct codes consistent with the history.
+
+    If the candidate set has been filtered, the sample is drawn from it directly. Otherwise a batch of random codes is drawn and those contradicting a feedback are rejected, then the sample is topped up with randomized backtracking searches (see mastermind.solver.consistent_codes) until it is full or the deadline passes.
+
+    The codes are drawn dot by dot rather than by index, so any dimension can be sampled.
+
+    Args:
+        candidates (CandidateSet): The candidate set of the game.
+        history (List[Tuple[tuple, tuple]]): The (guess, feedback) entries on the board, oldest first.
+        size (int): The maximum number of codes to draw.
+        rng (np.random.Generator): The random generator to draw from.
+        deadline (float): The time.monotonic() value after which drawing stops.
+
+    Returns:
+        Tuple[np.ndarray, Optional[Tuple[int, ...]]]: The consistent codes found, as a uint8 array of shape (n, number_of_dots) in lexicographic order, and the code contradicting the fewest feedbacks among all codes drawn (a fallback for when none is found in time). The fallback is None when no code is consistent at all: the candidate set is empty, or a search finished before the deadline without finding any.
+    """
+    colors, dots = candidates.NUMBER_OF_COLORS, candidates.NUMBER_OF_DOTS
+    if not candidates.is_full:
+        indices = candidates.indices
+        sample = candidates.decode(
+            np.sort(rng.choice(indices, min(size, len(indices)), replace=False))
+        )
+        return sample, tuple(sample[0].tolist()) if len(sample) else None
+    if not history:
+        if candidates.TOTAL <= _MAX_INDEXED_CODES:
+            sample = candidates.decode(
+                np.sort(
+                    rng.choice(
+                        candidates.TOTAL, min(size, candidates.TOTAL), replace=False
+                    )
+                )
+            )
+        else:  # collisions are negligible in such a space
+            sample = np.unique(random_codes(colors, dots, size, rng), axis=0)
+        return sample, tuple(sample[0].tolist())
+
+    # A batch of random codes finds consistent codes cheaply while they are common
+    batch = random_codes(colors, dots, _BATCH_SIZE, rng)
+    feedback = generate_feedback_matrix(
+        np.array([guess for guess, _ in history]), batch, colors
+    )
+    expected = np.array([encode_feedback(*entry, dots) for _, entry in history])
+    violations = (feedback != expected[:, None]).sum(axis=0)
+    fallback = tuple(batch[np.argmin(violations)].tolist())
+    found = set(map(tuple, batch[violations == 0].tolist()))
+
+    # Then each restart of a randomized search contributes one more code
+    while len(found) < size and time.monotonic() < deadline:
+        codes = iter_consistent_codes(history, colors, dots, rng=rng, deadline=deadline)
+        try:
+            code = next(codes)
+        except StopIteration as stop:
+            if not stop.value and not found:
+                fallback = None  # the search was complete: no code is consistent
+            break
+        if code in found:  # few codes are left, take them from a single search
+            found.update(islice(codes, size - len(found)))
+            break
+        found.add(code)
+
+    sample = np.array(sorted(found), dtype=np.uint8).reshape(-1, dots)
+    if len(sample) > size:  # keep a uniform subset rather than the first codes
+        sample = sample[np.sort(rng.choice(len(sample), size, replace=False))]
+    return sample, fallback
+
+
+def sampled_guess(
+    candidates: CandidateSet,
+    history: List[Tuple[tuple, tuple]],
+    strategy: str,
+    sample_size: int,
+    rng: np.random.Generator,
+    time_budget: Optional[float],
+) -> Optional[Tuple[int, ...]]:
+    """
+    Chooses a guess by scoring a sample of guesses against a sample of consistent codes.
+
+    The guesses are the sampled consistent codes followed by as many random codes, and are scored in chunks until all are scored or the time budget runs out. Ties go to consistent codes, then to the guess scored first. If no consistent code is found in time, the code contradicting the fewest feedbacks is returned.
+
+    Args:
+        candidates (CandidateSet): The candidate set of the game.
+        history (List[Tuple[tuple, tuple]]): The (guess, feedback) entries on the board, oldest first.
+        strategy (str): The name of the registered scoring strategy.
+        sample_size (int): The number of consistent codes and of random guesses to sample.
+        rng (np.random.Generator): The random generator to draw from.
+        time_budget (Optional[float]): The seconds the move may take, or None for no limit.
+
+    Returns:
+        Optional[Tuple[int, ...]]: The chosen guess, or None if no code is consistent with the history.
+    """
+    deadline = time.monotonic() + (np.inf if time_budget is None else time_budget)
+    consistent, fallback = sample_consistent(
+        candidates, history, sample_size, rng, deadline
+    )
+    if len(consistent) == 0:
+        return fallback
+    if len(consistent) <= 2:
+        return tuple(consistent[0].tolist())
+
+    random_guesses = random_codes(
+        candidates.NUMBER_OF_COLORS, candidates.NUMBER_OF_DOTS, sample_size, rng
+    )
+    guess_pool = np.concatenate([consistent, random_guesses])
+
+    scores = np.full(len(guess_pool), np.inf)
+    for start in range(0, len(guess_pool), _SCORING_CHUNK):
+        if start > 0 and time.monotonic() >= deadline:
+            break  # keep the best guess scored so far
+        scores[start : start + _SCORING_CHUNK] = score_codes(
+            guess_pool[start : start + _SCORING_CHUNK],
+            consistent,
+            candidates.NUMBER_OF_COLORS,
+            strategy,
+        )
+
+    # Consistent codes come first in the pool, so argmin already prefers them
+    return tuple(guess_pool[np.argmin(scores)].tolist())
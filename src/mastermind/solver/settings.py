@@ -0,0 +1,73 @@
+import os
+from typing import Optional
+
+from mastermind.solver.strategies import get_strategy
+from mastermind.validation import ConstrainedFloat, ConstrainedInteger
+
+
+class SolverSettings:
+    """
+    Settings controlling how the AI solver chooses its guesses.
+
+    Args:
+        strategy (str): The name of the guess-scoring strategy, such as "minimax", "entropy", "expected_size" or "most_parts".
+        max_workers (Optional[int]): The number of worker processes used to score guesses. 1 scores in the current process, None uses every core.
+        use_opening_book (bool): Whether to look up and store the first two moves in the persistent opening book.
+        use_symmetry (bool): Whether to score only one guess of each class of guesses that are equivalent under the board history.
+        mode (str): "exhaustive" scores every code against every consistent code, "sampling" scores a sample of guesses against a sample of consistent codes, and "auto" samples only when the code space is too large to score exhaustively.
+        sample_size (int): The number of consistent codes, and of extra random guesses, sampled per move in sampling mode.
+        time_budget (Optional[float]): The seconds a move may take in the "sampling" and "auto" modes, None for no limit. It covers the whole move: an exhaustively scored move that runs out of time plays the best guess scored so far, like with move_deadline.
+        seed (Optional[int]): The seed of the random generator used for sampling, None for a random seed.
+        decision_tree (Optional[str]): The path of a decision tree saved with DecisionTree.save. Moves are then played from the tree, and computed live only once the game leaves it.
+        transposition_cache_size (int): The number of computed moves remembered by candidate set in the process-wide TranspositionCache, 0 to disable it.
+        persist_transposition_cache (bool): Whether to keep the transposition cache across sessions through PersistentCacheManager.
+        move_deadline (Optional[float]): The seconds an exhaustively scored move may take, None for no limit. Consistent guesses are scored first, and when time runs out the best guess scored so far is played.
+
+    Raises:
+        ValueError: If the strategy or the mode is unknown.
+    """
+
+    MODES = ("auto", "exhaustive", "sampling")
+
+    def __init__(
+        self,
+        strategy: str = "minimax",
+        max_workers: Optional[int] = 1,
+        use_opening_book: bool = True,
+        use_symmetry: bool = True,
+        mode: str = "auto",
+        sample_size: int = 512,
+        time_budget: Optional[float] = 2.0,
+        seed: Optional[int] = None,
+        decision_tree: Optional[str] = None,
+        transposition_cache_size: int = 4096,
+        persist_transposition_cache: bool = False,
+        move_deadline: Optional[float] = None,
+    ) -> None:
+        get_strategy(strategy)  # fail early on unknown strategies
+        self.strategy = strategy
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.max_workers = ConstrainedInteger(ge=1).validate_value(max_workers)
+        self.use_opening_book = use_opening_book
+        self.use_symmetry = use_symmetry
+
+        if mode not in self.MODES:
+            raise ValueError(
+                f"Unknown mode {mode!r}, expected one of {', '.join(self.MODES)}"
+            )
+        self.mode = mode
+        self.sample_size = ConstrainedInteger(ge=1).validate_value(sample_size)
+        if time_budget is not None:
+            time_budget = ConstrainedFloat(gt=0).validate_value(time_budget)
+        self.time_budget = time_budget
+        self.seed = seed
+        self.decision_tree = decision_tree
+        self.transposition_cache_size = ConstrainedInteger(ge=0).validate_value(
+            transposition_cache_size
+        )
+        self.persist_transposition_cache = persist_transposition_cache
+        if move_deadline is not None:
+            move_deadline = ConstrainedFloat(gt=0).validate_value(move_deadline)
+        self.move_deadline = move_deadline
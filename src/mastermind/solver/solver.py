@@ -0,0 +1,427 @@
+import time
+from typing import Generator, List, Optional, Tuple
+
+import numpy as np
+
+from mastermind.solver.candidate_set import CandidateSet
+from mastermind.solver.consistent_codes import iter_consistent_codes
+from mastermind.solver.decision_tree import DecisionTree
+from mastermind.solver.opening_book import OpeningBook
+from mastermind.solver.partition import score_guesses
+from mastermind.solver.sampling import sampled_guess
+from mastermind.solver.settings import SolverSettings
+from mastermind.solver.symmetry import canonical_guesses
+from mastermind.solver.transposition_cache import TranspositionCache
+from mastermind.utils.code_codec import decode_code
+
+_MAX_EXHAUSTIVE_PAIRS = 1 << 27  # Largest guess x candidate workload per worker
+_MAX_POOL_CODES = 1 << 20  # Largest code space scored exhaustively in "auto" mode
+_MAX_ENUMERATED_CODES = 1 << 24  # Largest code space tracked as a candidate set
+_STREAM_CHUNK_SIZE = 1 << 12  # Codes decoded at a time when streaming candidates
+# Guess x candidate pairs per worker between deadline checks
+_DEADLINE_CHUNK_PAIRS = 1 << 20
+
+
+class Solver:
+    """
+    Chooses guesses for a code cracker by tracking the codes consistent with a game board.
+
+    The solver remembers which board entries it has already applied to its candidate set, so each call only filters by the guesses made since the previous call. Guesses are chosen by scoring every code with the configured strategy (Knuth's minimax by default) over the partitions its feedback would leave, and the smallest score wins.
+
+    When the code space is too large for that, the solver switches to sampling mode (see mastermind.solver.sampling), which bounds the time spent per move. Code spaces larger than 2**24 codes are not enumerated at all: the solver then only keeps the board history and samples consistent codes from it.
+
+    Args:
+        number_of_colors (int): The number of colors in the game.
+        number_of_dots (int): The number of dots in each combination.
+        settings (Optional[SolverSettings]): The solver settings, defaults to SolverSettings().
+
+    Raises:
+        InconsistentFeedbackError: If no code is consistent with the feedback on the board.
+        ValueError: If the configured decision tree is for another dimension.
+    """
+
+    class InconsistentFeedbackError(Exception):
+        """
+        Exception raised when no code is consistent with the feedback on the board.
+        """
+
+        pass
+
+    def __init__(
+        self,
+        number_of_colors: int,
+        number_of_dots: int,
+        settings: Optional[SolverSettings] = None,
+    ) -> None:
+        self.settings = settings or SolverSettings()
+        self.candidates = CandidateSet(number_of_colors, number_of_dots)
+        self._history: List[Tuple[tuple, tuple]] = []  # board entries applied so far
+        self._snapshots = [self.candidates.snapshot()]  # state after each applied entry
+        self._redo: List[
+            Tuple[Tuple[tuple, tuple], tuple]
+        ] = []  # undone entries, last on top
+        self._enumerable = self.candidates.TOTAL <= _MAX_ENUMERATED_CODES
+        self._rng = np.random.default_rng(self.settings.seed)
+        self.last_move_complete = True  # whether the last guess was fully computed
+
+        self._cache: Optional[TranspositionCache] = None
+        if self._enumerable and self.settings.transposition_cache_size > 0:
+            self._cache = TranspositionCache.get(
+                number_of_colors,
+                number_of_dots,
+                self.settings.strategy,
+                self.settings.transposition_cache_size,
+                self.settings.persist_transposition_cache,
+            )
+
+        self._tree: Optional[DecisionTree] = None
+        if self.settings.decision_tree is not None:
+            self._tree = DecisionTree.get(self.settings.decision_tree)
+            if (self._tree.NUMBER_OF_COLORS, self._tree.NUMBER_OF_DOTS) != (
+                number_of_colors,
+                number_of_dots,
+            ):
+                raise ValueError(
+                    f"The decision tree is for {self._tree.NUMBER_OF_COLORS}x{self._tree.NUMBER_OF_DOTS} games"
+                )
+
+    @staticmethod
+    def samples_opening(
+        number_of_colors: int,
+        number_of_dots: int,
+        settings: Optional[SolverSettings] = None,
+    ) -> bool:
+        """
+        Checks whether the first move of the given dimension is chosen in sampling mode.
+
+        Such dimensions never use the opening book, and their moves do not read a feedback table, so neither is worth preparing for them.
+
+        Args:
+            number_of_colors (int): The number of colors in the game.
+            number_of_dots (int): The number of dots in each combination.
+            settings (Optional[SolverSettings]): The solver settings, defaults to SolverSettings().
+
+        Returns:
+            bool: Whether the first move is sampled.
+        """
+        settings = settings or SolverSettings()
+        total = number_of_colors**number_of_dots
+        return (
+            total > _MAX_ENUMERATED_CODES
+            or settings.mode == "sampling"
+            or (settings.mode == "auto" and total > _MAX_POOL_CODES)
+        )
+
+    def sync(self, board: "GameBoard") -> CandidateSet:  # type: ignore  # noqa: F821
+        """
+        Brings the candidate set up to date with the game board.
+
+        Entries added since the last call are filtered in incrementally. The solver keeps a snapshot of the candidate set after each applied entry, aligned with the board: when entries are removed (an undo), the snapshot of the remaining board is restored, and the undone entries are kept with their snapshots so that putting them back (a redo) restores the set again instead of filtering it. Both are constant-time per entry. Code spaces too large to enumerate are never filtered, only the history is kept.
+
+        Args:
+            board (GameBoard): The game board to follow.
+
+        Returns:
+            CandidateSet: The up-to-date candidate set.
+        """
+        entries = [
+            (tuple(guess), tuple(feedback))
+            for guess, feedback in (board[i] for i in range(len(board) - 1, -1, -1))
+        ]
+
+        common = 0
+        for applied, entry in zip(self._history, entries):
+            if applied != entry:
+                break
+            common += 1
+
+        if common < len(self._history):
+            while len(self._history) > common:
+                self._redo.append((self._history.pop(), self._snapshots.pop()))
+            self.candidates.restore(self._snapshots[-1])
+
+        for entry in entries[common:]:
+            if self._redo and self._redo[-1][0] == entry:
+                self.candidates.restore(self._redo.pop()[1])
+            else:
+                self._redo.clear()  # the board branched off the undone entries
+                if self._enumerable:
+                    self.candidates.filter(*entry)
+            self._history.append(entry)
+            self._snapshots.append(self.candidates.snapshot())
+
+        return self.candidates
+
+    def iter_candidates(
+        self,
+        board: "GameBoard",  # type: ignore  # noqa: F821
+        deadline: Optional[float] = None,
+    ) -> Generator[Tuple[int, ...], None, bool]:
+        """
+        Yields the codes consistent with the game board in lexicographic order, without materializing them.
+
+        Enumerable code spaces are streamed from the candidate set chunk by chunk, larger ones from a backtracking search over the board history. Take the first N codes with itertools.islice to stop early. Once exhausted, the generator returns (as StopIteration.value) whether the deadline cut the stream short. Enumerable code spaces stream their first block of codes even past the deadline.
+
+        Args:
+            board (GameBoard): The game board to follow.
+            deadline (Optional[float]): The time.monotonic() value after which the stream stops.
+
+        Yields:
+            Tuple[int, ...]: The consistent codes.
+
+        Returns:
+            bool: Whether the deadline passed before every consistent code was yielded.
+        """
+        candidates = self.sync(board)
+        if not self._enumerable:
+            return (
+                yield from iter_consistent_codes(
+                    self._history,
+                    candidates.NUMBER_OF_COLORS,
+                    candidates.NUMBER_OF_DOTS,
+                    deadline=deadline,
+                )
+            )
+
+        streamed = False  # the first block is streamed even past the deadline
+        for chunk in candidates._iter_chunks():
+            for start in range(0, len(chunk), _STREAM_CHUNK_SIZE):
+                if streamed and deadline is not None and time.monotonic() > deadline:
+                    return True
+                streamed = True
+                for code in candidates.decode(
+                    chunk[start : start + _STREAM_CHUNK_SIZE]
+                ):
+                    yield tuple(int(dot) for dot in code)
+        return False
+
+    def count_candidates(
+        self,
+        board: "GameBoard",  # type: ignore  # noqa: F821
+        limit: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ) -> Tuple[int, bool]:
+        """
+        Counts the codes consistent with the game board.
+
+        Enumerable code spaces are counted exactly from the candidate set. Larger ones are counted by streaming the consistent codes, which stops once more than limit codes are found or the deadline passes.
+
+        Args:
+            board (GameBoard): The game board to follow.
+            limit (Optional[int]): The largest count worth streaming, None for no limit.
+            deadline (Optional[float]): The time.monotonic() value after which streaming stops.
+
+        Returns:
+            Tuple[int, bool]: The number of consistent codes found, and whether it is exact. When it is not, at least that many codes are consistent: limit + 1 if the limit was exceeded, fewer if the deadline passed first.
+        """
+        candidates = self.sync(board)
+        if self._enumerable:
+            return len(candidates), True
+
+        codes = self.iter_candidates(board, deadline)
+        count = 0
+        while limit is None or count <= limit:
+            try:
+                next(codes)
+            except StopIteration as stop:
+                return count, not stop.value
+            count += 1
+        return count, False
+
+    def next_guess(self, board: "GameBoard") -> Tuple[int, ...]:  # type: ignore  # noqa: F821
+        """
+        Returns the next guess to make for the given game board.
+
+        When a decision tree is configured, moves are played from it for as long as the board follows it. Otherwise the first two moves are looked up in the opening book when it is enabled, and stored in it after being computed. Later moves are looked up in the transposition cache by candidate set. Moves that are too expensive to score exhaustively are chosen in sampling mode instead; they are random and never stored in the book.
+
+        Args:
+            board (GameBoard): The game board to follow.
+
+        Returns:
+            Tuple[int, ...]: The guess.
+
+        Raises:
+            InconsistentFeedbackError: If no code is consistent with the feedback on the board. On boards too large to enumerate, this is detected when the search for consistent codes completes within the time budget.
+        """
+        started = time.monotonic()
+        candidates = self.sync(board)
+        if self._enumerable and len(candidates) == 0:
+            raise self.InconsistentFeedbackError(
+                "No code is consistent with the feedback given."
+            )
+
+        if self._tree is not None:
+            if (guess := self._tree.lookup(self._history)) is not None:
+                self.last_move_complete = True
+                return guess
+        return self.choose_guess(candidates, self._history, started)
+
+    def choose_guess(
+        self,
+        candidates: CandidateSet,
+        history: List[Tuple[tuple, tuple]],
+        started: Optional[float] = None,
+    ) -> Tuple[int, ...]:
+        """
+        Returns the guess to make for a candidate set and the board history that produced it.
+
+        This is the move selection of next_guess without the board tracking, so callers exploring many positions (such as DecisionTree.build) can supply their own candidate sets.
+
+        The time limits cover the whole move, counted from started: the move deadline, and outside of the "exhaustive" mode the time budget, bound the exhaustive scoring, and a sampled move only gets the part of the time budget that is left.
+
+        Afterwards, last_move_complete tells whether the guess was looked up or scored over the whole exhaustive pool. It is False for sampled moves and for moves cut off by a time limit, which are never stored in the opening book or the transposition cache.
+
+        Args:
+            candidates (CandidateSet): The codes consistent with the history. It must not be empty.
+            history (List[Tuple[tuple, tuple]]): The (guess, feedback) entries on the board, oldest first.
+            started (Optional[float]): The time.monotonic() value the move started at, which the time limits are counted from. Defaults to now.
+
+        Returns:
+            Tuple[int, ...]: The guess.
+
+        Raises:
+            InconsistentFeedbackError: If a sampled move finds that no code is consistent with the history.
+        """
+        if started is None:
+            started = time.monotonic()
+        limits = [self.settings.move_deadline]
+        if self.settings.mode != "exhaustive":
+            limits.append(self.settings.time_budget)
+        limits = [limit for limit in limits if limit is not None]
+        deadline = started + min(limits) if limits else None
+
+        self.last_move_complete = True
+        if self._enumerable and self.settings.mode != "sampling":
+            book = None
+            if self.settings.use_opening_book and len(history) < 2:
+                book = OpeningBook.get(
+                    candidates.NUMBER_OF_COLORS,
+                    candidates.NUMBER_OF_DOTS,
+                    self.settings.strategy,
+                )
+                if (guess := book.lookup(history)) is not None:
+                    return guess
+
+            if len(candidates) <= 2:
+                return candidates.code_at(0)
+
+            if self._cache is not None:
+                if (move := self._cache.lookup(candidates.indices)) is not None:
+                    guess = self._to_code(move[0])
+                    if book is not None:
+                        book.record(history, guess)
+                    return guess
+
+            if (guess_pool := self._guess_pool(candidates, history)) is not None:
+                index, score, complete = self._compute_guess(
+                    candidates, guess_pool, deadline
+                )
+                guess = self._to_code(index)
+                self.last_move_complete = complete
+                if complete and self._cache is not None:
+                    self._cache.store(candidates.indices, index, score)
+                if complete and book is not None:
+                    book.record(history, guess)
+                return guess
+
+        self.last_move_complete = False
+        time_budget = self.settings.time_budget
+        if time_budget is not None:  # what is left after the exhaustive checks
+            time_budget = max(0.0, started + time_budget - time.monotonic())
+        guess = sampled_guess(
+            candidates,
+            history,
+            self.settings.strategy,
+            self.settings.sample_size,
+            self._rng,
+            time_budget,
+        )
+        if guess is None:
+            raise self.InconsistentFeedbackError(
+                "No code is consistent with the feedback given."
+            )
+        return guess
+
+    def _guess_pool(
+        self, candidates: CandidateSet, history: List[Tuple[tuple, tuple]]
+    ) -> Optional[np.ndarray]:
+        """
+        Returns the guesses to score exhaustively, or None if the move should be sampled instead.
+
+        With symmetry reduction enabled, only one guess of each class of equivalent guesses is kept, which leaves the chosen guess unchanged. In "auto" mode, None is returned when scoring the pool against the candidates would exceed the exhaustive workload of the available workers.
+        """
+        auto = self.settings.mode == "auto"
+        if auto and candidates.TOTAL > _MAX_POOL_CODES:
+            return None
+
+        guess_pool = np.arange(candidates.TOTAL, dtype=np.int64)
+        if self.settings.use_symmetry:
+            guess_pool = canonical_guesses(
+                guess_pool,
+                [guess for guess, _ in history],
+                candidates.NUMBER_OF_COLORS,
+                candidates.NUMBER_OF_DOTS,
+            )
+
+        workload = len(guess_pool) * len(candidates)
+        if auto and workload > _MAX_EXHAUSTIVE_PAIRS * self.settings.max_workers:
+            return None
+        return guess_pool
+
+    def _compute_guess(
+        self,
+        candidates: CandidateSet,
+        guess_pool: np.ndarray,
+        deadline: Optional[float] = None,
+    ) -> Tuple[int, float, bool]:
+        """
+        Scores the guesses against the candidate set and returns the index and score of the best one, and whether every guess was scored.
+
+        Ties between equally scored guesses go to codes that are still consistent, then to the lowest index. With a deadline, the consistent guesses are scored first, then the others, chunk by chunk; once the deadline passes, the best guess scored so far is returned. At least one chunk is always scored.
+        """
+        if deadline is not None:
+            consistent = np.isin(guess_pool, candidates.indices)
+            guess_pool = np.concatenate(
+                [guess_pool[consistent], guess_pool[~consistent]]
+            )
+
+        scores = np.full(len(guess_pool), np.inf)
+        step = len(guess_pool)
+        if deadline is not None:
+            pairs = _DEADLINE_CHUNK_PAIRS * self.settings.max_workers
+            step = max(1, pairs // len(candidates))
+
+        complete = True
+        for start in range(0, len(guess_pool), step):
+            if start > 0 and time.monotonic() >= deadline:
+                complete = False
+                break
+            scores[start : start + step] = score_guesses(
+                guess_pool[start : start + step],
+                candidates.indices,
+                candidates.NUMBER_OF_COLORS,
+                candidates.NUMBER_OF_DOTS,
+                self.settings.strategy,
+                self.settings.max_workers,
+            )
+
+        index = self._select_best(guess_pool, scores, candidates)
+        return index, float(scores.min()), complete
+
+    def _select_best(
+        self, guess_pool: np.ndarray, scores: np.ndarray, candidates: CandidateSet
+    ) -> int:
+        """
+        Returns the index of the best scored guess, preferring consistent codes on ties.
+        """
+        best = scores == scores.min()
+        consistent = best & np.isin(guess_pool, candidates.indices)
+        return int(guess_pool[np.argmax(consistent if consistent.any() else best)])
+
+    def _to_code(self, index: int) -> Tuple[int, ...]:
+        """
+        Returns the code of the given index as a tuple.
+        """
+        return decode_code(
+            index, self.candidates.NUMBER_OF_COLORS, self.candidates.NUMBER_OF_DOTS
+        )
@@ -0,0 +1,81 @@
+"""
+This module defines the guess-scoring strategies of the solver.
+
+Every strategy maps the partition histograms of a batch of guesses (see mastermind.solver.partition) to one score per guess, where lower is better. Because they all read the same histograms, adding a heuristic costs no extra pass over the candidates.
+"""
+
+from typing import Callable, Dict
+
+import numpy as np
+
+Strategy = Callable[[np.ndarray], np.ndarray]
+
+STRATEGIES: Dict[str, Strategy] = {}  # Registered strategies by name
+
+
+def register_strategy(name: str) -> Callable[[Strategy], Strategy]:
+    """
+    Registers a scoring function under the given name.
+
+    Args:
+        name (str): The name used to select the strategy in SolverSettings.
+
+    Returns:
+        Callable[[Strategy], Strategy]: A decorator registering the function unchanged.
+    """
+
+    def decorator(function: Strategy) -> Strategy:
+        STRATEGIES[name] = function
+        return function
+
+    return decorator
+
+
+def get_strategy(name: str) -> Strategy:
+    """
+    Returns the scoring function registered under the given name.
+
+    Raises:
+        ValueError: If no strategy is registered under the name.
+    """
+    if name not in STRATEGIES:
+        raise ValueError(
+            f"Unknown strategy {name!r}, expected one of {', '.join(STRATEGIES)}"
+        )
+    return STRATEGIES[name]
+
+
+@register_strategy("minimax")
+def minimax_score(histograms: np.ndarray) -> np.ndarray:
+    """
+    Scores each guess by the size of its largest partition (Knuth's worst case).
+    """
+    return histograms.max(axis=1)
+
+
+@register_strategy("expected_size")
+def expected_size_score(histograms: np.ndarray) -> np.ndarray:
+    """
+    Scores each guess by the expected size of the partition the secret falls in.
+    """
+    total = histograms.sum(axis=1)
+    return (histograms**2).sum(axis=1) / np.maximum(total, 1)
+
+
+@register_strategy("entropy")
+def entropy_score(histograms: np.ndarray) -> np.ndarray:
+    """
+    Scores each guess by the negated entropy of its partition sizes, so the most informative guess wins.
+    """
+    probabilities = histograms / np.maximum(histograms.sum(axis=1, keepdims=True), 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = np.where(probabilities > 0, probabilities * np.log2(probabilities), 0)
+    return terms.sum(axis=1)
+
+
+@register_strategy("most_parts")
+def most_parts_score(histograms: np.ndarray) -> np.ndarray:
+    """
+    Scores each guess by the negated number of non-empty partitions.
+    """
+    return -np.count_nonzero(histograms, axis=1)
@@ -0,0 +1,82 @@
+"""
+This module defines the symmetry reduction of the solver, which keeps one representative of each class of guesses that are equivalent under the board history.
+
+Relabeling colors that no guess has used yet, and permuting positions that every guess so far has filled identically, leaves every past guess unchanged. Such a symmetry therefore maps the consistent set onto itself, and two guesses related by it split the candidates into partitions of the same sizes. Scoring one guess per class is enough.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+from mastermind.utils.code_codec import decode_codes
+
+_MAX_KEY = np.iinfo(np.int64).max
+
+
+def _position_classes(
+    guesses: List[Tuple[int, ...]], number_of_dots: int
+) -> np.ndarray:
+    """
+    Labels each position with the class of positions every past guess agrees on.
+
+    Returns:
+        np.ndarray: The class label of each position, numbered from 0 in order of first appearance.
+    """
+    labels: dict = {}
+    columns = zip(*guesses) if guesses else [()] * number_of_dots
+    return np.array([labels.setdefault(column, len(labels)) for column in columns])
+
+
+def _row_keys(rows: np.ndarray) -> np.ndarray:
+    """
+    Returns one integer per row of a non-negative integer array, equal exactly when the rows are equal.
+
+    The columns are combined as the digits of a mixed-radix number, and the partial keys are replaced by their dense rank whenever the next digit could overflow 64 bits. This is much faster than np.unique(rows, axis=0).
+    """
+    keys = np.zeros(len(rows), dtype=np.int64)
+    for column in rows.T:
+        radix = int(column.max(initial=0)) + 1
+        if (int(keys.max(initial=0)) + 1) * radix > _MAX_KEY:
+            keys = np.unique(keys, return_inverse=True)[1].astype(np.int64)
+        keys = keys * radix + column
+    return keys
+
+
+def canonical_guesses(
+    guess_indices: np.ndarray,
+    guesses: List[Tuple[int, ...]],
+    number_of_colors: int,
+    number_of_dots: int,
+) -> np.ndarray:
+    """
+    Returns the lowest-index guess of each symmetry class among the given guesses.
+
+    Two guesses are in the same class when a relabeling of the colors absent from every past guess, combined with a permutation of positions that every past guess fills identically, maps one onto the other. Such guesses always receive the same score, so keeping the lowest index of each class preserves the move chosen with lowest-index tie-breaking.
+
+    Args:
+        guess_indices (np.ndarray): The sorted indices of the guesses to reduce.
+        guesses (List[Tuple[int, ...]]): The guesses made on the board so far.
+        number_of_colors (int): The number of colors in the game.
+        number_of_dots (int): The number of dots in each combination.
+
+    Returns:
+        np.ndarray: The sorted indices of the representative guesses.
+    """
+    classes = _position_classes(guesses, number_of_dots)
+    used = np.zeros(number_of_colors, dtype=bool)
+    for guess in guesses:
+        used[np.array(guess) - 1] = True
+
+    # Each color is described by how often it appears in each class of positions
+    codes = decode_codes(guess_indices, number_of_colors, number_of_dots)
+    base = (number_of_dots + 1) ** np.arange(classes.max() + 1, dtype=np.int64)
+    signature = np.zeros((len(codes), number_of_colors), dtype=np.int64)
+    rows = np.arange(len(codes))
+    for position in range(number_of_dots):
+        signature[rows, codes[:, position] - 1] += base[classes[position]]
+
+    # Unused colors are interchangeable, so only their multiset of counts matters
+    signature[:, ~used] = np.sort(signature[:, ~used], axis=1)
+
+    _, first = np.unique(_row_keys(signature), return_index=True)
+    return guess_indices[np.sort(first)]
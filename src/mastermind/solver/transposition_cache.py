@@ -0,0 +1,145 @@
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from mastermind.storage.persistent_cache import PersistentCacheManager
+
+
+class TranspositionCache:
+    """
+    Remembers the move the solver computed for each set of candidates, for a (number_of_colors, number_of_dots, strategy) combination.
+
+    Different board histories often leave the same candidates, and the exhaustive move only depends on them, so it is computed once and looked up afterwards. Entries are keyed by a fingerprint of the sorted candidate indices and evicted least recently used first once the cache is full.
+
+    Args:
+        number_of_colors (int): The number of colors in the game.
+        number_of_dots (int): The number of dots in each combination.
+        strategy (str): The name of the scoring strategy the moves were computed with.
+        max_size (int): The maximum number of moves kept.
+        persistent (bool): Whether to load the cache from, and store it through, PersistentCacheManager.
+    """
+
+    _caches: Dict[str, "TranspositionCache"] = {}  # Caches used by this process, by key
+
+    def __init__(
+        self,
+        number_of_colors: int,
+        number_of_dots: int,
+        strategy: str,
+        max_size: int = 4096,
+        persistent: bool = False,
+    ) -> None:
+        self.NUMBER_OF_COLORS = number_of_colors
+        self.NUMBER_OF_DOTS = number_of_dots
+        self.STRATEGY = strategy
+        self.key = self._key(number_of_colors, number_of_dots, strategy)
+        self.max_size = max_size
+        self.persistent = persistent
+        self.hits = 0
+        self.misses = 0
+        self._moves: "OrderedDict[bytes, Tuple[int, float]]" = OrderedDict(
+            (persistent and PersistentCacheManager.__getattr__(self.key)) or {}
+        )
+        self._evict()
+
+    @staticmethod
+    def _key(number_of_colors: int, number_of_dots: int, strategy: str) -> str:
+        """
+        Returns the PersistentCacheManager key of the given combination.
+        """
+        return f"transposition_{number_of_colors}x{number_of_dots}_{strategy}"
+
+    @classmethod
+    def get(
+        cls,
+        number_of_colors: int,
+        number_of_dots: int,
+        strategy: str,
+        max_size: int = 4096,
+        persistent: bool = False,
+    ) -> "TranspositionCache":
+        """
+        Returns the cache of the given combination shared by the solvers of this process, creating it on first use.
+
+        The cache takes the size and persistence of the latest request, and loads the stored moves when persistence is turned on.
+        """
+        cache = cls._caches.get(cls._key(number_of_colors, number_of_dots, strategy))
+        if cache is None:
+            cache = cls(
+                number_of_colors, number_of_dots, strategy, max_size, persistent
+            )
+            cls._caches[cache.key] = cache
+        elif persistent and not cache.persistent:
+            stored = PersistentCacheManager.__getattr__(cache.key) or {}
+            for fingerprint, move in stored.items():
+                cache._moves.setdefault(fingerprint, move)
+        cache.max_size = max_size
+        cache.persistent = persistent
+        cache._evict()
+        return cache
+
+    @staticmethod
+    def fingerprint(indices: np.ndarray) -> bytes:
+        """
+        Returns a 128-bit hash of a sorted array of candidate indices.
+        """
+        data = np.ascontiguousarray(indices, dtype=np.int64).tobytes()
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of moves stored in the cache.
+        """
+        return len(self._moves)
+
+    def lookup(self, indices: np.ndarray) -> Optional[Tuple[int, float]]:
+        """
+        Returns the move stored for the given candidates, if any, and counts the hit or miss.
+
+        Args:
+            indices (np.ndarray): The sorted indices of the candidates.
+
+        Returns:
+            Optional[Tuple[int, float]]: The index of the guess and its score, or None if the candidates are not in the cache.
+        """
+        fingerprint = self.fingerprint(indices)
+        move = self._moves.get(fingerprint)
+        if move is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._moves.move_to_end(fingerprint)
+        return move
+
+    def store(self, indices: np.ndarray, guess_index: int, score: float) -> None:
+        """
+        Stores the move computed for the given candidates, evicting the least recently used moves beyond max_size, and persists the cache if enabled.
+
+        Args:
+            indices (np.ndarray): The sorted indices of the candidates.
+            guess_index (int): The index of the chosen guess.
+            score (float): The score of the chosen guess.
+        """
+        fingerprint = self.fingerprint(indices)
+        self._moves[fingerprint] = (int(guess_index), float(score))
+        self._moves.move_to_end(fingerprint)
+        self._evict()
+        if self.persistent:
+            PersistentCacheManager.set(self.key, dict(self._moves))
+
+    def _evict(self) -> None:
+        """
+        Drops the least recently used moves beyond max_size.
+        """
+        while len(self._moves) > self.max_size:
+            self._moves.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Forgets every move and resets the hit and miss counters.
+        """
+        self._moves.clear()
+        self.hits = self.misses = 0
@@ -1,4 +1,11 @@
+from mastermind.storage.feedback_table import FeedbackTableManager
+from mastermind.storage.game_database import GameDatabase
 from mastermind.storage.persistent_cache import PersistentCacheManager
 from mastermind.storage.user_data import UserDataManager
 
-__all__ = ["PersistentCacheManager", "UserDataManager"]
+__all__ = [
+    "FeedbackTableManager",
+    "GameDatabase",
+    "PersistentCacheManager",
+    "UserDataManager",
+]
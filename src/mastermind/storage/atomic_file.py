@@ -0,0 +1,71 @@
+import os
+import shutil
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, List
+
+
+def backup_paths(file_path: str, backups: int) -> List[str]:
+    """Returns the paths of the rotating backups of a file, most recent first."""
+    return [f"{file_path}.{number}" for number in range(1, backups + 1)]
+
+
+def _rotate_backups(file_path: str, backups: int) -> None:
+    """
+    Shifts the backups of the file by one and keeps its current version as the most recent backup.
+
+    The current version is hard-linked rather than moved, so the file itself stays in place until it is replaced.
+    """
+
+    paths = backup_paths(file_path, backups)
+    for older, newer in zip(reversed(paths[1:]), reversed(paths[:-1])):
+        if os.path.exists(newer):
+            os.replace(newer, older)
+    if os.path.exists(paths[0]):
+        os.remove(paths[0])
+    try:
+        os.link(file_path, paths[0])
+    except OSError:  # hard links are not supported by every file system
+        shutil.copy2(file_path, paths[0])
+
+
+def _fsync_directory(directory: str) -> None:
+    """Flushes a directory entry to disk, so that a rename in it survives a power loss."""
+    try:
+        descriptor = os.open(directory, os.O_RDONLY)
+    except OSError:  # directories cannot be opened on Windows
+        return
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+@contextmanager
+def atomic_open(file_path: str, backups: int = 0) -> Iterator[BinaryIO]:
+    """
+    Opens a temporary file to be written, that replaces the given file once the block exits.
+
+    The temporary file is flushed and fsynced, then renamed over the file with os.replace, which is atomic: a crash or a kill at any point leaves either the old or the new file, never a partial one. If the block raises, the temporary file is removed and the file is left untouched.
+
+    Args:
+        file_path (str): The path of the file to write.
+        backups (int): The number of previous versions to keep as file_path.1 (the most recent) to file_path.{backups}.
+
+    Yields:
+        BinaryIO: The temporary file, opened for binary writing.
+    """
+
+    temp_path = f"{file_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "wb") as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        if backups and os.path.exists(file_path):
+            _rotate_backups(file_path, backups)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    _fsync_directory(os.path.dirname(file_path) or ".")
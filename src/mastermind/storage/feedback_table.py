@@ -0,0 +1,133 @@
+import glob
+import os
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from mastermind.storage.persistent_cache import PersistentCacheManager
+from mastermind.utils.code_codec import decode_codes
+from mastermind.utils.get_feedback import feedback_dtype, generate_feedback_matrix
+
+
+class FeedbackTableManager:
+    """
+    Builds, persists and memory-maps the full feedback lookup table for a game dimension.
+
+    The table of a (number_of_colors, number_of_dots) dimension is a square array where entry [i, j] is the encoded feedback of the code with index i guessed against the code with index j. It is stored as a .npy file next to the PersistentCacheManager cache files and memory-mapped read-only on later runs, so that every process using the same dimension shares one copy through the page cache.
+    """
+
+    _max_codes = 32768  # Largest code space to tabulate (8x5 takes 1 GiB on disk)
+    _tables: Dict[Tuple[int, int], np.ndarray] = {}  # Tables mapped by this process
+
+    @classmethod
+    def _get_table_file_path(cls, number_of_colors: int, number_of_dots: int) -> str:
+        """
+        Returns the file path of the feedback table for the given dimension.
+
+        Args:
+            number_of_colors (int): The number of colors in the game.
+            number_of_dots (int): The number of dots in each combination.
+
+        Returns:
+            str: The file path of the feedback table.
+        """
+        return os.path.join(
+            PersistentCacheManager._cache_directory,
+            f"feedback_{number_of_colors}x{number_of_dots}.npy",
+        )
+
+    @classmethod
+    def supports(cls, number_of_colors: int, number_of_dots: int) -> bool:
+        """
+        Checks whether the code space of the given dimension is small enough to tabulate.
+        """
+        return number_of_colors**number_of_dots <= cls._max_codes
+
+    @classmethod
+    def build_table(cls, number_of_colors: int, number_of_dots: int) -> str:
+        """
+        Computes the feedback table for the given dimension and writes it to disk.
+
+        The table is written chunk by chunk into a temporary file that is renamed into place once complete, so concurrent readers never see a partial table.
+
+        Args:
+            number_of_colors (int): The number of colors in the game.
+            number_of_dots (int): The number of dots in each combination.
+
+        Returns:
+            str: The file path of the feedback table.
+
+        Raises:
+            ValueError: If the code space is too large to tabulate.
+        """
+        if not cls.supports(number_of_colors, number_of_dots):
+            raise ValueError(
+                f"A {number_of_colors}x{number_of_dots} feedback table exceeds {cls._max_codes} codes"
+            )
+
+        PersistentCacheManager._ensure_directory_exists()
+        file_path = cls._get_table_file_path(number_of_colors, number_of_dots)
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+
+        codes = decode_codes(
+            np.arange(number_of_colors**number_of_dots),
+            number_of_colors,
+            number_of_dots,
+        )
+        table = np.lib.format.open_memmap(
+            temp_path,
+            mode="w+",
+            dtype=feedback_dtype(number_of_dots),
+            shape=(len(codes), len(codes)),
+        )
+        step = max(1, (1 << 24) // len(codes))  # rows per chunk
+        for start in range(0, len(codes), step):
+            table[start : start + step] = generate_feedback_matrix(
+                codes[start : start + step], codes, number_of_colors
+            )
+        table.flush()
+        del table  # close the memory map before renaming
+
+        os.replace(temp_path, file_path)
+        return file_path
+
+    @classmethod
+    def get_table(
+        cls, number_of_colors: int, number_of_dots: int, build: bool = True
+    ) -> Optional[np.ndarray]:
+        """
+        Returns the read-only, memory-mapped feedback table for the given dimension.
+
+        Args:
+            number_of_colors (int): The number of colors in the game.
+            number_of_dots (int): The number of dots in each combination.
+            build (bool): Whether to build the table if it is not on disk yet.
+
+        Returns:
+            Optional[np.ndarray]: The feedback table, or None if the code space is too large to tabulate or the table is missing and build is False.
+        """
+        key = (number_of_colors, number_of_dots)
+        if key in cls._tables:
+            return cls._tables[key]
+
+        if not cls.supports(number_of_colors, number_of_dots):
+            return None
+
+        file_path = cls._get_table_file_path(number_of_colors, number_of_dots)
+        if not os.path.exists(file_path):
+            if not build:
+                return None
+            cls.build_table(number_of_colors, number_of_dots)
+
+        cls._tables[key] = np.load(file_path, mmap_mode="r")
+        return cls._tables[key]
+
+    @classmethod
+    def clear_tables(cls) -> None:
+        """Forgets the mapped tables and deletes every feedback table file."""
+        cls._tables.clear()
+        pattern = os.path.join(
+            PersistentCacheManager._cache_directory, "feedback_*.npy"
+        )
+        for table_file in glob.glob(pattern):
+            os.remove(table_file)
@@ -0,0 +1,317 @@
+import pickle
+import sqlite3
+from collections.abc import MutableSequence
+from typing import Any, Iterable, Iterator, List, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    game_mode TEXT NOT NULL,
+    number_of_colors INTEGER NOT NULL,
+    number_of_dots INTEGER NOT NULL,
+    amount_attempted INTEGER NOT NULL,
+    amount_allowed INTEGER NOT NULL,
+    win_status INTEGER,
+    meta_data BLOB NOT NULL,
+    game BLOB
+);
+CREATE INDEX IF NOT EXISTS games_game_mode ON games (game_mode);
+CREATE INDEX IF NOT EXISTS games_dimension ON games (number_of_colors, number_of_dots);
+CREATE INDEX IF NOT EXISTS games_win_status ON games (win_status);
+"""
+
+LISTING_COLUMNS = (
+    "game_mode",
+    "number_of_colors",
+    "number_of_dots",
+    "amount_attempted",
+    "amount_allowed",
+    "win_status",
+)  # The meta data fields that are stored as indexed columns
+
+
+class SavedGames(MutableSequence):
+    """
+    The list of saved game meta data, stored as one row per game of a GameDatabase.
+
+    The list supports the operations of a Python list, so it can replace the pickled list of saved games. Each row keeps the listing fields as columns, the rest of the meta data as a pickle, and a Game object stored inline by earlier versions as a separate pickle, so listings and filters are SQL queries that never unpickle a game.
+
+    The row ids are kept dense, so the game at position i is the row with id i + 1: reading, replacing, appending and popping the last game are primary key lookups. Inserting or deleting a game elsewhere only renumbers the rows after it.
+
+    Args:
+        connection (sqlite3.Connection): The connection to the database.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+        self._renumber()
+
+    def _renumber(self) -> None:
+        """
+        Makes the row ids dense again if they have gaps, as left by earlier versions.
+        """
+
+        ids = [
+            row_id
+            for (row_id,) in self._connection.execute(
+                "SELECT id FROM games ORDER BY id"
+            )
+        ]
+        if not ids or ids[-1] == len(ids):
+            return
+        with self._connection:
+            self._connection.execute("UPDATE games SET id = -id")
+            self._connection.executemany(
+                "UPDATE games SET id = ? WHERE id = ?",
+                [(position, -row_id) for position, row_id in enumerate(ids, 1)],
+            )
+
+    def _id(self, index: int) -> int:
+        """
+        Returns the row id of the game at the given position.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("saved game index out of range")
+        return index + 1
+
+    def _shift(self, first_id: int, offset: int) -> None:
+        """
+        Adds offset to the ids of the rows from first_id on, in two passes that keep the primary key unique.
+        """
+
+        self._connection.execute(
+            "UPDATE games SET id = -(id + ?) WHERE id >= ?", (offset, first_id)
+        )
+        self._connection.execute("UPDATE games SET id = -id WHERE id < 0")
+
+    @staticmethod
+    def _row(meta_data: dict) -> tuple:
+        """
+        Returns the column values storing the given meta data.
+        """
+
+        win_status = meta_data["win_status"]
+        rest = {key: value for key, value in meta_data.items() if key != "game"}
+        game = meta_data.get("game")
+        return (
+            *(meta_data[column] for column in LISTING_COLUMNS[:-1]),
+            None if win_status is None else int(win_status),
+            pickle.dumps(rest),
+            None if game is None else pickle.dumps(game),
+        )
+
+    def __len__(self) -> int:
+        """Returns the number of saved games, which is the largest row id."""
+        return self._connection.execute(
+            "SELECT COALESCE(MAX(id), 0) FROM games"
+        ).fetchone()[0]
+
+    def __getitem__(self, index: Any) -> Any:
+        """Returns the meta data of the game at the given position, including its Game object."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+
+        meta_data, game = self._connection.execute(
+            "SELECT meta_data, game FROM games WHERE id = ?", (self._id(index),)
+        ).fetchone()
+        meta_data = pickle.loads(meta_data)
+        if game is not None:
+            meta_data["game"] = pickle.loads(game)
+        return meta_data
+
+    def __iter__(self) -> Iterator[dict]:
+        """Yields the meta data of every game in order, reading the table once."""
+        for meta_data, game in self._connection.execute(
+            "SELECT meta_data, game FROM games ORDER BY id"
+        ).fetchall():
+            meta_data = pickle.loads(meta_data)
+            if game is not None:
+                meta_data["game"] = pickle.loads(game)
+            yield meta_data
+
+    def __setitem__(self, index: int, meta_data: dict) -> None:
+        """Replaces the meta data of the game at the given position."""
+        columns = ", ".join(
+            f"{column} = ?" for column in (*LISTING_COLUMNS, "meta_data", "game")
+        )
+        with self._connection:
+            self._connection.execute(
+                f"UPDATE games SET {columns} WHERE id = ?",
+                (*self._row(meta_data), self._id(index)),
+            )
+
+    def __delitem__(self, index: int) -> None:
+        """Deletes the game at the given position, moving the later games back by one."""
+        row_id = self._id(index)
+        with self._connection:
+            self._connection.execute("DELETE FROM games WHERE id = ?", (row_id,))
+            if row_id <= len(self):  # not the last game
+                self._shift(row_id + 1, -1)
+
+    def insert(self, index: int, meta_data: dict) -> None:
+        """Inserts a game before the given position, moving the later games on by one."""
+        length = len(self)
+        index = max(0, min(index + length if index < 0 else index, length))
+        row_id = index + 1
+        with self._connection:
+            if index < length:
+                self._shift(row_id, 1)
+            self._connection.execute(
+                f"INSERT INTO games (id, {', '.join(LISTING_COLUMNS)}, meta_data, game)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (row_id, *self._row(meta_data)),
+            )
+
+    def replace(self, games: Iterable[dict]) -> None:
+        """Replaces every saved game with the given meta data, in one transaction."""
+        rows = [self._row(meta_data) for meta_data in games]  # games may be self
+        with self._connection:
+            self._connection.execute("DELETE FROM games")
+            self._connection.executemany(
+                f"INSERT INTO games (id, {', '.join(LISTING_COLUMNS)}, meta_data, game)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(row_id, *row) for row_id, row in enumerate(rows, 1)],
+            )
+
+    @staticmethod
+    def _conditions(
+        continuable_only: bool,
+        game_mode: Optional[str],
+        number_of_colors: Optional[int],
+        number_of_dots: Optional[int],
+    ) -> tuple:
+        """
+        Returns the WHERE clause and parameters selecting the matching games.
+        """
+
+        conditions, parameters = [], []
+        if continuable_only:
+            conditions.append("win_status IS NULL")
+        for column, value in (
+            ("game_mode", game_mode),
+            ("number_of_colors", number_of_colors),
+            ("number_of_dots", number_of_dots),
+        ):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                parameters.append(value)
+        clause = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return clause, parameters
+
+    def listing(
+        self,
+        continuable_only: bool = False,
+        game_mode: Optional[str] = None,
+        number_of_colors: Optional[int] = None,
+        number_of_dots: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        Returns the listing fields of the matching games, in order, without loading their guesses or Game objects.
+
+        Args:
+            continuable_only (bool): Whether to keep only the games that are not finished.
+            game_mode (Optional[str]): The game mode to keep, None for every mode.
+            number_of_colors (Optional[int]): The number of colors to keep, None for every dimension.
+            number_of_dots (Optional[int]): The number of dots to keep, None for every dimension.
+
+        Returns:
+            List[dict]: One dictionary of the LISTING_COLUMNS fields per game.
+        """
+
+        clause, parameters = self._conditions(
+            continuable_only, game_mode, number_of_colors, number_of_dots
+        )
+        rows = self._connection.execute(
+            f"SELECT {', '.join(LISTING_COLUMNS)} FROM games{clause} ORDER BY id",
+            parameters,
+        )
+        return [
+            {
+                **dict(zip(LISTING_COLUMNS, row)),
+                "win_status": None if row[-1] is None else bool(row[-1]),
+            }
+            for row in rows
+        ]
+
+    def continuable_indices(self) -> List[int]:
+        """
+        Returns the positions of the games that are not finished.
+        """
+
+        rows = self._connection.execute(
+            "SELECT id - 1 FROM games WHERE win_status IS NULL ORDER BY id"
+        )
+        return [position for (position,) in rows]
+
+
+class GameDatabase:
+    """
+    Stores the user data in a SQLite database.
+
+    The saved games are rows of the games table, exposed as the SavedGames list. Every other key is pickled into its own row of the items table, so setting a key writes that key only.
+
+    Args:
+        file_path (str): The path of the database file, created if it does not exist.
+    """
+
+    GAMES_KEY = "saved_games"  # The user data key stored in the games table
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+        self._connection = sqlite3.connect(file_path, check_same_thread=False)
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+        self.saved_games = SavedGames(self._connection)
+
+    def load_items(self) -> dict:
+        """Returns every key of the items table with its value."""
+        return {
+            key: pickle.loads(value)
+            for key, value in self._connection.execute("SELECT key, value FROM items")
+        }
+
+    def set_item(self, key: str, value: Any) -> None:
+        """Stores the value of the given key, in the games table for GAMES_KEY."""
+        if key == self.GAMES_KEY:
+            self.saved_games.replace(value or [])
+            return
+
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO items (key, value) VALUES (?, ?)",
+                (key, pickle.dumps(value)),
+            )
+
+    def import_data(self, data: dict) -> None:
+        """Replaces the whole content of the database with the given user data."""
+        self.clear()
+        for key, value in data.items():
+            self.set_item(key, value)
+
+    def export_data(self) -> dict:
+        """Returns the whole content of the database as a user data dictionary."""
+        data = self.load_items()
+        if len(self.saved_games):
+            data[self.GAMES_KEY] = list(self.saved_games)
+        return data
+
+    def clear(self) -> None:
+        """Deletes every item and every saved game."""
+        with self._connection:
+            self._connection.execute("DELETE FROM items")
+            self._connection.execute("DELETE FROM games")
+
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        self._connection.close()
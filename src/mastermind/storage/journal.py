@@ -0,0 +1,82 @@
+import hashlib
+import os
+import pickle
+from typing import List
+
+from mastermind.storage.tracked_list import apply_change
+
+
+def snapshot_id(snapshot: bytes) -> bytes:
+    """Returns the identifier of a pickled snapshot, which tags the journal extending it."""
+    return hashlib.blake2b(snapshot, digest_size=16).digest()
+
+
+def append_records(file_path: str, records: List[tuple], snapshot: bytes) -> None:
+    """
+    Appends changes to the journal file.
+
+    Each record is separately pickled, so a write costs the size of the changes only. A (key, value) record sets a key, and a (None, None) record clears every key. A (key, operation, index, value) record applies a change reported by a TrackedList to the list of the key. A new journal starts with the identifier of the snapshot its records extend (see snapshot_id). The records are fsynced together before returning, and a record torn by a crash is dropped by replay_journal.
+
+    Args:
+        file_path (str): The path of the journal file.
+        records (List[tuple]): The records to append, in order.
+        snapshot (bytes): The identifier of the snapshot the journal extends.
+    """
+
+    with open(file_path, "ab") as file:
+        if file.tell() == 0:
+            pickle.dump(snapshot, file)
+        for record in records:
+            pickle.dump(record, file)
+        file.flush()
+        os.fsync(file.fileno())
+
+
+def replay_journal(file_path: str, data: dict, snapshot: bytes) -> int:
+    """
+    Applies the records of the journal file to the given dictionary, in order.
+
+    The records are only applied if the journal extends the given snapshot. A journal tagged with another snapshot was already folded into a newer one by a write that crashed before deleting it; replaying it could overwrite newer values or clear newer keys, so it is deleted instead. A record torn by a crash mid-append is cut off the end of the file.
+
+    Args:
+        file_path (str): The path of the journal file.
+        data (dict): The dictionary loaded from the snapshot, modified in place.
+        snapshot (bytes): The identifier of that snapshot (see snapshot_id).
+
+    Returns:
+        int: The number of records applied.
+    """
+
+    if not os.path.exists(file_path):
+        return 0
+
+    records = 0
+    with open(file_path, "r+b") as file:
+        try:
+            stale = pickle.load(file) != snapshot
+        except (EOFError, pickle.UnpicklingError):
+            stale = True  # torn before its first record
+        while not stale:
+            offset = file.tell()
+            try:
+                key, *change = pickle.load(file)
+            except (EOFError, pickle.UnpicklingError):
+                file.truncate(offset)  # drop a torn record, if any
+                return records
+
+            if key is None:
+                data.clear()
+            elif len(change) == 1:
+                data[key] = change[0]
+            else:
+                apply_change(data[key], tuple(change))
+            records += 1
+
+    remove_journal(file_path)
+    return 0
+
+
+def remove_journal(file_path: str) -> None:
+    """Deletes the journal file once its records are part of a snapshot."""
+    if os.path.exists(file_path):
+        os.remove(file_path)
@@ -3,6 +3,8 @@ import os
 import pickle
 from typing import Any
 
+from mastermind.storage.atomic_file import atomic_open
+
 
 class PersistentCacheManager:
     """
@@ -10,7 +12,7 @@ class PersistentCacheManager:
 
     The PersistentCacheManager class provides a simple interface for caching and retrieving data, using the pickle module to serialize and deserialize the objects.
 
-    The cache files are stored in the "data" directory, which is created automatically if it does not exist.
+    The cache files are stored in the "data" directory, which is created automatically if it does not exist. They are written atomically, so a crash mid-write never leaves a partial cache file.
     """
 
     _cache_directory = "data"  # Directory to store cache files
@@ -72,5 +74,6 @@ class PersistentCacheManager:
             Any: The cached value.
         """
 
-        with open(cls._get_cache_file_path(key), "wb") as file:
+        cls._ensure_directory_exists()
+        with atomic_open(cls._get_cache_file_path(key)) as file:
             pickle.dump(value, file)
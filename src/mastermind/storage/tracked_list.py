@@ -0,0 +1,90 @@
+from collections.abc import MutableSequence
+from typing import Any, Callable, Iterator, Optional
+
+
+class TrackedList(MutableSequence):
+    """
+    A view of a list of the user data that reports every change made through it.
+
+    Each change is reported to on_change as a (operation, index, value) tuple, with the index made non-negative: ("insert", index, value), ("set", index, value) or ("delete", index, None). Changes through slices are reported as None, which means the whole list must be written again. The changes can be applied to a copy of the list with apply_change.
+
+    Args:
+        items (list): The list to change.
+        on_change (Callable[[Optional[tuple]], None]): Called after each change.
+    """
+
+    def __init__(
+        self, items: list, on_change: Callable[[Optional[tuple]], None]
+    ) -> None:
+        self._items = items
+        self._on_change = on_change
+
+    def _index(self, index: int) -> int:
+        """
+        Returns the non-negative position of an index.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        return range(len(self._items))[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._items[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items)
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            self._items[index] = value
+            self._on_change(None)
+            return
+
+        index = self._index(index)
+        self._items[index] = value
+        self._on_change(("set", index, value))
+
+    def __delitem__(self, index: Any) -> None:
+        if isinstance(index, slice):
+            del self._items[index]
+            self._on_change(None)
+            return
+
+        index = self._index(index)
+        del self._items[index]
+        self._on_change(("delete", index, None))
+
+    def insert(self, index: int, value: Any) -> None:
+        length = len(self._items)
+        index = max(0, min(index + length if index < 0 else index, length))
+        self._items.insert(index, value)
+        self._on_change(("insert", index, value))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, TrackedList):
+            other = other._items
+        return self._items == other
+
+    def __repr__(self) -> str:
+        return repr(self._items)
+
+
+def apply_change(items: list, change: tuple) -> None:
+    """
+    Applies a change reported by a TrackedList to a list.
+
+    Args:
+        items (list): The list to change, in the state the change was made to.
+        change (tuple): The (operation, index, value) change.
+    """
+
+    operation, index, value = change
+    if operation == "insert":
+        items.insert(index, value)
+    elif operation == "set":
+        items[index] = value
+    else:
+        del items[index]
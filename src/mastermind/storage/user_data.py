@@ -1,6 +1,22 @@
+import atexit
 import os
 import pickle
-from typing import Any
+import shutil
+import threading
+import uuid
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional
+
+from mastermind.storage.atomic_file import atomic_open, backup_paths
+from mastermind.storage.game_database import GameDatabase
+from mastermind.storage.journal import (
+    append_records,
+    remove_journal,
+    replay_journal,
+    snapshot_id,
+)
+from mastermind.storage.tracked_list import TrackedList
 
 
 class UserDataManager:
@@ -10,11 +26,53 @@ class UserDataManager:
     The UserDataManager class stores user data in a dictionary and persists it to a file on the file system using the pickle module.
 
     The class is implemented as a singleton, ensuring that there is only one instance of the UserDataManager class.
+
+    In the default "pickle" storage mode, every change re-pickles the whole dictionary. In the "journal" mode, each change is instead appended to a journal file next to the data file, and a background thread folds the journal into a new snapshot once it holds enough records, so a write costs the size of the changed value rather than of all the user data. Either mode reads the data written by the other.
+
+    In the "sqlite" mode, the data is stored in a GameDatabase next to the data file, which imports the pickled data when it is first created. The saved games are then one indexed row each, and "saved_games" is a SavedGames list that reads and writes its rows directly.
+
+    Large objects that are only needed on demand, such as the Game of an unfinished game, are kept out of the user data as payloads: each is pickled to its own file in the "games" directory next to the data file, whatever the storage mode, and only its key is stored with the user data.
+
+    Changes are not written immediately: a background thread flushes them once, _flush_delay seconds after the first change, so a burst of updates costs one write. Lists are handed out as TrackedList views that report each change made inside them, such as appending to "saved_games", so the journal records that change alone rather than the whole list. Changes made inside other mutable values must be reported with mark_dirty. Call flush to write the changes at once, or group updates in a transaction. Pending changes are flushed when the program exits.
+
+    Files are written atomically (see atomic_open), so a crash mid-write leaves the previous version in place, and the previous data file is kept as a backup that is loaded if the data file cannot be.
     """
 
+    STORAGE_MODES = ("pickle", "journal", "sqlite")
+    _ATTRIBUTES = {
+        "_instance",
+        "_data",
+        "_file_path",
+        "_storage_mode",
+        "_compaction_threshold",
+        "_journal_records",
+        "_snapshot_id",
+        "_compactor",
+        "_database",
+        "_changed",
+        "_list_changes",
+        "_flusher",
+        "_flush_delay",
+        "_transaction_depth",
+        "_backup_count",
+    }  # Names set on the instance rather than stored as user data
+
     _instance = None  # Class-level attribute for the singleton instance
     _data = {}  # Dictionary to hold user data
     _file_path = "data/userdata.config"  # Path to the user data file
+    _storage_mode = "pickle"  # How changes are written, one of STORAGE_MODES
+    _compaction_threshold = 256  # Journal records that trigger a compaction
+    _journal_records = 0  # Records in the journal since the last snapshot
+    _snapshot_id = snapshot_id(b"")  # Identifier of the loaded or last written snapshot
+    _compactor = None  # Background thread writing the current snapshot
+    _database = None  # The GameDatabase of the "sqlite" mode
+    _changed = set()  # Keys to write whole since the last write
+    _list_changes: Dict[str, List[tuple]] = {}  # Changes to lists since the last write
+    _flusher = None  # Timer thread of the next background flush
+    _flush_delay = 1.0  # Seconds between the first change and its flush
+    _transaction_depth = 0  # Number of open transactions
+    _backup_count = 1  # Previous versions of the data file kept as backups
+    _lock = threading.RLock()  # Serializes writes with the background threads
 
     def __new__(cls) -> "UserDataManager":
         """
@@ -26,6 +84,7 @@ class UserDataManager:
         if cls._instance is None:
             cls._instance = super(UserDataManager, cls).__new__(cls)
             cls._instance._load_data()  # Load data on instantiation
+            atexit.register(cls._instance.flush)  # Write what is still pending
         return cls._instance
 
     @classmethod
@@ -36,21 +95,115 @@ class UserDataManager:
         else:
             raise ValueError("cls._file_path must include a directory component")
 
+    @classmethod
+    def _journal_path(cls) -> str:
+        """Returns the path of the journal file, next to the data file."""
+        return f"{cls._file_path}.journal"
+
+    @classmethod
+    def _database_path(cls) -> str:
+        """Returns the path of the SQLite database, next to the data file."""
+        return f"{os.path.splitext(cls._file_path)[0]}.sqlite3"
+
+    @classmethod
+    def _payload_path(cls, key: str) -> str:
+        """Returns the path of the payload file of the given key."""
+        return os.path.join(os.path.dirname(cls._file_path), "games", f"{key}.game")
+
+    @classmethod
+    def save_payload(cls, value: Any, key: Optional[str] = None) -> str:
+        """
+        Pickles a value to its own payload file, outside of the user data.
+
+        Args:
+            value (Any): The value to store.
+            key (Optional[str]): The key of the payload to overwrite, None to create a new one.
+
+        Returns:
+            str: The key to load the payload with.
+        """
+
+        key = key or uuid.uuid4().hex
+        path = cls._payload_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with atomic_open(path) as file:
+            pickle.dump(value, file)
+        return key
+
+    @classmethod
+    def load_payload(cls, key: str) -> Any:
+        """
+        Loads the value of the given payload key, or None if there is no such payload or it cannot be loaded.
+        """
+
+        try:
+            with open(cls._payload_path(key), "rb") as file:
+                return pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception:  # a corrupted payload or an incompatible version
+            return None
+
+    @classmethod
+    def delete_payload(cls, key: str) -> None:
+        """Deletes the payload of the given key, if it exists."""
+        if os.path.exists(path := cls._payload_path(key)):
+            os.remove(path)
+
+    @classmethod
+    def set_storage_mode(cls, mode: str) -> None:
+        """
+        Sets how changes to the user data are written.
+
+        Switching back to the "pickle" mode folds any pending journal into the data file. Switching into or out of the "sqlite" mode copies the loaded data to the new storage.
+
+        Args:
+            mode (str): One of STORAGE_MODES.
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+
+        if mode not in cls.STORAGE_MODES:
+            raise ValueError(
+                f"Unknown storage mode {mode!r}, expected one of {', '.join(cls.STORAGE_MODES)}"
+            )
+        instance = cls._instance
+        if instance is not None:
+            instance.flush()
+        if instance is not None and instance._database is not None and mode != "sqlite":
+            with cls._lock:
+                data = instance._database.export_data()
+                instance._database.close()
+                instance._database = None
+                instance._data = data
+
+        previous, cls._storage_mode = cls._storage_mode, mode
+        if instance is None:
+            return
+        if mode == "sqlite" and instance._database is None:
+            with cls._lock:
+                instance._database = GameDatabase(cls._database_path())
+                instance._database.import_data(instance._data)
+                instance._data = instance._database.load_items()
+        elif mode == "pickle" or previous == "sqlite":
+            instance.save_data()
+
     def _load_data(self) -> None:  # sourcery skip: extract-duplicate-method
         """
         Loads the user data from the file.
 
-        If the file does not exist, an empty dictionary is used as the initial user data.
+        If the file does not exist, an empty dictionary is used as the initial user data. The records of a journal left by the "journal" storage mode are then replayed over it. In the "sqlite" mode, the data is read from the database instead.
         """
 
         self._ensure_directory_exists()  # Ensure the directory is created
+        self._changed, self._list_changes = set(), {}
         try:
-            with open(self._file_path, "rb") as file:
-                self._data = pickle.load(file)
+            if self._storage_mode == "sqlite":
+                self._load_database()
                 return
 
-        except FileNotFoundError:  # on first run
-            self._data = {}
+            self._data = self._read_data_file()
             return
 
         except EOFError as e:
@@ -73,16 +226,206 @@ class UserDataManager:
                 "Data could not be loaded."
             )  # sourcery skip: raise-specific-error
 
+    def _read_data_file(self) -> dict:
+        """
+        Returns the pickled user data with the journal replayed over it, or an empty dictionary on first run.
+
+        If the data file cannot be loaded, the most recent backup that can is used instead, and the original error is raised if there is none.
+        """
+
+        try:
+            with open(self._file_path, "rb") as file:
+                snapshot = file.read()
+            data = pickle.loads(snapshot)
+        except FileNotFoundError:  # on first run
+            snapshot, data = b"", {}
+        except Exception:
+            snapshot = self._read_backup()
+            if snapshot is None:
+                raise
+            data = pickle.loads(snapshot)
+
+        self._snapshot_id = snapshot_id(snapshot)
+        self._journal_records = replay_journal(
+            self._journal_path(), data, self._snapshot_id
+        )
+        return data
+
+    def _read_backup(self) -> Optional[bytes]:
+        """
+        Returns the pickled data of the most recent backup that can be loaded, or None if there is none.
+        """
+
+        for path in backup_paths(self._file_path, self._backup_count):
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, "rb") as file:
+                    snapshot = file.read()
+                pickle.loads(snapshot)
+            except Exception:
+                continue
+            print(f"The stored data could not be loaded, restored it from {path}.")
+            return snapshot
+        return None
+
+    def _load_database(self) -> None:
+        """
+        Opens the SQLite database, importing the pickled user data if the database is new.
+        """
+
+        if self._database is not None:
+            self._database.close()
+        path = self._database_path()
+        is_new = not os.path.exists(path)
+        self._database = GameDatabase(path)
+        if is_new:
+            self._database.import_data(self._read_data_file())
+        self._data = self._database.load_items()
+
     def save_data(self) -> None:
-        """Saves the user data to the file."""
-        self._ensure_directory_exists()  # Ensure the directory is created
-        with open(self._file_path, "wb") as file:
-            pickle.dump(self._data, file)
+        """
+        Saves the user data to the file, which then replaces the journal, or to the database in the "sqlite" mode.
+
+        The journal is deleted after the snapshot is written. If a crash comes in between, the journal is still tagged with the previous snapshot, so loading ignores it rather than replaying its older records over the new snapshot.
+        """
+        with self._lock:
+            if self._database is not None:
+                for key, value in self._data.items():
+                    self._database.set_item(key, value)
+            else:
+                self._ensure_directory_exists()  # Ensure the directory is created
+                snapshot = pickle.dumps(self._data)
+                with atomic_open(self._file_path, self._backup_count) as file:
+                    file.write(snapshot)
+                self._snapshot_id = snapshot_id(snapshot)
+                remove_journal(self._journal_path())
+                self._journal_records = 0
+            self._changed.clear()
+            self._list_changes.clear()
+
+    def flush(self) -> None:
+        """
+        Writes the keys changed since the last write, including the changes made inside the lists handed out.
+
+        In the "pickle" mode the whole data file is rewritten. In the "journal" mode, the changes made inside lists are appended one by one, so they cost the size of the change only, and the other changed keys are appended whole. In the "sqlite" mode, each changed key is written whole.
+        """
+
+        with self._lock:
+            if self._flusher is not None:
+                self._flusher.cancel()
+                self._flusher = None
+
+            if not self._changed and not self._list_changes:
+                return
+
+            if self._database is not None:
+                for key in [*self._changed, *self._list_changes]:
+                    self._database.set_item(key, self._data[key])
+            elif self._storage_mode == "journal":
+                records = [
+                    (key, value)
+                    for key, value in self._data.items()
+                    if key in self._changed
+                ]
+                for key, changes in self._list_changes.items():
+                    records.extend((key, *change) for change in changes)
+                self._append_records(records)
+            else:
+                self.save_data()
+                return
+            self._changed.clear()
+            self._list_changes.clear()
+
+    def mark_dirty(self, key: str) -> None:
+        """
+        Schedules writing a key whole, after a change made inside its value.
+
+        Changes made through the TrackedList of a list are reported by the list itself.
+
+        Args:
+            key (str): The key whose value was changed in place.
+        """
+
+        with self._lock:
+            if key in self._data:
+                self._changed.add(key)
+                self._list_changes.pop(key, None)
+                self._schedule_flush()
+
+    def _record_list_change(
+        self, key: str, items: list, change: Optional[tuple]
+    ) -> None:
+        """
+        Records a change reported by the TrackedList of a key, and schedules its flush.
+
+        Changes made through a view of a list the key no longer holds are ignored.
+        """
+
+        with self._lock:
+            if self._data.get(key) is not items:
+                return
+            if change is None:
+                self.mark_dirty(key)
+                return
+            if key not in self._changed:
+                self._list_changes.setdefault(key, []).append(change)
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Starts the background flush of the pending changes, unless it is already scheduled."""
+        if self._flusher is None:
+            self._flusher = threading.Timer(self._flush_delay, self.flush)
+            self._flusher.daemon = True  # flushed at exit by the atexit hook
+            self._flusher.start()
+
+    @contextmanager
+    def transaction(self) -> Iterator["UserDataManager"]:
+        """
+        Groups updates into a single write when the outermost transaction exits.
+
+        The background flush waits for the transaction to end. Changes are written even if the block raises; they are not rolled back.
+
+        Yields:
+            UserDataManager: The manager itself.
+        """
+
+        with self._lock:
+            self._transaction_depth += 1
+            try:
+                yield self
+            finally:
+                self._transaction_depth -= 1
+                if not self._transaction_depth:
+                    self.flush()
 
     def clear_all(self) -> None:
-        """Clears all the user data and saves the changes."""
-        self._data = {}
-        self.save_data()
+        """Clears all the user data, including the payloads, and saves the changes."""
+        with self._lock:
+            shutil.rmtree(os.path.dirname(self._payload_path("")), ignore_errors=True)
+            self._data = {}
+            self._changed, self._list_changes = set(), {}
+            if self._database is not None:
+                self._database.clear()
+            elif self._storage_mode == "journal":
+                self._append_records([(None, None)])
+            else:
+                self.save_data()
+
+    def _append_records(self, records: List[tuple]) -> None:
+        """
+        Appends changes to the journal, and starts a background compaction once the journal holds enough records.
+        """
+
+        self._ensure_directory_exists()
+        append_records(self._journal_path(), records, self._snapshot_id)
+        self._journal_records += len(records)
+
+        if self._journal_records >= self._compaction_threshold and (
+            self._compactor is None or not self._compactor.is_alive()
+        ):
+            self._compactor = threading.Thread(target=self.save_data)
+            self._compactor.start()
 
     def _retrieve_item(self, key: str) -> Any:
         """
@@ -95,28 +438,42 @@ class UserDataManager:
             Any: The value associated with the key, or None if the key does not exist.
         """
 
-        return self._data[key] if key in self._data else None
+        if self._database is not None and key == GameDatabase.GAMES_KEY:
+            return self._database.saved_games
+        if key not in self._data:
+            return None
+
+        value = self._data[key]
+        if isinstance(value, list):  # report the changes made in place
+            return TrackedList(value, partial(self._record_list_change, key, value))
+        return value
 
     def _modify_item(self, key: str, value: Any) -> None:
         """
         Modify the value associated with the given key in the internal dictionary.
         If the key is one of the instance attribute, it modify that instead.
-        After modifying the internal dictionary, it saves the changes to the file.
+        After modifying the internal dictionary, it schedules a background flush of the change.
 
         Args:
             key (str): The key to modify the value for.
             value (Any): The new value to associate with the key.
         """
 
-        if key in {
-            "_instance",
-            "_data",
-            "_file_path",
-        }:  # Prevent overriding class attributes
+        if key in self._ATTRIBUTES:  # Prevent overriding class attributes
             super().__setattr__(key, value)
-        else:
+            return
+
+        with self._lock:
+            if self._database is not None and key == GameDatabase.GAMES_KEY:
+                self._database.set_item(key, value)  # written row by row
+                return
+
+            if isinstance(value, TrackedList):
+                value = list(value)  # store the data, not the view
             self._data[key] = value
-            self.save_data()
+            self._changed.add(key)
+            self._list_changes.pop(key, None)
+            self._schedule_flush()
 
     def __getattr__(self, key: str) -> Any:
         """Retrieves the value associated with the given key."""
@@ -127,15 +484,17 @@ class UserDataManager:
         return self._retrieve_item(key)
 
     def __setattr__(self, key: str, value: Any) -> None:
-        """Modifies the value associated with the given key, and saves the changes."""
+        """Modifies the value associated with the given key, and schedules saving the changes."""
         self._modify_item(key, value)
 
     def __setitem__(self, key: str, value: Any) -> None:
-        """Modifies the value associated with the given key, and saves the changes."""
+        """Modifies the value associated with the given key, and schedules saving the changes."""
         self._modify_item(key, value)
 
     def __contains__(self, key: str) -> bool:
         """Checks if the given key exists in the user data."""
+        if self._database is not None and key == GameDatabase.GAMES_KEY:
+            return True
         return key in self._data
 
 
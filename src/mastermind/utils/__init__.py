@@ -1,11 +1,31 @@
+from mastermind.utils.code_codec import (
+    decode_code,
+    decode_codes,
+    encode_code,
+    encode_codes,
+    fits_int64,
+)
 from mastermind.utils.fstring_template import FStringTemplate
-from mastermind.utils.get_feedback import generate_feedback
+from mastermind.utils.get_feedback import (
+    decode_feedback,
+    encode_feedback,
+    generate_feedback,
+    generate_feedback_matrix,
+)
 from mastermind.utils.render_dataframe import render_dataframe
 from mastermind.utils.stack import Stack
 
 __all__ = [
     "FStringTemplate",
+    "decode_code",
+    "decode_codes",
+    "decode_feedback",
+    "encode_code",
+    "encode_codes",
+    "encode_feedback",
+    "fits_int64",
     "generate_feedback",
+    "generate_feedback_matrix",
     "render_dataframe",
     "Stack",
 ]
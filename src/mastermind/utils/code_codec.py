@@ -0,0 +1,110 @@
+"""
+This module defines the integer encoding of codes shared across the package.
+
+The code (d_1, ..., d_n) is encoded as the base-number_of_colors integer whose digits are d_1 - 1, ..., d_n - 1, most significant first. The encoding is a bijection between the codes of a dimension and range(number_of_colors ** number_of_dots), and it preserves the lexicographic order of codes, so sorted indices are sorted codes.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+def fits_int64(number_of_colors: int, number_of_dots: int) -> bool:
+    """
+    Checks whether the indices of the dimension fit in an int64 array.
+    """
+    return number_of_colors**number_of_dots - 1 <= _INT64_MAX
+
+
+def _check_int64(number_of_colors: int, number_of_dots: int) -> None:
+    """
+    Raises ValueError if the indices of the dimension do not fit in an int64 array.
+    """
+    if not fits_int64(number_of_colors, number_of_dots):
+        raise ValueError(
+            f"The codes of a {number_of_colors}x{number_of_dots} game do not fit in 64-bit integers"
+        )
+
+
+def encode_code(code: Tuple[int, ...], number_of_colors: int) -> int:
+    """
+    Encodes a code as its integer index.
+
+    Args:
+        code (Tuple[int, ...]): The code, with colors from 1 to number_of_colors.
+        number_of_colors (int): The number of colors in the game.
+
+    Returns:
+        int: The index of the code.
+    """
+    index = 0
+    for dot in code:
+        index = index * number_of_colors + dot - 1
+    return index
+
+
+def decode_code(
+    index: int, number_of_colors: int, number_of_dots: int
+) -> Tuple[int, ...]:
+    """
+    Decodes an integer index back into its code.
+
+    Args:
+        index (int): The index of the code.
+        number_of_colors (int): The number of colors in the game.
+        number_of_dots (int): The number of dots in each combination.
+
+    Returns:
+        Tuple[int, ...]: The code, with colors from 1 to number_of_colors.
+    """
+    dots = []
+    for _ in range(number_of_dots):
+        index, digit = divmod(int(index), number_of_colors)
+        dots.append(digit + 1)
+    return tuple(reversed(dots))
+
+
+def encode_codes(codes: np.ndarray, number_of_colors: int) -> np.ndarray:
+    """
+    Encodes an array of codes as their integer indices.
+
+    Args:
+        codes (np.ndarray): An array of shape (n, number_of_dots) with colors in [1, number_of_colors].
+        number_of_colors (int): The number of colors in the game.
+
+    Returns:
+        np.ndarray: An int64 array of shape (n,) with the index of each code.
+
+    Raises:
+        ValueError: If the indices of the dimension do not fit in 64-bit integers.
+    """
+    codes = np.asarray(codes)
+    number_of_dots = codes.shape[1]
+    _check_int64(number_of_colors, number_of_dots)
+    powers = number_of_colors ** np.arange(number_of_dots - 1, -1, -1, dtype=np.int64)
+    return (codes.astype(np.int64) - 1) @ powers
+
+
+def decode_codes(
+    indices: np.ndarray, number_of_colors: int, number_of_dots: int
+) -> np.ndarray:
+    """
+    Decodes an array of integer indices back into their codes.
+
+    Args:
+        indices (np.ndarray): An integer array of shape (n,) with code indices.
+        number_of_colors (int): The number of colors in the game.
+        number_of_dots (int): The number of dots in each combination.
+
+    Returns:
+        np.ndarray: A uint8 array of shape (n, number_of_dots) with colors from 1.
+
+    Raises:
+        ValueError: If the indices of the dimension do not fit in 64-bit integers.
+    """
+    _check_int64(number_of_colors, number_of_dots)
+    powers = number_of_colors ** np.arange(number_of_dots - 1, -1, -1, dtype=np.int64)
+    indices = np.asarray(indices, dtype=np.int64)
+    return (indices[:, None] // powers % number_of_colors + 1).astype(np.uint8)
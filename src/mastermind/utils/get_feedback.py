@@ -1,7 +1,15 @@
 """
 This module defines the generate_feedback function, which takes a guess and a secret code, and returns the number of black and white pegs.
+
+It also defines a vectorized variant, generate_feedback_matrix, which scores every guess in an array against every secret in another array in one call.
 """
 
+from typing import Tuple
+
+import numpy as np
+
+_CHUNK_ELEMENTS = 1 << 22  # Upper bound on intermediate array size per chunk
+
 
 def generate_feedback(guess: tuple, secret: tuple, number_of_colors: int) -> list:
     """
@@ -32,3 +40,116 @@ def generate_feedback(guess: tuple, secret: tuple, number_of_colors: int) -> lis
         list2[0] += min(count1, count2)  # list2[0] is white pegs count
 
     return list1[0], list2[0]  # return black and white pegs count
+
+
+def encode_feedback(black: int, white: int, number_of_dots: int) -> int:
+    """
+    Encodes a (black, white) feedback pair into a single integer.
+
+    Args:
+        black (int): The number of black pegs.
+        white (int): The number of white pegs.
+        number_of_dots (int): The number of dots in each combination.
+
+    Returns:
+        int: The integer code of the feedback, black * (number_of_dots + 1) + white.
+    """
+    return black * (number_of_dots + 1) + white
+
+
+def decode_feedback(code: int, number_of_dots: int) -> Tuple[int, int]:
+    """
+    Decodes an integer feedback code back into a (black, white) feedback pair.
+
+    Args:
+        code (int): The integer code of the feedback.
+        number_of_dots (int): The number of dots in each combination.
+
+    Returns:
+        Tuple[int, int]: The number of black and white pegs.
+    """
+    black, white = divmod(int(code), number_of_dots + 1)
+    return black, white
+
+
+def feedback_dtype(number_of_dots: int) -> np.dtype:
+    """
+    Returns the smallest unsigned integer type that can hold every encoded feedback.
+
+    Args:
+        number_of_dots (int): The number of dots in each combination.
+
+    Returns:
+        np.dtype: np.uint8 for up to 14 dots, np.uint16 otherwise.
+    """
+    return np.dtype(np.uint8 if (number_of_dots + 1) ** 2 <= 256 else np.uint16)
+
+
+def _count_colors(codes: np.ndarray, number_of_colors: int) -> np.ndarray:
+    """
+    Counts the occurrences of each color in each code.
+
+    Args:
+        codes (np.ndarray): An array of shape (n, number_of_dots) with colors in [1, number_of_colors].
+        number_of_colors (int): The number of colors in the game.
+
+    Returns:
+        np.ndarray: An array of shape (n, number_of_colors) with the count of each color.
+    """
+    counts = np.empty((codes.shape[0], number_of_colors), dtype=np.uint8)
+    for color in range(number_of_colors):
+        counts[:, color] = (codes == color + 1).sum(axis=1)
+    return counts
+
+
+def generate_feedback_matrix(
+    guesses: np.ndarray, secrets: np.ndarray, number_of_colors: int
+) -> np.ndarray:
+    """
+    Generates the feedback of every guess against every secret in one vectorized call.
+
+    The result is identical to calling generate_feedback on every pair, with each (black, white) pair encoded as a single integer by encode_feedback.
+
+    Args:
+        guesses (np.ndarray): An array of shape (n_guesses, number_of_dots) of guesses.
+        secrets (np.ndarray): An array of shape (n_secrets, number_of_dots) of secrets.
+        number_of_colors (int): The number of colors in the game.
+
+    Returns:
+        np.ndarray: An array of shape (n_guesses, n_secrets) with the encoded feedback (uint8 unless the codes are too long to fit).
+
+    Raises:
+        ValueError: If the guesses and secrets do not have the same number of dots.
+    """
+    guesses = np.atleast_2d(np.asarray(guesses, dtype=np.uint8))
+    secrets = np.atleast_2d(np.asarray(secrets, dtype=np.uint8))
+
+    number_of_dots = guesses.shape[1]
+    if secrets.shape[1] != number_of_dots:
+        raise ValueError("Guesses and secrets must have the same number of dots")
+
+    guess_counts = _count_colors(guesses, number_of_colors)
+    secret_counts = _count_colors(secrets, number_of_colors)
+
+    dtype = feedback_dtype(number_of_dots)
+    result = np.empty((guesses.shape[0], secrets.shape[0]), dtype=dtype)
+    step = max(1, _CHUNK_ELEMENTS // max(secrets.shape[0], 1))  # rows per chunk
+
+    for start in range(0, guesses.shape[0], step):
+        stop = start + step
+        black = np.zeros((len(guesses[start:stop]), secrets.shape[0]), dtype=dtype)
+        total = np.zeros_like(black)
+
+        # Exact matches, accumulated one position at a time to avoid 3D temporaries
+        for dot in range(number_of_dots):
+            black += guesses[start:stop, dot, None] == secrets[None, :, dot]
+
+        # Total color matches regardless of position
+        for color in range(number_of_colors):
+            total += np.minimum(
+                guess_counts[start:stop, color, None], secret_counts[None, :, color]
+            )
+
+        result[start:stop] = black * (number_of_dots + 1) + (total - black)
+
+    return result
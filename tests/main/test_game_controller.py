@@ -0,0 +1,79 @@
+import os
+import pickle
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from mastermind.game.game import Game
+from mastermind.main.game_controller import GameController
+from mastermind.main.game_history import GameHistoryManager
+from mastermind.storage.user_data import UserDataManager
+
+
+class TestGameController(unittest.TestCase):
+    """Test suite for saving and resuming games through the GameController"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        UserDataManager._file_path = os.path.join(cls.temp_dir.name, "userdata.config")
+
+    @classmethod
+    def tearDownClass(cls):
+        UserDataManager().flush()
+        UserDataManager._file_path = "data/userdata.config"
+        cls.temp_dir.cleanup()
+
+    def setUp(self):
+        UserDataManager().clear_all()
+        GameHistoryManager.save_game(Game(4, 4, 10, "HvH"))
+        self.game_id = UserDataManager().saved_games[0]["game_id"]
+
+    def test_game_stored_as_payload(self):
+        """Test that the user data holds the game meta data but not the Game"""
+        UserDataManager().save_data()
+        with open(UserDataManager._file_path, "rb") as file:
+            saved_game = pickle.load(file)["saved_games"][0]
+        self.assertNotIn("game", saved_game)
+        self.assertIsInstance(UserDataManager.load_payload(self.game_id), Game)
+
+    def test_resume_game(self):
+        """Test that a resumed game is loaded on demand and stored back under its key"""
+        with patch.object(Game, "resume_game", return_value=None) as mock_resume:
+            GameController.resume_game(0)
+        mock_resume.assert_called_once()
+        self.assertEqual(len(UserDataManager().saved_games), 1)
+        self.assertEqual(UserDataManager().saved_games[0]["game_id"], self.game_id)
+        self.assertIsInstance(UserDataManager.load_payload(self.game_id), Game)
+
+    @patch("builtins.print")
+    def test_resume_unavailable_game(self, mock_print):
+        """Test that a game whose payload is missing or corrupted is removed instead of resumed"""
+        UserDataManager.delete_payload(self.game_id)
+        with patch.object(Game, "resume_game") as mock_resume:
+            GameController.resume_game(0)
+        mock_resume.assert_not_called()
+        mock_print.assert_called_once()
+        self.assertIn("unavailable", mock_print.call_args.args[0])
+        self.assertEqual(UserDataManager().saved_games, [])
+
+        GameHistoryManager.save_game(Game(4, 4, 10, "HvH"))
+        game_id = UserDataManager().saved_games[0]["game_id"]
+        with open(UserDataManager._payload_path(game_id), "wb") as file:
+            file.write(b"corrupted")
+        with patch.object(Game, "resume_game") as mock_resume:
+            GameController.resume_game(0)
+        mock_resume.assert_not_called()
+        self.assertEqual(UserDataManager().saved_games, [])
+        self.assertFalse(os.path.exists(UserDataManager._payload_path(game_id)))
+
+    def test_discard_resumed_game(self):
+        """Test that discarding a resumed game deletes its meta data and payload"""
+        with patch.object(Game, "resume_game", return_value="d"):
+            GameController.resume_game(0)
+        self.assertEqual(UserDataManager().saved_games, [])
+        self.assertIsNone(UserDataManager.load_payload(self.game_id))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+import numpy as np
+
+from mastermind.game.game import Game
+from mastermind.main.game_history import GameHistoryManager
+from mastermind.utils import encode_code, encode_feedback
+
+
+class TestGameHistoryManager(unittest.TestCase):
+    """Test suite for the meta data of saved games"""
+
+    def _game(self, number_of_colors, number_of_dots, entries):
+        game = Game(number_of_colors, number_of_dots, 10, "HvH")
+        for guess, feedback in entries:
+            game._board.add_guess(guess, feedback)
+        return game
+
+    def test_meta_data_encodes_guesses(self):
+        """Test that guesses and feedback are stored oldest first as integers"""
+        entries = [((1, 2, 3, 4), (1, 2)), ((4, 4, 1, 1), (0, 1))]
+        meta_data = GameHistoryManager.generate_meta_data(self._game(4, 4, entries))
+        np.testing.assert_array_equal(
+            meta_data["guesses"], [encode_code(guess, 4) for guess, _ in entries]
+        )
+        np.testing.assert_array_equal(
+            meta_data["feedback"], [encode_feedback(*fb, 4) for _, fb in entries]
+        )
+        self.assertEqual(meta_data["amount_attempted"], 2)
+
+    def test_meta_data_beyond_int64(self):
+        """Test that games whose code indices overflow 64 bits keep their guesses as tuples"""
+        entries = [((1,) * 19, (2, 0)), ((10,) * 19, (0, 0))]
+        meta_data = GameHistoryManager.generate_meta_data(self._game(10, 19, entries))
+        self.assertEqual(meta_data["guesses"], [guess for guess, _ in entries])
+        np.testing.assert_array_equal(
+            meta_data["feedback"], [encode_feedback(*fb, 19) for _, fb in entries]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
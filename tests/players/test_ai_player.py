@@ -1,8 +1,12 @@
+import os
 import unittest
+from unittest.mock import patch
 
 from mastermind.game.game import Game
 from mastermind.players.ai_player import AICodeCracker, AICodeSetter
+from mastermind.solver import DecisionTree, Solver, SolverSettings
 from mastermind.validation.models.valid_combination import ValidCombination
+from tests.temporary_cache import TemporaryCacheMixin
 
 
 class TestAICodeSetter(unittest.TestCase):
@@ -26,13 +30,70 @@ class TestAICodeSetter(unittest.TestCase):
             self.code_setter.get_feedback((1, 2, 3, 4))
 
 
-class TestAICodeCracker(unittest.TestCase):
+class TestAICodeCracker(TemporaryCacheMixin, unittest.TestCase):
     def setUp(self):
         self.game = Game(6, 4, 10, "AIvH")
-        self.code_cracker = AICodeCracker(self.game, "You won!", "You lost.")
+        self.code_cracker = AICodeCracker(self.game._player_logic)
 
-    # TODO: Add tests for the AI solver logic when implemented
-    pass
+    @patch("builtins.print")
+    def test_obtain_guess(self, mock_print):
+        self.assertEqual(self.code_cracker.obtain_guess(), (1, 1, 2, 2))
+        self.game._board.add_guess((1, 1, 2, 2), (1, 1))
+        ValidCombination(4, 6).validate_value(self.code_cracker.obtain_guess())
+
+    @patch("builtins.print")
+    def test_obtain_guess_with_inconsistent_feedback(self, mock_print):
+        self.game._board.add_guess((1, 1, 1, 1), (3, 0))
+        self.game._board.add_guess((1, 1, 1, 2), (0, 0))
+        self.assertEqual(self.code_cracker.obtain_guess(), "u")
+
+    @patch("builtins.print")
+    def test_cracks_secret_code(self, mock_print):
+        player_logic = self.game._player_logic
+        player_logic.initialize_players()
+        player_logic.PLAYER_SETTER.SECRET_CODE = (6, 2, 5, 3)
+        player_logic.process_player_guessing()
+        self.assertTrue(self.game._state.win_status)
+        self.assertEqual(self.game._board.last_guess(), (6, 2, 5, 3))
+
+
+class TestAICodeCrackerDecisionTree(TemporaryCacheMixin, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.tree_path = os.path.join(cls.temp_dir.name, "tree_4x4.npz")
+        DecisionTree.build(4, 4).save(cls.tree_path)
+
+    def setUp(self):
+        settings = SolverSettings(decision_tree=self.tree_path)
+        self.game = Game(4, 4, 10, "AIvH", settings)
+        self.code_cracker = AICodeCracker(self.game._player_logic)
+
+    @patch("builtins.print")
+    def test_plays_from_tree(self, mock_print):
+        player_logic = self.game._player_logic
+        player_logic.initialize_players()
+        player_logic.PLAYER_CRACKER = self.code_cracker
+        player_logic.PLAYER_SETTER.SECRET_CODE = (4, 3, 2, 1)
+        with patch.object(Solver, "choose_guess") as mock_choose:
+            player_logic.process_player_guessing()
+        mock_choose.assert_not_called()
+        self.assertTrue(self.game._state.win_status)
+
+    @patch("builtins.print")
+    def test_falls_back_off_tree(self, mock_print):
+        self.game._board.add_guess((1, 2, 3, 4), (2, 0))
+        with patch.object(
+            Solver, "choose_guess", autospec=True, side_effect=Solver.choose_guess
+        ) as mock_choose:
+            guess = self.code_cracker.obtain_guess()
+        mock_choose.assert_called_once()
+        ValidCombination(4, 4).validate_value(guess)
+
+    def test_tree_of_another_dimension(self):
+        game = Game(6, 4, 10, "AIvH", SolverSettings(decision_tree=self.tree_path))
+        with self.assertRaises(ValueError):
+            AICodeCracker(game._player_logic)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,14 @@
+import itertools
+import time
 import unittest
 from io import StringIO
 from unittest.mock import patch
 
 from mastermind.game.game import Game
 from mastermind.players.human_player import HumanCodeCracker, HumanCodeSetter
+from mastermind.solver.candidate_set import CandidateSet
+from mastermind.utils import generate_feedback
+from tests.temporary_cache import TemporaryCacheMixin
 
 
 class TestHumanCodeSetter(unittest.TestCase):
@@ -68,7 +73,7 @@ class TestHumanCodeSetter(unittest.TestCase):
             self.human_code_setter.get_feedback((1, 2, 3, 4))
 
 
-class TestHumanCodeCracker(unittest.TestCase):
+class TestHumanCodeCracker(TemporaryCacheMixin, unittest.TestCase):
     def setUp(self):
         self.game = Game(6, 4, 10, "HvH")
         self.human_code_cracker = HumanCodeCracker(self.game._player_logic)
@@ -113,6 +118,67 @@ class TestHumanCodeCracker(unittest.TestCase):
         mock_input.return_value = "r"
         self.assertEqual(self.human_code_cracker.obtain_guess(), "r")
 
+    @patch("builtins.input")
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_obtain_guess_hint(self, mock_stdout, mock_input):
+        board = self.game._state._board
+        board.add_guess((1, 1, 2, 2), (1, 0))
+        board.add_guess((1, 3, 4, 5), (1, 1))
+        board.add_guess((3, 6, 1, 3), (1, 1))
+        mock_input.side_effect = ["h", "1234"]
+        self.assertEqual(self.human_code_cracker.obtain_guess(), (1, 2, 3, 4))
+
+        lines = mock_stdout.getvalue().splitlines()
+        remaining = [
+            code
+            for code in itertools.product(range(1, 7), repeat=4)
+            if all(
+                generate_feedback(guess, code, 6) == feedback
+                for guess, feedback in [
+                    ((1, 1, 2, 2), (1, 0)),
+                    ((1, 3, 4, 5), (1, 1)),
+                    ((3, 6, 1, 3), (1, 1)),
+                ]
+            )
+        ]
+        self.assertEqual(lines[0], f"{len(remaining)} possible codes remain, such as:")
+        self.assertEqual(lines[1], f"  {remaining[0]}")
+        self.assertTrue(lines[-1].startswith("Suggested guess: "))
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_hint_is_incremental(self, mock_stdout):
+        board = self.game._state._board
+        board.add_guess((1, 1, 2, 2), (1, 0))
+        board.add_guess((1, 3, 4, 5), (1, 1))
+        self.human_code_cracker.hint()
+        board.add_guess((3, 6, 1, 3), (1, 1))
+        with patch.object(
+            CandidateSet, "filter", side_effect=CandidateSet.filter, autospec=True
+        ) as mock_filter:
+            self.human_code_cracker.hint()
+        self.assertEqual(mock_filter.call_count, 1)
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_hint_deadline(self, mock_stdout):
+        game = Game(10, 10, 10, "HvH")
+        game._state._board.add_guess((1, 2, 3, 4, 5, 6, 7, 8, 9, 10), (2, 3))
+        code_cracker = HumanCodeCracker(game._player_logic)
+        start = time.monotonic()
+        with patch.object(HumanCodeCracker, "HINT_TIME", 0.0):
+            code_cracker.hint()
+        self.assertLess(time.monotonic() - start, 5.0)
+
+        lines = mock_stdout.getvalue().splitlines()
+        self.assertRegex(lines[0], r"^(At least \d+|No possible code was found)")
+        self.assertTrue(lines[-1].startswith("Suggested guess: "))
+
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_hint_without_consistent_code(self, mock_stdout):
+        self.game._state._board.add_guess((1, 1, 1, 1), (4, 0))
+        self.game._state._board.add_guess((1, 1, 1, 1), (0, 0))
+        self.human_code_cracker.hint()
+        self.assertIn("No code is consistent", mock_stdout.getvalue())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,67 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from mastermind.simulation import Simulator
+from mastermind.simulation.__main__ import main
+from tests.temporary_cache import TemporaryCacheMixin
+
+
+class TestSimulator(TemporaryCacheMixin, unittest.TestCase):
+    """Test suite for the Simulator class"""
+
+    def setUp(self):
+        self.simulator = Simulator(3, 3)
+
+    def test_play_is_silent(self):
+        """Test that a game is played without printing anything"""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            result = self.simulator.play((3, 2, 1))
+        self.assertEqual(output.getvalue(), "")
+        self.assertTrue(result["win"])
+        self.assertEqual(result["secret"], 21)
+        self.assertGreaterEqual(result["max_move_time"], 0)
+        self.assertEqual(result["truncated_moves"], 0)
+
+    def test_every_secret(self):
+        """Test that every secret is played once by default"""
+        results = self.simulator.run()
+        self.assertEqual(len(results), 27)
+        self.assertEqual(sorted(results["secret"]), list(range(27)))
+        self.assertTrue(results["win"].all())
+
+    def test_random_secrets(self):
+        """Test that random secrets are reproducible with a seed"""
+        first = self.simulator.run(number_of_games=5, seed=1)
+        second = self.simulator.run(number_of_games=5, seed=1)
+        self.assertEqual(first["secret"].tolist(), second["secret"].tolist())
+
+    def test_lost_games(self):
+        """Test that games running out of attempts are reported as lost"""
+        results = Simulator(3, 3, maximum_attempts=1).run(secrets=[(3, 3, 3)])
+        self.assertFalse(results["win"][0])
+        self.assertEqual(results["guesses"][0], 1)
+        self.assertEqual(Simulator.summary(results)["wins"], 0)
+
+    def test_report(self):
+        """Test the guess distribution and summary of a batch"""
+        results = self.simulator.run()
+        distribution = Simulator.guess_distribution(results)
+        self.assertEqual(distribution.sum(), 27)
+        self.assertEqual(distribution.index[0], 1)
+
+        summary = Simulator.summary(results)
+        self.assertEqual(summary["games"], 27)
+        self.assertEqual(summary["worst_guesses"], distribution.index[-1])
+
+    def test_command_line(self):
+        """Test that the command line prints a report"""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            main(["3", "2", "--games", "4", "--seed", "0"])
+        self.assertIn("average_guesses", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
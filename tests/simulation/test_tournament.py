@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+
+from mastermind.simulation import Tournament
+from mastermind.solver.opening_book import OpeningBook
+from tests.temporary_cache import TemporaryCacheMixin
+
+
+class TestTournament(TemporaryCacheMixin, unittest.TestCase):
+    """Test suite for the Tournament class"""
+
+    def setUp(self):
+        self.output = tempfile.mkdtemp(dir=self.temp_dir.name)
+        self.tournament = Tournament(
+            self.output,
+            ["minimax", "expected_size"],
+            [(3, 2), (2, 3)],
+            shard_size=4,
+            max_workers=2,
+        )
+
+    def test_shards(self):
+        """Test that every secret is split into shards for every strategy"""
+        shards = self.tournament.shards()
+        self.assertEqual(len(shards), 2 * (3 + 2))
+        self.assertEqual(sum(len(shard[3]) for shard in shards), 2 * (9 + 8))
+
+    def test_run(self):
+        """Test that every game is played and summarized"""
+        summary = self.tournament.run()
+        self.assertEqual(len(summary), 4)
+        self.assertEqual(summary.loc[("minimax", 3, 2), "games"], 9)
+        self.assertTrue((summary["wins"] == summary["games"]).all())
+        self.assertTrue(os.path.exists(os.path.join(self.output, "summary.csv")))
+
+        results = Tournament.merge(self.output)
+        self.assertEqual(len(results), 2 * (9 + 8))
+        self.assertEqual(
+            sorted(results.loc[results["strategy"] == "expected_size", "colors"]),
+            [2] * 8 + [3] * 9,
+        )
+
+    def test_truncated_moves(self):
+        """Test that the number of truncated moves is kept in the results"""
+        self.tournament.run()
+        results = Tournament.merge(self.output)
+        self.assertIn("truncated_moves", results.columns)
+        self.assertEqual(results["truncated_moves"].sum(), 0)
+
+    def test_sampled_dimensions_not_prepared(self):
+        """Test that no table or opening book is prepared for sampled dimensions"""
+        tournament = Tournament(
+            tempfile.mkdtemp(dir=self.temp_dir.name),
+            ["minimax"],
+            [(3, 2), (10, 10)],
+            number_of_games=1,
+        )
+        self.assertEqual(tournament._prepared_dimensions(), [(3, 2)])
+        tournament._prepare()
+        self.assertEqual(len(OpeningBook.get(10, 10, "minimax")), 0)
+        self.assertGreater(len(OpeningBook.get(3, 2, "minimax")), 0)
+
+    def test_resume(self):
+        """Test that only missing shards are played again"""
+        self.tournament.run()
+        shards = self.tournament.shards()
+        missing = shards[1][-1]
+        kept = shards[0][-1]
+        os.remove(missing)
+        modified = os.path.getmtime(kept)
+
+        summary = self.tournament.run()
+        self.assertTrue(os.path.exists(missing))
+        self.assertEqual(os.path.getmtime(kept), modified)
+        self.assertEqual(summary["games"].sum(), 2 * (9 + 8))
+
+    def test_different_parameters(self):
+        """Test that a directory cannot be reused with other parameters"""
+        with self.assertRaises(ValueError):
+            Tournament(self.output, ["entropy"], [(3, 2)])
+
+    def test_unknown_strategy(self):
+        """Test that unknown strategies are rejected"""
+        with self.assertRaises(ValueError):
+            Tournament(tempfile.mkdtemp(dir=self.temp_dir.name), ["random"], [(3, 2)])
+
+
+if __name__ == "__main__":
+    unittest.main()
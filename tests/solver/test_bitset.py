@@ -0,0 +1,41 @@
+import unittest
+
+import numpy as np
+
+from mastermind.solver.bitset import CodeBitset
+
+
+class TestCodeBitset(unittest.TestCase):
+    """Test suite for the CodeBitset class"""
+
+    def test_full(self):
+        """Test that a full set holds every index and no padding bits"""
+        bitset = CodeBitset.full(13)
+        self.assertEqual(len(bitset), 13)
+        self.assertEqual(list(bitset), list(range(13)))
+        self.assertNotIn(13, bitset)
+
+    def test_from_indices(self):
+        """Test that the indices of a set are read back sorted"""
+        bitset = CodeBitset.from_indices(100, np.array([42, 7, 99, 0]))
+        self.assertEqual(len(bitset), 4)
+        np.testing.assert_array_equal(bitset.indices(), [0, 7, 42, 99])
+        self.assertEqual(bitset.indices().dtype, np.int64)
+        self.assertIn(42, bitset)
+        self.assertNotIn(41, bitset)
+        self.assertNotIn(-1, bitset)
+
+    def test_intersection(self):
+        """Test that intersecting two sets keeps their common indices"""
+        first = CodeBitset.from_indices(20, np.array([1, 3, 5, 7, 11]))
+        second = CodeBitset.from_mask(np.arange(20) % 3 != 0)
+        self.assertEqual(list(first & second), [1, 5, 7, 11])
+        self.assertEqual(first & second, CodeBitset.from_indices(20, [1, 5, 7, 11]))
+
+    def test_memory(self):
+        """Test that a set takes one bit per code"""
+        self.assertEqual(CodeBitset.full(8**6).bits.nbytes, 8**6 // 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
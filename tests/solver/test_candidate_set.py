@@ -0,0 +1,90 @@
+import itertools
+import unittest
+
+import numpy as np
+
+from mastermind.solver.candidate_set import CandidateSet
+from mastermind.utils import generate_feedback
+
+
+class TestCandidateSet(unittest.TestCase):
+    """Test suite for the CandidateSet class"""
+
+    def setUp(self):
+        self.candidates = CandidateSet(4, 3)
+
+    def test_initially_full(self):
+        """Test that a new set holds every code without materializing it"""
+        self.assertTrue(self.candidates.is_full)
+        self.assertEqual(len(self.candidates), 64)
+        self.assertIn((4, 4, 4), self.candidates)
+        np.testing.assert_array_equal(self.candidates.indices, np.arange(64))
+
+    def test_encode_decode(self):
+        """Test that codes and indices convert back and forth"""
+        for index, code in enumerate(itertools.product(range(1, 5), repeat=3)):
+            self.assertEqual(self.candidates.encode(code), index)
+            self.assertEqual(tuple(self.candidates.decode([index])[0]), code)
+
+    def test_filter(self):
+        """Test that filtering keeps exactly the codes consistent with the feedback"""
+        self.candidates.filter((1, 2, 3), (1, 1))
+        expected = [
+            code
+            for code in itertools.product(range(1, 5), repeat=3)
+            if generate_feedback((1, 2, 3), code, 4) == (1, 1)
+        ]
+        self.assertFalse(self.candidates.is_full)
+        self.assertEqual(len(self.candidates), len(expected))
+        self.assertEqual(
+            [self.candidates.code_at(i) for i in range(len(expected))], expected
+        )
+
+    def test_filter_is_incremental(self):
+        """Test that successive filters narrow the set"""
+        self.candidates.filter((1, 1, 2), (0, 1))
+        first = len(self.candidates)
+        self.candidates.filter((2, 3, 3), (1, 0))
+        self.assertLess(len(self.candidates), first)
+        for position in range(len(self.candidates)):
+            code = self.candidates.code_at(position)
+            self.assertEqual(generate_feedback((1, 1, 2), code, 4), (0, 1))
+            self.assertEqual(generate_feedback((2, 3, 3), code, 4), (1, 0))
+
+    def test_contains(self):
+        """Test membership after filtering"""
+        self.candidates.filter((1, 2, 3), (3, 0))
+        self.assertIn((1, 2, 3), self.candidates)
+        self.assertNotIn((1, 2, 4), self.candidates)
+
+    def test_filter_subset(self):
+        """Test filtering a partial set, both before and after the feedback mask is memoized"""
+        codes = list(itertools.product(range(1, 5), repeat=3))
+        for guess, feedback in [((1, 3, 4), (0, 2)), ((1, 2, 3), (1, 1))]:
+            subset = CandidateSet.from_indices(4, 3, np.arange(0, 64, 2))
+            subset.filter(guess, feedback)
+            expected = [
+                index
+                for index in range(0, 64, 2)
+                if generate_feedback(guess, codes[index], 4) == feedback
+            ]
+            np.testing.assert_array_equal(subset.indices, expected)
+            self.assertEqual(len(subset), len(expected))
+
+        self.candidates.filter((1, 3, 4), (0, 2))  # the full set memoizes the mask
+        subset = CandidateSet.from_indices(4, 3, np.arange(0, 64, 2))
+        subset.filter((1, 3, 4), (0, 2))
+        np.testing.assert_array_equal(
+            subset.indices, self.candidates.indices[self.candidates.indices % 2 == 0]
+        )
+
+    def test_reset(self):
+        """Test that reset restores every code"""
+        self.candidates.filter((1, 2, 3), (0, 0))
+        self.candidates.reset()
+        self.assertTrue(self.candidates.is_full)
+        self.assertEqual(len(self.candidates), 64)
+
+
+if __name__ == "__main__":
+    unittest.main()
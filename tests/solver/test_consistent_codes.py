@@ -0,0 +1,65 @@
+import itertools
+import unittest
+
+import numpy as np
+
+from mastermind.solver import iter_consistent_codes
+from mastermind.utils import generate_feedback
+
+
+class TestIterConsistentCodes(unittest.TestCase):
+    """Test suite for the iter_consistent_codes generator"""
+
+    def setUp(self):
+        self.secret = (2, 6, 2, 5)
+        self.history = [
+            (guess, generate_feedback(guess, self.secret, 6))
+            for guess in [(1, 1, 2, 2), (3, 4, 2, 5), (6, 6, 1, 2)]
+        ]
+
+    def _brute_force(self, history, number_of_colors, number_of_dots):
+        return [
+            code
+            for code in itertools.product(
+                range(1, number_of_colors + 1), repeat=number_of_dots
+            )
+            if all(
+                generate_feedback(guess, code, number_of_colors) == feedback
+                for guess, feedback in history
+            )
+        ]
+
+    def test_matches_brute_force(self):
+        """Test that exactly the consistent codes are yielded, in lexicographic order"""
+        for length in range(len(self.history) + 1):
+            history = self.history[:length]
+            self.assertEqual(
+                list(iter_consistent_codes(history, 6, 4)),
+                self._brute_force(history, 6, 4),
+            )
+
+    def test_no_peg_exclusions(self):
+        """Test that guesses without pegs rule out their colors"""
+        history = [((1, 1, 2), (0, 0)), ((3, 3, 3), (0, 0))]
+        codes = list(iter_consistent_codes(history, 4, 3))
+        self.assertEqual(len(codes), 1)
+        self.assertEqual(codes[0], (4, 4, 4))
+
+    def test_random_order(self):
+        """Test that a random order yields the same codes"""
+        codes = iter_consistent_codes(self.history, 6, 4, rng=np.random.default_rng(0))
+        self.assertEqual(sorted(codes), self._brute_force(self.history, 6, 4))
+
+    def test_inconsistent_history(self):
+        """Test that contradictory feedback yields nothing"""
+        history = [((1, 1, 1, 1), (4, 0)), ((2, 2, 2, 2), (4, 0))]
+        self.assertEqual(list(iter_consistent_codes(history, 6, 4)), [])
+
+    def test_expired_deadline(self):
+        """Test that the search stops once the deadline has passed"""
+        codes = iter_consistent_codes([], 10, 10, deadline=0.0)
+        self.assertLess(len(list(itertools.islice(codes, 5000))), 5000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import unittest
+
+from mastermind.game.board import GameBoard
+from mastermind.solver import DecisionTree, Solver
+from mastermind.solver.opening_book import OpeningBook
+from mastermind.utils import decode_code, generate_feedback
+from tests.temporary_cache import TemporaryCacheMixin
+
+
+class TestDecisionTree(TemporaryCacheMixin, unittest.TestCase):
+    """Test suite for the DecisionTree class"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.tree = DecisionTree.build(6, 4)
+
+    def test_knuth_statistics(self):
+        """Test that the minimax tree reproduces Knuth's results"""
+        self.assertEqual(self.tree.max_depth, 5)
+        self.assertAlmostEqual(self.tree.average_guesses, 5801 / 1296)
+        self.assertEqual(self.tree.guess_distribution().tolist(), [1, 6, 62, 533, 694])
+
+    def test_matches_solver(self):
+        """Test that following the tree plays the same games as the solver"""
+        tree = DecisionTree.build(3, 3)
+        for index in range(27):
+            secret = decode_code(index, 3, 3)
+            board, solver = GameBoard(3, 3), Solver(3, 3)
+            while True:
+                history = [board[i] for i in range(len(board) - 1, -1, -1)]
+                guess = solver.next_guess(board)
+                self.assertEqual(tree.lookup(history), guess)
+                if guess == secret:
+                    break
+                board.add_guess(guess, generate_feedback(guess, secret, 3))
+
+    def test_ignores_opening_book(self):
+        """Test that building a tree neither reads nor writes the opening book"""
+        book = OpeningBook.get(3, 3, "minimax")
+        self.addCleanup(OpeningBook._books.clear)
+        book.record([], (3, 3, 3))  # a foreign first move
+        tree = DecisionTree.build(3, 3)
+        self.assertNotEqual(tree.lookup([]), (3, 3, 3))
+        self.assertEqual(len(book), 1)
+
+    def test_lookup_out_of_tree(self):
+        """Test that histories leaving the tree are not looked up"""
+        self.assertEqual(self.tree.lookup([]), (1, 1, 2, 2))
+        self.assertIsNone(self.tree.lookup([((1, 2, 3, 4), (0, 0))]))
+        self.assertIsNone(self.tree.lookup([((1, 1, 2, 2), (4, 0))]))
+
+    def test_save_and_load(self):
+        """Test that a saved tree is loaded back unchanged"""
+        file_path = os.path.join(self.temp_dir.name, "tree.npz")
+        self.tree.save(file_path)
+        tree = DecisionTree.load(file_path)
+        self.assertEqual(len(tree), len(self.tree))
+        self.assertEqual(tree.average_guesses, self.tree.average_guesses)
+        history = [((1, 1, 2, 2), (0, 1))]
+        self.assertEqual(tree.lookup(history), self.tree.lookup(history))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+from unittest.mock import patch
+
+from mastermind.game.board import GameBoard
+from mastermind.solver import Solver, SolverSettings
+from mastermind.solver.opening_book import OpeningBook
+from mastermind.storage.persistent_cache import PersistentCacheManager
+from tests.temporary_cache import TemporaryCacheMixin
+
+
+class TestOpeningBook(TemporaryCacheMixin, unittest.TestCase):
+    """Test suite for the OpeningBook class"""
+
+    def setUp(self):
+        PersistentCacheManager.clear_cache()
+        OpeningBook._books.clear()
+
+    def test_record_and_lookup(self):
+        """Test that recorded moves are looked up by board history"""
+        book = OpeningBook.get(6, 4, "minimax")
+        self.assertIsNone(book.lookup([]))
+
+        book.record([], (1, 1, 2, 2))
+        book.record([((1, 1, 2, 2), (0, 1))], (2, 3, 3, 4))
+        self.assertEqual(book.lookup([]), (1, 1, 2, 2))
+        self.assertEqual(book.lookup([((1, 1, 2, 2), (0, 1))]), (2, 3, 3, 4))
+
+    def test_out_of_book_histories(self):
+        """Test that histories not following the book are ignored"""
+        book = OpeningBook.get(6, 4, "minimax")
+        book.record([], (1, 1, 2, 2))
+        book.record([((1, 2, 3, 4), (0, 1))], (2, 3, 3, 4))
+        self.assertEqual(len(book), 1)
+        self.assertIsNone(book.lookup([((1, 2, 3, 4), (0, 1))]))
+        self.assertIsNone(book.lookup([((1, 1, 2, 2), (0, 1))] * 2))
+
+    def test_persistence(self):
+        """Test that saved books are reloaded from the persistent cache"""
+        OpeningBook.get(6, 4, "entropy").record([], (1, 2, 3, 4))
+        OpeningBook.save_all()
+        OpeningBook._books.clear()  # simulate a new session
+        self.assertEqual(OpeningBook.get(6, 4, "entropy").lookup([]), (1, 2, 3, 4))
+        self.assertIsNone(OpeningBook.get(6, 4, "minimax").lookup([]))
+
+    def test_get_loads_once(self):
+        """Test that a loaded book is returned without reading the persistent cache again"""
+        book = OpeningBook.get(6, 4, "minimax")
+        with patch.object(PersistentCacheManager, "__getattr__") as mock_getattr:
+            self.assertIs(OpeningBook.get(6, 4, "minimax"), book)
+        mock_getattr.assert_not_called()
+
+    def test_recorded_moves_are_batched(self):
+        """Test that recording moves does not persist the book until it is saved"""
+        book = OpeningBook.get(6, 4, "minimax")
+        with patch.object(PersistentCacheManager, "set") as mock_set:
+            book.record([], (1, 1, 2, 2))
+            book.record([((1, 1, 2, 2), (0, 1))], (2, 3, 3, 4))
+            mock_set.assert_not_called()
+            OpeningBook.save_all()
+            OpeningBook.save_all()
+        mock_set.assert_called_once()
+
+    def test_build(self):
+        """Test that building stores the first guess and every second guess"""
+        book = OpeningBook.get(4, 3, "minimax")
+        with patch.object(
+            PersistentCacheManager, "set", wraps=PersistentCacheManager.set
+        ) as mock_set:
+            book.build(SolverSettings())
+        mock_set.assert_called_once()  # persisted once complete
+        first_guess = book.lookup([])
+        self.assertIsNotNone(first_guess)
+        self.assertGreater(len(book), 1)
+
+        board = GameBoard(4, 3)
+        board.add_guess(first_guess, (0, 0))
+        expected = Solver(4, 3, SolverSettings(use_opening_book=False)).next_guess(
+            board
+        )
+        self.assertEqual(book.lookup([(first_guess, (0, 0))]), expected)
+
+    def test_build_skips_incomplete_moves(self):
+        """Test that sampled second moves are not recorded"""
+        guess_pool = Solver._guess_pool
+
+        def first_move_only(solver, candidates, history):
+            return guess_pool(solver, candidates, history) if not history else None
+
+        book = OpeningBook.get(4, 3, "minimax")
+        book.build(SolverSettings())
+        complete_moves = len(book)
+
+        PersistentCacheManager.clear_cache()
+        OpeningBook._books.clear()
+        book = OpeningBook.get(4, 3, "minimax")
+        with patch.object(Solver, "_guess_pool", first_move_only):
+            book.build(SolverSettings(transposition_cache_size=0))
+        self.assertIsNotNone(book.lookup([]))
+        self.assertLess(len(book), complete_moves)  # only the trivial second moves
+
+    def test_build_refuses_sampled_dimensions(self):
+        """Test that no book is built for dimensions whose moves are sampled"""
+        with self.assertRaises(ValueError):
+            OpeningBook.get(10, 10, "minimax").build(SolverSettings())
+        with self.assertRaises(ValueError):
+            OpeningBook.get(4, 3, "minimax").build(SolverSettings(mode="sampling"))
+        self.assertEqual(len(OpeningBook.get(4, 3, "minimax")), 0)
+
+    def test_solver_consults_book(self):
+        """Test that the solver does not compute moves stored in the book"""
+        board = GameBoard(6, 4)
+        first_guess = Solver(6, 4).next_guess(board)
+        board.add_guess(first_guess, (1, 0))
+        second_guess = Solver(6, 4).next_guess(board)
+
+        board.clear()
+        solver = Solver(6, 4)
+        with patch.object(Solver, "_compute_guess") as mock_compute:
+            self.assertEqual(solver.next_guess(board), first_guess)
+            board.add_guess(first_guess, (1, 0))
+            self.assertEqual(solver.next_guess(board), second_guess)
+        mock_compute.assert_not_called()
+
+    def test_solver_without_book(self):
+        """Test that the book is not written when disabled"""
+        Solver(6, 4, SolverSettings(use_opening_book=False)).next_guess(GameBoard(6, 4))
+        self.assertEqual(len(OpeningBook.get(6, 4, "minimax")), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
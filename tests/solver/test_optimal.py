@@ -0,0 +1,91 @@
+import unittest
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+from mastermind.solver import DecisionTree, OptimalSolver
+from mastermind.solver.partition import feedback_block
+from mastermind.utils.get_feedback import encode_feedback
+
+
+def exhaustive_cost(
+    number_of_colors: int, number_of_dots: int, max_depth: Optional[int] = None
+) -> float:
+    """Computes the optimal total number of guesses without any pruning"""
+    codes = np.arange(number_of_colors**number_of_dots)
+    table = feedback_block(codes, codes, number_of_colors, number_of_dots)
+    win = encode_feedback(number_of_dots, 0, number_of_dots)
+
+    @lru_cache(maxsize=None)
+    def cost(candidates: tuple, depth_left: Optional[int]) -> float:
+        if depth_left == 0:
+            return float("inf")
+        if len(candidates) == 1:
+            return 1
+        best = float("inf")
+        child_depth = None if depth_left is None else depth_left - 1
+        for guess in codes:
+            feedback = table[guess, list(candidates)]
+            codes_left = [code for code in np.unique(feedback) if code != win]
+            if any((feedback == code).all() for code in codes_left):
+                continue  # the guess does not split the candidates
+            total = len(candidates) + sum(
+                cost(tuple(np.array(candidates)[feedback == code]), child_depth)
+                for code in codes_left
+            )
+            best = min(best, total)
+        return best
+
+    return cost(tuple(codes.tolist()), max_depth)
+
+
+class TestOptimalSolver(unittest.TestCase):
+    """Test suite for the OptimalSolver class"""
+
+    def test_matches_exhaustive_search(self):
+        """Test that the pruned search finds the optimal cost"""
+        for number_of_colors, number_of_dots in [(2, 2), (3, 2), (2, 3), (3, 3)]:
+            with self.subTest(dimension=(number_of_colors, number_of_dots)):
+                self.assertEqual(
+                    OptimalSolver(number_of_colors, number_of_dots).cost(),
+                    exhaustive_cost(number_of_colors, number_of_dots),
+                )
+
+    def test_tree_achieves_cost(self):
+        """Test that the decision tree plays the optimal strategy"""
+        solver = OptimalSolver(4, 4)
+        tree = solver.solve()
+        self.assertIsInstance(tree, DecisionTree)
+        distribution = tree.guess_distribution()
+        self.assertEqual(distribution.sum(), 256)
+        self.assertEqual((distribution.index * distribution).sum(), solver.cost())
+        self.assertEqual(solver.cost(), 905)
+
+    def test_beats_first_candidate(self):
+        """Test that the optimal strategy needs no more guesses than always guessing the first candidate"""
+        first_candidate = DecisionTree.from_strategy(
+            3, 3, lambda candidates, _: candidates.code_at(0)
+        )
+        self.assertLessEqual(
+            OptimalSolver(3, 3).solve().average_guesses, first_candidate.average_guesses
+        )
+
+    def test_max_depth(self):
+        """Test that the depth-limited search respects the maximum number of guesses"""
+        self.assertEqual(
+            OptimalSolver(5, 2, max_depth=4).cost(), exhaustive_cost(5, 2, 4)
+        )
+        tree = OptimalSolver(5, 2, max_depth=4).solve()
+        self.assertLessEqual(tree.max_depth, 4)
+
+    def test_max_depth_too_small(self):
+        """Test that an unreachable maximum number of guesses raises ValueError"""
+        with self.assertRaises(ValueError):
+            OptimalSolver(4, 2, max_depth=3).solve()
+
+    def test_parallel_root(self):
+        """Test that evaluating the first guesses in worker processes gives the same strategy"""
+        sequential = OptimalSolver(3, 3).solve()
+        parallel = OptimalSolver(3, 3, max_workers=2).solve()
+        self.assertEqual(parallel.guesses.tolist(), sequential.guesses.tolist())
@@ -0,0 +1,45 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from mastermind.solver import partition
+from mastermind.solver.partition import partition_histograms, score_guesses
+from mastermind.solver.strategies import minimax_score
+from mastermind.utils import encode_feedback
+
+
+class TestPartition(unittest.TestCase):
+    """Test suite for the partition kernel"""
+
+    def setUp(self):
+        self.all_codes = np.arange(6**4, dtype=np.int64)
+
+    def test_histograms_count_every_candidate(self):
+        """Test that each histogram row sums to the number of candidates"""
+        histograms = partition_histograms(self.all_codes[:10], self.all_codes, 6, 4)
+        self.assertEqual(histograms.shape, (10, 25))
+        self.assertTrue((histograms.sum(axis=1) == 6**4).all())
+
+    def test_histogram_of_knuth_opening(self):
+        """Test the well-known partition of 1122 over the full 6x4 space"""
+        guess = np.array([7], dtype=np.int64)  # index of (1, 1, 2, 2)
+        histogram = partition_histograms(guess, self.all_codes, 6, 4)[0]
+        self.assertEqual(histogram[encode_feedback(4, 0, 4)], 1)
+        self.assertEqual(histogram[encode_feedback(0, 0, 4)], 256)
+        self.assertEqual(minimax_score(histogram[None, :])[0], 256)
+
+    def test_parallel_scores_match_serial(self):
+        """Test that scoring across worker processes gives the same result"""
+        guesses = self.all_codes[::7]
+        candidates = self.all_codes[::3]
+        serial = score_guesses(guesses, candidates, 6, 4)
+        with patch.object(partition, "_PARALLEL_THRESHOLD", 0):
+            parallel = score_guesses(
+                guesses, candidates, 6, 4, "minimax", max_workers=2
+            )
+        np.testing.assert_array_equal(serial, parallel)
+
+
+if __name__ == "__main__":
+    unittest.main()
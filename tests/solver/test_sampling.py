@@ -0,0 +1,131 @@
+import time
+import unittest
+
+import numpy as np
+
+from mastermind.game.board import GameBoard
+from mastermind.solver import CandidateSet, Solver, SolverSettings
+from mastermind.solver.opening_book import OpeningBook
+from mastermind.solver.sampling import sample_consistent, sampled_guess
+from mastermind.utils import generate_feedback
+from mastermind.validation import RangeError
+from tests.temporary_cache import TemporaryCacheMixin
+
+
+class TestSampling(TemporaryCacheMixin, unittest.TestCase):
+    """Test suite for the sampling mode of the solver"""
+
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.history = [((1, 1, 2, 2), (1, 1)), ((1, 3, 4, 5), (0, 2))]
+
+    def _is_consistent(self, code):
+        return all(
+            generate_feedback(guess, code, 6) == feedback
+            for guess, feedback in self.history
+        )
+
+    def test_sample_from_filtered_set(self):
+        """Test that a filtered candidate set is sampled directly"""
+        candidates = CandidateSet(6, 4)
+        for guess, feedback in self.history:
+            candidates.filter(guess, feedback)
+
+        sample, _ = sample_consistent(candidates, self.history, 10, self.rng, 0.0)
+        self.assertEqual(len(sample), 10)
+        for code in sample.tolist():
+            self.assertIn(tuple(code), candidates)
+
+    def test_rejection_sampling(self):
+        """Test that codes drawn from an unfiltered space are all consistent"""
+        candidates = CandidateSet(6, 4)
+        deadline = time.monotonic() + 5
+        sample, _ = sample_consistent(candidates, self.history, 20, self.rng, deadline)
+        self.assertEqual(len(sample), 20)
+        self.assertEqual(len(set(map(tuple, sample.tolist()))), 20)
+        for code in sample.tolist():
+            self.assertTrue(self._is_consistent(tuple(code)))
+
+    def test_fallback_without_consistent_code(self):
+        """Test that the least contradicting code is kept when none is consistent"""
+        candidates = CandidateSet(6, 4)
+        history = [((1, 1, 1, 1), (4, 0)), ((2, 2, 2, 2), (4, 0))]
+        sample, fallback = sample_consistent(candidates, history, 5, self.rng, 0.0)
+        self.assertEqual(len(sample), 0)
+        self.assertIn(fallback, [(1, 1, 1, 1), (2, 2, 2, 2)])
+
+    def test_inconsistent_history_detected(self):
+        """Test that a search completing without a consistent code is told from a timeout"""
+        candidates = CandidateSet(6, 4)
+        history = [((1, 1, 1, 1), (4, 0)), ((2, 2, 2, 2), (4, 0))]
+        deadline = time.monotonic() + 5
+        sample, fallback = sample_consistent(candidates, history, 5, self.rng, deadline)
+        self.assertEqual(len(sample), 0)
+        self.assertIsNone(fallback)
+
+        board = GameBoard(10, 10)
+        board.add_guess((1,) * 10, (0, 0))
+        board.add_guess((1,) + (2,) * 9, (10, 0))
+        with self.assertRaises(Solver.InconsistentFeedbackError):
+            Solver(10, 10, SolverSettings(seed=0)).next_guess(board)
+
+    def test_sampled_guess_is_consistent_when_few_remain(self):
+        """Test that a consistent code is guessed once at most two remain"""
+        candidates = CandidateSet(6, 4)
+        history = [((1, 2, 3, 4), (3, 0)), ((1, 2, 3, 5), (3, 0))]
+        history += [((1, 2, 3, 1), (3, 0)), ((1, 2, 3, 2), (3, 0))]
+        for guess, feedback in history:
+            candidates.filter(guess, feedback)
+
+        guess = sampled_guess(candidates, history, "minimax", 50, self.rng, 1.0)
+        self.assertIn(guess, candidates)
+
+    def test_solver_in_sampling_mode(self):
+        """Test that the sampling mode cracks codes and bypasses the opening book"""
+        settings = SolverSettings(mode="sampling", sample_size=200, seed=0)
+        for secret in [(1, 1, 1, 1), (6, 5, 4, 3), (2, 6, 2, 6)]:
+            board, solver = GameBoard(6, 4), Solver(6, 4, settings)
+            for _ in range(10):
+                guess = solver.next_guess(board)
+                board.add_guess(guess, generate_feedback(guess, secret, 6))
+                if guess == secret:
+                    break
+            self.assertEqual(guess, secret)
+        self.assertEqual(len(OpeningBook.get(6, 4, "minimax")), 0)
+
+    def test_huge_space_is_bounded(self):
+        """Test that a 10x10 move respects the time budget"""
+        board = GameBoard(10, 10)
+        solver = Solver(10, 10, SolverSettings(time_budget=0.2, seed=0))
+        secret = (3, 1, 4, 1, 5, 9, 2, 6, 5, 3)
+        for _ in range(3):
+            start = time.monotonic()
+            guess = solver.next_guess(board)
+            self.assertLess(time.monotonic() - start, 2)
+            self.assertEqual(len(guess), 10)
+            board.add_guess(guess, generate_feedback(guess, secret, 10))
+
+    def test_dimensions_beyond_int64(self):
+        """Test that code spaces whose indices overflow 64 bits are still playable"""
+        for colors, dots in [(10, 19), (2, 70)]:
+            board = GameBoard(colors, dots)
+            solver = Solver(colors, dots, SolverSettings(time_budget=0.2, seed=0))
+            secret = tuple(self.rng.integers(1, colors + 1, dots).tolist())
+            for _ in range(3):
+                guess = solver.next_guess(board)
+                self.assertEqual(len(guess), dots)
+                self.assertTrue(all(1 <= dot <= colors for dot in guess))
+                board.add_guess(guess, generate_feedback(guess, secret, colors))
+
+    def test_settings_validation(self):
+        """Test that invalid sampling settings are rejected"""
+        with self.assertRaises(ValueError):
+            SolverSettings(mode="random")
+        with self.assertRaises(RangeError):
+            SolverSettings(time_budget=0)
+        with self.assertRaises(RangeError):
+            SolverSettings(sample_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
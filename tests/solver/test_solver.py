@@ -0,0 +1,217 @@
+import time
+import unittest
+from itertools import islice
+from unittest.mock import patch
+
+import numpy as np
+
+from mastermind.game.board import GameBoard
+from mastermind.solver import SolverSettings
+from mastermind.solver.candidate_set import CandidateSet
+from mastermind.solver.solver import Solver
+from mastermind.utils import generate_feedback
+from tests.temporary_cache import TemporaryCacheMixin
+
+
+class TestSolver(TemporaryCacheMixin, unittest.TestCase):
+    """Test suite for the Solver class"""
+
+    def setUp(self):
+        self.board = GameBoard(6, 4)
+        self.solver = Solver(6, 4)
+
+    def _play(self, secret, limit=10):
+        for _ in range(limit):
+            guess = self.solver.next_guess(self.board)
+            feedback = generate_feedback(guess, secret, 6)
+            self.board.add_guess(guess, feedback)
+            if feedback == (4, 0):
+                return len(self.board)
+        return None
+
+    def test_first_guess(self):
+        """Test that the first guess is Knuth's opening"""
+        self.assertEqual(self.solver.next_guess(self.board), (1, 1, 2, 2))
+
+    def test_solves_games_within_five_guesses(self):
+        """Test that minimax cracks 6x4 secrets within Knuth's bound of five guesses"""
+        for secret in [(1, 1, 1, 1), (6, 5, 4, 3), (2, 6, 2, 6), (3, 1, 4, 1)]:
+            self.board.clear()
+            self.assertLessEqual(self._play(secret), 5, secret)
+
+    def test_small_candidate_set(self):
+        """Test that a consistent code is guessed once at most two remain"""
+        self.board.add_guess((1, 2, 3, 4), (3, 0))
+        self.board.add_guess((1, 2, 3, 5), (3, 0))
+        self.board.add_guess((1, 2, 3, 1), (3, 0))
+        self.board.add_guess((1, 2, 3, 2), (3, 0))  # leaves 1233 and 1236
+        guess = self.solver.next_guess(self.board)
+        self.assertIn(guess, self.solver.candidates)
+
+    def test_sync_is_incremental(self):
+        """Test that only new board entries are applied"""
+        self.board.add_guess((1, 1, 2, 2), (1, 0))
+        self.solver.sync(self.board)
+        remaining = len(self.solver.candidates)
+        self.solver.sync(self.board)
+        self.assertEqual(len(self.solver.candidates), remaining)
+        self.assertEqual(len(self.solver._history), 1)
+
+    def test_sync_after_undo(self):
+        """Test that the candidate set follows the board when it diverges"""
+        self.board.add_guess((1, 1, 2, 2), (1, 0))
+        self.solver.sync(self.board)
+        self.board.remove_last()
+        self.board.add_guess((3, 3, 4, 4), (0, 2))
+        candidates = self.solver.sync(self.board)
+        for position in range(len(candidates)):
+            code = candidates.code_at(position)
+            self.assertEqual(generate_feedback((3, 3, 4, 4), code, 6), (0, 2))
+
+    def test_undo_and_redo_restore_snapshots(self):
+        """Test that undoing and redoing entries restores the candidate set without filtering"""
+        self.board.add_guess((1, 1, 2, 2), (1, 0))
+        self.board.add_guess((2, 3, 4, 4), (0, 2))
+        after_two = self.solver.sync(self.board).indices.copy()
+        self.board.remove_last()
+        after_one = self.solver.sync(self.board).indices.copy()
+        self.assertGreater(len(after_one), len(after_two))
+
+        with patch.object(CandidateSet, "filter") as mock_filter:
+            self.board.add_guess((2, 3, 4, 4), (0, 2))
+            np.testing.assert_array_equal(
+                self.solver.sync(self.board).indices, after_two
+            )
+            self.board.remove_last()
+            np.testing.assert_array_equal(
+                self.solver.sync(self.board).indices, after_one
+            )
+            self.board.clear()
+            self.assertTrue(self.solver.sync(self.board).is_full)
+        mock_filter.assert_not_called()
+
+    def test_redo_after_new_entry(self):
+        """Test that undone entries are forgotten once the board takes another path"""
+        self.board.add_guess((1, 1, 2, 2), (1, 0))
+        self.solver.sync(self.board)
+        self.board.remove_last()
+        self.board.add_guess((1, 1, 2, 2), (0, 1))
+        candidates = self.solver.sync(self.board)
+        for position in range(len(candidates)):
+            code = candidates.code_at(position)
+            self.assertEqual(generate_feedback((1, 1, 2, 2), code, 6), (0, 1))
+        self.assertEqual(self.solver._redo, [])
+
+    def test_move_deadline(self):
+        """Test that a move cut off by its deadline plays the best consistent guess scored"""
+        self.board.add_guess((1, 1, 2, 2), (1, 0))
+        self.board.add_guess((1, 3, 4, 5), (1, 1))
+        settings = SolverSettings(move_deadline=1e-9, transposition_cache_size=0)
+        solver = Solver(6, 4, settings)
+        with patch("mastermind.solver.solver._DEADLINE_CHUNK_PAIRS", 1):
+            guess = solver.next_guess(self.board)
+        self.assertFalse(solver.last_move_complete)
+        self.assertIn(guess, solver.candidates)
+
+    def test_move_deadline_not_reached(self):
+        """Test that a move finishing before its deadline is the exhaustive move"""
+        self.board.add_guess((1, 1, 2, 2), (1, 0))
+        self.board.add_guess((1, 3, 4, 5), (1, 1))
+        expected = Solver(6, 4, SolverSettings(transposition_cache_size=0)).next_guess(
+            self.board
+        )
+        solver = Solver(
+            6, 4, SolverSettings(move_deadline=60, transposition_cache_size=0)
+        )
+        with patch("mastermind.solver.solver._DEADLINE_CHUNK_PAIRS", 1):
+            self.assertEqual(solver.next_guess(self.board), expected)
+        self.assertTrue(solver.last_move_complete)
+
+    def test_time_budget_covers_the_move(self):
+        """Test that the time budget bounds exhaustive moves and counts the time already spent"""
+        self.board.add_guess((1, 1, 2, 2), (1, 0))
+        self.board.add_guess((1, 3, 4, 5), (1, 1))
+        solver = Solver(
+            6, 4, SolverSettings(time_budget=1e-9, transposition_cache_size=0)
+        )
+        with patch("mastermind.solver.solver._DEADLINE_CHUNK_PAIRS", 1):
+            guess = solver.next_guess(self.board)
+        self.assertFalse(solver.last_move_complete)
+        self.assertIn(guess, solver.candidates)
+
+        solver = Solver(6, 4, SolverSettings(mode="sampling", time_budget=2.0))
+        candidates = solver.sync(self.board)
+        with patch(
+            "mastermind.solver.solver.sampled_guess", return_value=(1, 2, 3, 4)
+        ) as mock_sampled_guess:
+            solver.choose_guess(candidates, solver._history, time.monotonic() - 1.5)
+        self.assertLessEqual(mock_sampled_guess.call_args.args[-1], 0.5)
+
+    def test_count_candidates(self):
+        """Test that candidates are counted exactly, or up to a limit when streamed"""
+        self.board.add_guess((1, 1, 2, 2), (1, 0))
+        self.assertEqual(self.solver.count_candidates(self.board), (256, True))
+
+        board, solver = GameBoard(10, 10), Solver(10, 10)
+        board.add_guess((1,) * 5 + (2,) * 5, (0, 2))
+        self.assertEqual(solver.count_candidates(board, limit=50), (51, False))
+        board.add_guess((1,) * 10, (0, 0))
+        board.add_guess((2,) * 10, (2, 0))
+        board.add_guess((3,) * 5 + (2,) * 5, (2, 0))
+        self.assertEqual(solver.count_candidates(board, limit=50), (0, True))
+
+    def test_count_candidates_deadline(self):
+        """Test that streamed counts stop at the deadline and are marked as lower bounds"""
+        board, solver = GameBoard(10, 10), Solver(10, 10)
+        board.add_guess((1, 2, 3, 4, 5, 6, 7, 8, 9, 10), (2, 3))
+        start = time.monotonic()
+        count, exact = solver.count_candidates(board, deadline=start)
+        self.assertFalse(exact)
+        self.assertLess(time.monotonic() - start, 1.0)
+
+        codes = self.solver.iter_candidates(self.board, deadline=start)
+        self.assertEqual(len(list(codes)), 6**4)  # a single block is streamed
+
+    def test_iter_candidates(self):
+        """Test that the candidates are streamed in lexicographic order"""
+        self.board.add_guess((1, 1, 2, 2), (1, 0))
+        codes = list(self.solver.iter_candidates(self.board))
+        candidates = self.solver.candidates
+        expected = [candidates.code_at(i) for i in range(len(candidates))]
+        self.assertEqual(codes, expected)
+
+    def test_iter_candidates_without_enumeration(self):
+        """Test that candidates of a huge code space are streamed lazily"""
+        board, solver = GameBoard(10, 10), Solver(10, 10)
+        secret = (3, 1, 4, 1, 5, 9, 2, 6, 5, 3)
+        for guess in [(1,) * 5 + (2,) * 5, (3, 4, 5, 6, 7) * 2]:
+            board.add_guess(guess, generate_feedback(guess, secret, 10))
+        codes = list(islice(solver.iter_candidates(board), 3))
+        self.assertEqual(codes, sorted(codes))
+        for code in codes:
+            for guess, feedback in solver._history:
+                self.assertEqual(generate_feedback(guess, code, 10), feedback)
+
+    def test_samples_opening(self):
+        """Test that only dimensions too large to score exhaustively sample their first move"""
+        self.assertFalse(Solver.samples_opening(6, 4))
+        self.assertTrue(Solver.samples_opening(10, 10))
+        self.assertTrue(Solver.samples_opening(6, 4, SolverSettings(mode="sampling")))
+        self.assertFalse(
+            Solver.samples_opening(8, 7, SolverSettings(mode="exhaustive"))
+        )
+
+    def test_inconsistent_feedback(self):
+        """Test that contradictory feedback raises an error"""
+        self.board.add_guess((1, 1, 1, 1), (0, 0))
+        self.board.add_guess((2, 2, 2, 2), (0, 0))
+        self.board.add_guess((3, 3, 3, 3), (0, 0))
+        self.board.add_guess((4, 4, 4, 4), (0, 0))
+        self.board.add_guess((5, 5, 5, 5), (0, 0))
+        self.board.add_guess((6, 6, 6, 6), (0, 0))
+        with self.assertRaises(Solver.InconsistentFeedbackError):
+            self.solver.next_guess(self.board)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+
+import numpy as np
+
+from mastermind.game.board import GameBoard
+from mastermind.game.game import Game
+from mastermind.solver import STRATEGIES, Solver, SolverSettings
+from mastermind.solver.strategies import get_strategy, register_strategy
+from mastermind.utils import generate_feedback
+from tests.temporary_cache import TemporaryCacheMixin
+
+
+class TestStrategies(TemporaryCacheMixin, unittest.TestCase):
+    """Test suite for the guess-scoring strategies"""
+
+    def setUp(self):
+        # Three guesses splitting 8 candidates as 4+4, 6+1+1 and 2+2+2+2
+        self.histograms = np.array(
+            [
+                [4, 4, 0, 0],
+                [6, 1, 1, 0],
+                [2, 2, 2, 2],
+            ]
+        )
+
+    def test_registered_strategies(self):
+        """Test that the built-in strategies are registered"""
+        for name in ["minimax", "entropy", "expected_size", "most_parts"]:
+            self.assertIn(name, STRATEGIES)
+
+    def test_minimax(self):
+        np.testing.assert_array_equal(
+            get_strategy("minimax")(self.histograms), [4, 6, 2]
+        )
+
+    def test_expected_size(self):
+        np.testing.assert_allclose(
+            get_strategy("expected_size")(self.histograms), [4, 38 / 8, 2]
+        )
+
+    def test_entropy(self):
+        np.testing.assert_allclose(
+            get_strategy("entropy")(self.histograms),
+            [-1, -(0.75 * np.log2(1 / 0.75) + 0.25 * 3), -2],
+        )
+
+    def test_most_parts(self):
+        np.testing.assert_array_equal(
+            get_strategy("most_parts")(self.histograms), [-2, -3, -4]
+        )
+
+    def test_unknown_strategy(self):
+        with self.assertRaises(ValueError):
+            get_strategy("unknown")
+        with self.assertRaises(ValueError):
+            SolverSettings(strategy="unknown")
+
+    def test_register_strategy(self):
+        """Test that a custom strategy can be registered and selected"""
+
+        @register_strategy("fewest_black")
+        def fewest_black(histograms):
+            return -histograms[:, 0]
+
+        try:
+            self.assertEqual(
+                SolverSettings(strategy="fewest_black").strategy, "fewest_black"
+            )
+        finally:
+            del STRATEGIES["fewest_black"]
+
+    def test_every_strategy_cracks_the_code(self):
+        """Test that each strategy solves a game"""
+        secret = (4, 2, 6, 1)
+        for name in ["minimax", "entropy", "expected_size", "most_parts"]:
+            board = GameBoard(6, 4)
+            solver = Solver(6, 4, SolverSettings(strategy=name))
+            for _ in range(7):
+                guess = solver.next_guess(board)
+                board.add_guess(guess, generate_feedback(guess, secret, 6))
+                if guess == secret:
+                    break
+            self.assertEqual(board.last_guess(), secret, name)
+
+    def test_strategy_selected_from_game(self):
+        """Test that the strategy is selectable when constructing a Game"""
+        game = Game(6, 4, 10, "AIvH", SolverSettings(strategy="entropy"))
+        self.assertEqual(game._player_logic.solver_settings.strategy, "entropy")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+
+from mastermind.game.board import GameBoard
+from mastermind.solver import Solver, SolverSettings
+from mastermind.solver.symmetry import _position_classes, canonical_guesses
+from mastermind.utils import decode_codes, generate_feedback
+from tests.temporary_cache import TemporaryCacheMixin
+
+
+class TestSymmetry(TemporaryCacheMixin, unittest.TestCase):
+    """Test suite for the symmetry reduction"""
+
+    def test_position_classes(self):
+        """Test that positions are grouped by the columns of past guesses"""
+        self.assertEqual(_position_classes([], 4).tolist(), [0, 0, 0, 0])
+        self.assertEqual(
+            _position_classes([(1, 1, 2, 2), (3, 3, 3, 4)], 4).tolist(), [0, 0, 1, 2]
+        )
+
+    def test_empty_history(self):
+        """Test that without history only the color patterns remain"""
+        representatives = canonical_guesses(np.arange(6**4), [], 6, 4)
+        codes = [tuple(code) for code in decode_codes(representatives, 6, 4)]
+        self.assertEqual(
+            codes,
+            [(1, 1, 1, 1), (1, 1, 1, 2), (1, 1, 2, 2), (1, 1, 2, 3), (1, 2, 3, 4)],
+        )
+
+    def test_representatives_after_guess(self):
+        """Test that colors used in a guess are no longer interchangeable"""
+        representatives = canonical_guesses(np.arange(6**4), [(1, 1, 2, 2)], 6, 4)
+        codes = {tuple(code) for code in decode_codes(representatives, 6, 4)}
+        self.assertIn((1, 1, 2, 2), codes)
+        self.assertIn((2, 2, 1, 1), codes)
+        self.assertIn((1, 3, 2, 4), codes)
+        self.assertNotIn((1, 4, 2, 3), codes)  # same class as 1324
+        self.assertNotIn((3, 1, 2, 4), codes)  # same class as 1324
+
+    def test_same_moves_as_full_scoring(self):
+        """Test that the reduction does not change the chosen guesses"""
+        for secret in [(6, 6, 1, 2), (3, 4, 5, 6), (2, 2, 2, 5)]:
+            board = GameBoard(6, 4)
+            reduced = Solver(6, 4, SolverSettings(use_opening_book=False))
+            full = Solver(
+                6, 4, SolverSettings(use_opening_book=False, use_symmetry=False)
+            )
+            while not board or board.last_feedback() != (4, 0):
+                guess = reduced.next_guess(board)
+                self.assertEqual(guess, full.next_guess(board))
+                board.add_guess(guess, generate_feedback(guess, secret, 6))
+
+
+if __name__ == "__main__":
+    unittest.main()
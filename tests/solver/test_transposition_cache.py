@@ -0,0 +1,81 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from mastermind.game.board import GameBoard
+from mastermind.solver import Solver, SolverSettings
+from mastermind.solver.opening_book import OpeningBook
+from mastermind.solver.transposition_cache import TranspositionCache
+from mastermind.storage.persistent_cache import PersistentCacheManager
+from tests.temporary_cache import TemporaryCacheMixin
+
+
+class TestTranspositionCache(TemporaryCacheMixin, unittest.TestCase):
+    """Test suite for the TranspositionCache class"""
+
+    def setUp(self):
+        PersistentCacheManager.clear_cache()
+        OpeningBook._books.clear()
+        TranspositionCache._caches.clear()
+
+    def test_store_and_lookup(self):
+        """Test that stored moves are looked up by candidate set and counted"""
+        cache = TranspositionCache(6, 4, "minimax")
+        self.assertIsNone(cache.lookup(np.array([3, 5, 8])))
+        cache.store(np.array([3, 5, 8]), 12, 2.0)
+        self.assertEqual(cache.lookup(np.array([3, 5, 8], dtype=np.int32)), (12, 2.0))
+        self.assertIsNone(cache.lookup(np.array([3, 5])))
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_least_recently_used_eviction(self):
+        """Test that the least recently used move is evicted once the cache is full"""
+        cache = TranspositionCache(6, 4, "minimax", max_size=2)
+        cache.store(np.array([1]), 1, 1.0)
+        cache.store(np.array([2]), 2, 1.0)
+        cache.lookup(np.array([1]))
+        cache.store(np.array([3]), 3, 1.0)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.lookup(np.array([1])))
+        self.assertIsNone(cache.lookup(np.array([2])))
+
+    def test_persistence(self):
+        """Test that a persistent cache is reloaded in a new session"""
+        TranspositionCache.get(6, 4, "minimax", persistent=True).store(
+            np.array([4, 9]), 7, 1.0
+        )
+        TranspositionCache._caches.clear()  # simulate a new session
+        self.assertEqual(
+            TranspositionCache.get(6, 4, "minimax", persistent=True).lookup(
+                np.array([4, 9])
+            ),
+            (7, 1.0),
+        )
+        self.assertIsNone(
+            TranspositionCache.get(6, 4, "entropy").lookup(np.array([4, 9]))
+        )
+
+    def test_solver_reuses_moves(self):
+        """Test that the solver does not recompute a move for a known candidate set"""
+        board = GameBoard(4, 3)
+        board.add_guess((1, 1, 2), (0, 1))
+        board.add_guess((2, 3, 3), (1, 0))
+        expected = Solver(4, 3).next_guess(board)
+
+        cache = TranspositionCache.get(4, 3, "minimax")
+        with patch.object(Solver, "_compute_guess") as mock_compute:
+            self.assertEqual(Solver(4, 3).next_guess(board), expected)
+        mock_compute.assert_not_called()
+        self.assertEqual(cache.hits, 1)
+
+    def test_solver_without_cache(self):
+        """Test that a size of 0 disables the cache"""
+        board = GameBoard(4, 3)
+        board.add_guess((1, 1, 2), (0, 1))
+        board.add_guess((2, 3, 3), (1, 0))
+        Solver(4, 3, SolverSettings(transposition_cache_size=0)).next_guess(board)
+        self.assertEqual(len(TranspositionCache._caches), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from mastermind.storage.atomic_file import atomic_open, backup_paths
+
+
+class TestAtomicOpen(unittest.TestCase):
+    """Test suite for the atomic_open function"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "file.bin")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def read(self, path):
+        with open(path, "rb") as file:
+            return file.read()
+
+    def test_write(self):
+        """Test that the file is replaced once the block exits, and fsynced"""
+        with patch("os.fsync", wraps=os.fsync) as mock_fsync:
+            with atomic_open(self.file_path) as file:
+                file.write(b"new")
+                self.assertFalse(os.path.exists(self.file_path))
+        mock_fsync.assert_called()
+        self.assertEqual(self.read(self.file_path), b"new")
+        self.assertEqual(os.listdir(self.temp_dir.name), ["file.bin"])
+
+    def test_failed_write_keeps_file(self):
+        """Test that an error inside the block leaves the file untouched"""
+        with atomic_open(self.file_path) as file:
+            file.write(b"old")
+        with self.assertRaises(RuntimeError):
+            with atomic_open(self.file_path) as file:
+                file.write(b"partial")
+                raise RuntimeError("killed mid-write")
+        self.assertEqual(self.read(self.file_path), b"old")
+        self.assertEqual(os.listdir(self.temp_dir.name), ["file.bin"])
+
+    def test_rotating_backups(self):
+        """Test that the previous versions are kept as rotating backups"""
+        for version in range(4):
+            with atomic_open(self.file_path, backups=2) as file:
+                file.write(str(version).encode())
+        self.assertEqual(self.read(self.file_path), b"3")
+        self.assertEqual(
+            [self.read(path) for path in backup_paths(self.file_path, 2)],
+            [b"2", b"1"],
+        )
+        self.assertFalse(os.path.exists(f"{self.file_path}.3"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import unittest
+
+import numpy as np
+
+from mastermind.storage.feedback_table import FeedbackTableManager
+from mastermind.utils.code_codec import decode_codes
+from mastermind.utils.get_feedback import decode_feedback, generate_feedback
+from tests.temporary_cache import TemporaryCacheMixin
+
+
+class TestFeedbackTableManager(TemporaryCacheMixin, unittest.TestCase):
+    """Test suite for the FeedbackTableManager class"""
+
+    def setUp(self):
+        FeedbackTableManager.clear_tables()
+
+    def test_table_matches_generate_feedback(self):
+        """Test that the table holds the feedback of every pair of codes"""
+        table = FeedbackTableManager.get_table(3, 3)
+        codes = decode_codes(np.arange(27), 3, 3)
+        self.assertEqual(table.shape, (27, 27))
+        for i, guess in enumerate(codes):
+            for j, secret in enumerate(codes):
+                self.assertEqual(
+                    decode_feedback(table[i, j], 3),
+                    generate_feedback(tuple(guess), tuple(secret), 3),
+                )
+
+    def test_table_is_persisted_and_memory_mapped(self):
+        """Test that the table is written to disk and mapped on later access"""
+        FeedbackTableManager.get_table(4, 2)
+        file_path = FeedbackTableManager._get_table_file_path(4, 2)
+        self.assertTrue(os.path.exists(file_path))
+
+        FeedbackTableManager._tables.clear()  # simulate a new process
+        table = FeedbackTableManager.get_table(4, 2, build=False)
+        self.assertIsInstance(table, np.memmap)
+        self.assertFalse(table.flags.writeable)
+
+    def test_missing_table_without_build(self):
+        """Test that a missing table is not built when build is False"""
+        self.assertIsNone(FeedbackTableManager.get_table(2, 3, build=False))
+
+    def test_too_large_dimension(self):
+        """Test that code spaces above the limit are not tabulated"""
+        self.assertFalse(FeedbackTableManager.supports(10, 10))
+        self.assertIsNone(FeedbackTableManager.get_table(10, 10))
+        with self.assertRaises(ValueError):
+            FeedbackTableManager.build_table(10, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
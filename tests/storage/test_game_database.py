@@ -0,0 +1,147 @@
+import os
+import tempfile
+import unittest
+
+from mastermind.storage.game_database import GameDatabase
+
+
+def meta_data(game_mode, win_status, dimension=(4, 4), game=None):
+    """Returns saved game meta data, with a stand-in for the Game object."""
+    return {
+        "game_mode": game_mode,
+        "number_of_colors": dimension[0],
+        "number_of_dots": dimension[1],
+        "amount_attempted": 3,
+        "amount_allowed": 10,
+        "win_status": win_status,
+        "guesses": [1, 2, 3],
+        **({"game": game} if game is not None else {}),
+    }
+
+
+class TestGameDatabase(unittest.TestCase):
+    """Test suite for the GameDatabase class"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "userdata.sqlite3")
+        self.database = GameDatabase(self.file_path)
+        self.games = [
+            meta_data("HvH", True),
+            meta_data("HvAI", None, game="paused"),
+            meta_data("AIvH", False, dimension=(6, 4)),
+            meta_data("HvAI", None, dimension=(6, 4), game="also paused"),
+        ]
+
+    def tearDown(self):
+        self.database.close()
+        self.temp_dir.cleanup()
+
+    def test_items(self):
+        """Test that items are stored one row per key and survive reopening"""
+        self.database.set_item("theme", "dark")
+        self.database.set_item("theme", "light")
+        self.database.set_item("volume", 3)
+        self.database.close()
+
+        self.database = GameDatabase(self.file_path)
+        self.assertEqual(self.database.load_items(), {"theme": "light", "volume": 3})
+
+    def test_saved_games_behave_as_a_list(self):
+        """Test that the saved games support the list operations used by the game"""
+        saved_games = self.database.saved_games
+        for game in self.games:
+            saved_games.append(game)
+        self.assertEqual(len(saved_games), 4)
+        self.assertEqual(list(saved_games), self.games)
+        self.assertEqual(saved_games[-1], self.games[3])
+        self.assertEqual(saved_games[1:3], self.games[1:3])
+
+        saved_games[1] = meta_data("HvAI", True)
+        self.assertEqual(saved_games.pop(0), self.games[0])
+        saved_games.insert(1, self.games[0])
+        self.assertEqual(
+            list(saved_games),
+            [meta_data("HvAI", True), self.games[0], *self.games[2:]],
+        )
+        with self.assertRaises(IndexError):
+            saved_games[4]
+
+    def test_positions_are_row_ids(self):
+        """Test that the row ids stay dense, so indexed access needs no scan"""
+        saved_games = self.database.saved_games
+        saved_games.replace(self.games)
+        del saved_games[1]
+        saved_games.insert(0, self.games[1])
+        saved_games.append(self.games[0])
+
+        statements = []
+        self.database._connection.set_trace_callback(statements.append)
+        self.assertEqual(saved_games[-1], self.games[0])
+        self.assertFalse(
+            [sql for sql in statements if "COUNT" in sql or "OFFSET" in sql]
+        )
+        self.database._connection.set_trace_callback(None)
+
+        ids = [
+            row_id
+            for (row_id,) in self.database._connection.execute(
+                "SELECT id FROM games ORDER BY id"
+            )
+        ]
+        self.assertEqual(ids, [1, 2, 3, 4, 5])
+        self.assertEqual(
+            list(saved_games),
+            [self.games[1], self.games[0], self.games[2], self.games[3], self.games[0]],
+        )
+        self.assertEqual(saved_games.continuable_indices(), [0, 3])
+
+    def test_gaps_are_renumbered(self):
+        """Test that row ids left with gaps by earlier versions are made dense on opening"""
+        self.database.saved_games.replace(self.games)
+        with self.database._connection:
+            self.database._connection.execute("DELETE FROM games WHERE id = 2")
+            self.database._connection.execute("UPDATE games SET id = 9 WHERE id = 4")
+        self.database.close()
+
+        self.database = GameDatabase(self.file_path)
+        saved_games = self.database.saved_games
+        self.assertEqual(len(saved_games), 3)
+        self.assertEqual(list(saved_games), [self.games[0], *self.games[2:]])
+        self.assertEqual(saved_games[2], self.games[3])
+
+    def test_queries(self):
+        """Test that listings and continuable games are selected by indexed columns"""
+        saved_games = self.database.saved_games
+        saved_games.replace(self.games)
+        listing = [
+            {key: game[key] for key in ("game_mode", "win_status")}
+            for game in saved_games.listing()
+        ]
+        self.assertEqual(
+            listing,
+            [
+                {"game_mode": game["game_mode"], "win_status": game["win_status"]}
+                for game in self.games
+            ],
+        )
+        self.assertNotIn("guesses", saved_games.listing()[0])
+        self.assertEqual(saved_games.continuable_indices(), [1, 3])
+        self.assertEqual(
+            [game["number_of_colors"] for game in saved_games.listing(True)], [4, 6]
+        )
+        self.assertEqual(
+            len(saved_games.listing(game_mode="HvAI", number_of_colors=6)), 1
+        )
+
+    def test_import_and_export(self):
+        """Test that the whole user data round-trips through the database"""
+        data = {"saved_games": self.games, "theme": "dark"}
+        self.database.import_data(data)
+        self.assertEqual(self.database.export_data(), data)
+        self.database.clear()
+        self.assertEqual(self.database.export_data(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from mastermind.storage.tracked_list import TrackedList, apply_change
+
+
+class TestTrackedList(unittest.TestCase):
+    """Test suite for the TrackedList class"""
+
+    def setUp(self):
+        self.items = [1, 2, 3]
+        self.changes = []
+        self.tracked = TrackedList(self.items, self.changes.append)
+
+    def test_changes_are_reported(self):
+        """Test that each change is applied to the list and reported with a non-negative index"""
+        self.tracked.append(4)
+        self.tracked[-1] = 5
+        self.tracked.insert(-10, 0)
+        del self.tracked[1]
+        self.assertEqual(self.items, [0, 2, 3, 5])
+        self.assertEqual(
+            self.changes,
+            [("insert", 3, 4), ("set", 3, 5), ("insert", 0, 0), ("delete", 1, None)],
+        )
+
+    def test_slice_changes(self):
+        """Test that changes through slices ask for the whole list to be written"""
+        self.tracked[1:] = [7]
+        del self.tracked[:1]
+        self.assertEqual(self.items, [7])
+        self.assertEqual(self.changes, [None, None])
+
+    def test_apply_change(self):
+        """Test that replaying the reported changes on a copy gives the same list"""
+        copy = list(self.items)
+        self.tracked.extend([4, 5])
+        self.tracked.remove(2)
+        self.tracked.reverse()
+        for change in self.changes:
+            apply_change(copy, change)
+        self.assertEqual(copy, self.items)
+        self.assertEqual(self.tracked, copy)
+
+    def test_index_out_of_range(self):
+        """Test that out of range indices raise without reporting a change"""
+        with self.assertRaises(IndexError):
+            self.tracked[3] = 0
+        with self.assertRaises(IndexError):
+            del self.tracked[-4]
+        self.assertEqual(self.changes, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,6 +18,7 @@ class TestUserDataManager(unittest.TestCase):
 
     @classmethod
     def tearDownClass(cls):
+        UserDataManager().flush()
         cls.temp_dir.cleanup()
         UserDataManager._file_path = "data/userdata.config"
 
@@ -41,26 +42,46 @@ class TestUserDataManager(unittest.TestCase):
             manager._load_data()
             self.assertEqual(manager._data, self.test_data)
 
-        with patch(
-            "builtins.open", unittest.mock.mock_open(read_data=b"corrupted data")
-        ):
+        with open(self.file_path, "wb") as file:
+            file.write(b"corrupted data")
+        with patch.object(UserDataManager, "_backup_count", 0):
             self.assertEqual(manager._data, self.test_data)
             manager = UserDataManager()
             manager._load_data()
             self.assertEqual(manager._data, {})
 
-    @patch("builtins.input", side_effect=["y"])
-    def test_save_data(self, mock_input):
+    def test_save_data(self):
         """Test that data is saved to the file"""
-        with patch("builtins.open", unittest.mock.mock_open()) as mock_file:
-            manager = UserDataManager()
-            manager._data = self.test_data
-            manager.save_data()
-            mock_file().write.assert_called_with(pickle.dumps(self.test_data))
+        manager = UserDataManager()
+        manager._data = self.test_data
+        manager.save_data()
+        with open(self.file_path, "rb") as file:
+            self.assertEqual(pickle.load(file), self.test_data)
 
+        with patch("os.replace", side_effect=PermissionError()):
+            manager._data = {"unsaved": True}
             with self.assertRaises(PermissionError):
-                mock_file.side_effect = PermissionError()
                 manager.save_data()
+        with open(self.file_path, "rb") as file:
+            self.assertEqual(pickle.load(file), self.test_data)  # left untouched
+        self.assertEqual(os.listdir(self.temp_dir.name).count("userdata.config"), 1)
+
+    @patch("builtins.input", side_effect=["n"])
+    def test_restore_from_backup(self, mock_input):
+        """Test that a data file that cannot be loaded is replaced by its backup"""
+        manager = UserDataManager()
+        manager.clear_all()
+        manager["kept"] = 1
+        manager.flush()
+        manager["newer"] = 2
+        manager.flush()
+        with open(self.file_path, "wb") as file:
+            file.write(b"corrupted data")
+
+        with patch("builtins.print"):
+            manager._load_data()
+        self.assertEqual(manager._data, {"kept": 1})
+        mock_input.assert_not_called()
 
     def test_clear_all(self):
         """Test that all data can be cleared"""
@@ -83,6 +104,7 @@ class TestUserDataManager(unittest.TestCase):
         manager._data = self.test_data
         manager._modify_item("test_key", "new_value")
         self.assertEqual(manager._data["test_key"], "new_value")
+        manager.flush()
         self.assertTrue(os.path.exists(self.file_path))
 
     def test_getattr_and_setattr(self):
@@ -90,6 +112,7 @@ class TestUserDataManager(unittest.TestCase):
         manager = UserDataManager()
         manager.test_attr = "test_value"
         self.assertEqual(manager.test_attr, "test_value")
+        manager.flush()
         self.assertTrue(os.path.exists(self.file_path))
 
     def test_getitem_and_setitem(self):
@@ -97,6 +120,7 @@ class TestUserDataManager(unittest.TestCase):
         manager = UserDataManager()
         manager["test_key"] = "test_value"
         self.assertEqual(manager["test_key"], "test_value")
+        manager.flush()
         self.assertTrue(os.path.exists(self.file_path))
 
     def test_contains(self):
@@ -106,6 +130,256 @@ class TestUserDataManager(unittest.TestCase):
         self.assertTrue("test_key" in manager)
         self.assertFalse("non_existent_key" in manager)
 
+    def test_journal_mode(self):
+        """Test that the journal mode appends changes and replays them on load"""
+        manager = UserDataManager()
+        manager.clear_all()
+        UserDataManager.set_storage_mode("journal")
+        try:
+            with patch("pickle.dump", wraps=pickle.dump) as mock_dump:
+                manager["first"] = [1, 2]
+                manager["second"] = "value"
+                manager.flush()
+                manager["first"] = [3]
+                manager.flush()
+            self.assertEqual(
+                [call.args[0] for call in mock_dump.call_args_list],
+                [
+                    manager._snapshot_id,
+                    ("first", [1, 2]),
+                    ("second", "value"),
+                    ("first", [3]),
+                ],
+            )  # a header, then only the changed keys
+
+            manager._load_data()
+            self.assertEqual(manager._data, {"first": [3], "second": "value"})
+            self.assertEqual(manager._journal_records, 3)
+
+            manager.clear_all()
+            manager["third"] = 3
+            manager.flush()
+            manager._load_data()
+            self.assertEqual(manager._data, {"third": 3})
+        finally:
+            UserDataManager.set_storage_mode("pickle")
+        self.assertFalse(os.path.exists(manager._journal_path()))
+        manager._load_data()
+        self.assertEqual(manager._data, {"third": 3})
+
+    def test_journal_compaction(self):
+        """Test that the journal is folded into the data file in the background"""
+        manager = UserDataManager()
+        manager.clear_all()
+        UserDataManager.set_storage_mode("journal")
+        UserDataManager._compaction_threshold = 3
+        try:
+            for value in range(3):
+                manager["counter"] = value
+                manager.flush()
+            manager._compactor.join()
+            self.assertFalse(os.path.exists(manager._journal_path()))
+            self.assertEqual(manager._journal_records, 0)
+            with open(self.file_path, "rb") as file:
+                self.assertEqual(pickle.load(file), {"counter": 2})
+        finally:
+            UserDataManager._compaction_threshold = 256
+            UserDataManager.set_storage_mode("pickle")
+
+    def test_journal_torn_record(self):
+        """Test that a record torn by a crash is dropped when the journal is replayed"""
+        manager = UserDataManager()
+        manager.clear_all()
+        UserDataManager.set_storage_mode("journal")
+        try:
+            manager["kept"] = True
+            manager.flush()
+            with open(manager._journal_path(), "ab") as file:
+                file.write(pickle.dumps(("lost", "value"))[:-3])
+
+            manager._load_data()
+            self.assertEqual(manager._data, {"kept": True})
+            manager["after"] = 1
+            manager.flush()
+            manager._load_data()
+            self.assertEqual(manager._data, {"kept": True, "after": 1})
+        finally:
+            UserDataManager.set_storage_mode("pickle")
+
+    def test_journal_crash_after_snapshot(self):
+        """Test that a journal left by a crash after its snapshot was written is not replayed"""
+        manager = UserDataManager()
+        manager.clear_all()
+        UserDataManager.set_storage_mode("journal")
+        try:
+            manager["counter"] = 1
+            manager["cleared"] = True
+            manager.flush()
+            manager.clear_all()
+            manager["counter"] = 2  # newer than the journal, not flushed yet
+            with patch("mastermind.storage.user_data.remove_journal"):
+                manager.save_data()  # crashes before deleting the journal
+            self.assertTrue(os.path.exists(manager._journal_path()))
+
+            manager._load_data()
+            self.assertEqual(manager._data, {"counter": 2})
+            self.assertFalse(os.path.exists(manager._journal_path()))
+
+            manager["after"] = 3
+            manager.flush()
+            manager._load_data()
+            self.assertEqual(manager._data, {"counter": 2, "after": 3})
+        finally:
+            UserDataManager.set_storage_mode("pickle")
+
+    def test_sqlite_mode(self):
+        """Test that the sqlite mode imports the pickled data and stores games as rows"""
+        game = {
+            "game_mode": "HvH",
+            "number_of_colors": 4,
+            "number_of_dots": 4,
+            "amount_attempted": 1,
+            "amount_allowed": 10,
+            "win_status": None,
+            "game": "paused",
+        }
+        manager = UserDataManager()
+        manager.clear_all()
+        manager["saved_games"] = [dict(game, win_status=True)]
+        manager["theme"] = "dark"
+        UserDataManager.set_storage_mode("sqlite")
+        try:
+            self.assertTrue(os.path.exists(manager._database_path()))
+            manager.saved_games.append(game)
+            manager["theme"] = "light"
+            manager.flush()
+            manager._load_data()
+            self.assertEqual(manager._data, {"theme": "light"})
+            self.assertEqual(len(manager.saved_games), 2)
+            self.assertEqual(manager.saved_games.continuable_indices(), [1])
+            self.assertEqual(manager.saved_games[1]["game"], "paused")
+        finally:
+            UserDataManager.set_storage_mode("pickle")
+        self.assertEqual(manager.theme, "light")
+        self.assertEqual(manager.saved_games[1], game)
+        manager.clear_all()
+        os.remove(manager._database_path())
+
+    def test_payloads(self):
+        """Test that payloads are stored outside of the user data and cleared with it"""
+        key = UserDataManager.save_payload({"board": [1, 2]})
+        self.assertEqual(UserDataManager.load_payload(key), {"board": [1, 2]})
+        self.assertEqual(UserDataManager.save_payload("new", key), key)
+        self.assertEqual(UserDataManager.load_payload(key), "new")
+
+        UserDataManager.delete_payload(key)
+        self.assertIsNone(UserDataManager.load_payload(key))
+        key = UserDataManager.save_payload("value")
+        UserDataManager().clear_all()
+        self.assertIsNone(UserDataManager.load_payload(key))
+
+    def test_nested_change_is_flushed(self):
+        """Test that a change made inside a retrieved value is written by the next flush"""
+        manager = UserDataManager()
+        manager.clear_all()
+        manager["history"] = [1]
+        manager.flush()
+        manager.history.append(2)
+        manager.flush()
+        manager._load_data()
+        self.assertEqual(manager.history, [1, 2])
+
+        with patch.object(UserDataManager, "save_data") as mock_save:
+            self.assertEqual(manager.history, [1, 2])
+            manager.flush()
+        mock_save.assert_not_called()  # an unchanged value is not rewritten
+
+    def test_list_changes_are_journaled(self):
+        """Test that a change made inside a list is journaled without the rest of the list"""
+        manager = UserDataManager()
+        manager.clear_all()
+        UserDataManager.set_storage_mode("journal")
+        try:
+            manager["history"] = list(range(100))
+            manager.flush()
+            with patch("pickle.dump", wraps=pickle.dump) as mock_dump:
+                manager.history.append(100)
+                manager.history[0] = -1
+                manager.history.pop(1)
+                manager.flush()
+            self.assertEqual(
+                [call.args[0] for call in mock_dump.call_args_list],
+                [
+                    ("history", "insert", 100, 100),
+                    ("history", "set", 0, -1),
+                    ("history", "delete", 1, None),
+                ],
+            )
+
+            manager._load_data()
+            self.assertEqual(manager.history, [-1, *range(2, 101)])
+        finally:
+            UserDataManager.set_storage_mode("pickle")
+
+    def test_mark_dirty(self):
+        """Test that a change made inside another mutable value is written once reported"""
+        manager = UserDataManager()
+        manager.clear_all()
+        manager["settings"] = {"theme": "dark"}
+        manager.flush()
+        manager.settings["theme"] = "light"
+        with patch.object(UserDataManager, "save_data") as mock_save:
+            manager.flush()
+        mock_save.assert_not_called()  # not reported yet
+
+        manager.mark_dirty("settings")
+        manager.flush()
+        manager._load_data()
+        self.assertEqual(manager.settings, {"theme": "light"})
+
+    def test_background_flush(self):
+        """Test that a burst of changes is written once by the background flusher"""
+        manager = UserDataManager()
+        manager.clear_all()
+        UserDataManager._flush_delay = 0.05
+        try:
+            with patch.object(
+                UserDataManager, "save_data", wraps=manager.save_data
+            ) as mock_save:
+                for value in range(5):
+                    manager["counter"] = value
+                flusher = manager._flusher
+                flusher.join()
+            mock_save.assert_called_once()
+            self.assertIsNone(manager._flusher)
+            with open(self.file_path, "rb") as file:
+                self.assertEqual(pickle.load(file), {"counter": 4})
+        finally:
+            UserDataManager._flush_delay = 1.0
+
+    def test_transaction(self):
+        """Test that a transaction writes its changes once when it exits"""
+        manager = UserDataManager()
+        manager.clear_all()
+        with patch.object(
+            UserDataManager, "save_data", wraps=manager.save_data
+        ) as mock_save:
+            with manager.transaction():
+                manager["first"] = 1
+                with manager.transaction():
+                    manager["second"] = [2]
+                    manager.second.append(3)
+                mock_save.assert_not_called()
+            mock_save.assert_called_once()
+        self.assertIsNone(manager._flusher)
+        with open(self.file_path, "rb") as file:
+            self.assertEqual(pickle.load(file), {"first": 1, "second": [2, 3]})
+
+    def test_unknown_storage_mode(self):
+        """Test that an unknown storage mode is rejected"""
+        with self.assertRaises(ValueError):
+            UserDataManager.set_storage_mode("csv")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,39 @@
+import os
+import tempfile
+
+from mastermind.solver.decision_tree import DecisionTree
+from mastermind.solver.opening_book import OpeningBook
+from mastermind.solver.transposition_cache import TranspositionCache
+from mastermind.storage.feedback_table import FeedbackTableManager
+from mastermind.storage.persistent_cache import PersistentCacheManager
+
+
+class TemporaryCacheMixin:
+    """
+    Points the persistent cache at a temporary directory for the duration of a test case.
+
+    The opening books, transposition caches, decision trees and feedback tables held by the process are forgotten before and after the test case, so that nothing leaks in from the real cache or out to other test cases. Mix it in before unittest.TestCase, and call super() when overriding setUpClass or tearDownClass.
+    """
+
+    @classmethod
+    def _forget_loaded_data(cls):
+        OpeningBook._books.clear()
+        TranspositionCache._caches.clear()
+        DecisionTree._trees.clear()
+        FeedbackTableManager._tables.clear()
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.cache_dir = os.path.join(cls.temp_dir.name, "cache")
+        cls._previous_cache_directory = PersistentCacheManager._cache_directory
+        PersistentCacheManager._cache_directory = cls.cache_dir
+        cls._forget_loaded_data()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._forget_loaded_data()
+        PersistentCacheManager._cache_directory = cls._previous_cache_directory
+        cls.temp_dir.cleanup()
+        super().tearDownClass()
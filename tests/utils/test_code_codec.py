@@ -0,0 +1,51 @@
+import itertools
+import unittest
+
+import numpy as np
+
+from mastermind.utils.code_codec import (
+    decode_code,
+    decode_codes,
+    encode_code,
+    encode_codes,
+)
+
+
+class TestCodeCodec(unittest.TestCase):
+    """Test suite for the integer code codec"""
+
+    def test_lexicographic_order(self):
+        """Test that indices follow the lexicographic order of codes"""
+        codes = list(itertools.product(range(1, 4), repeat=2))
+        self.assertEqual([encode_code(code, 3) for code in codes], list(range(9)))
+        self.assertEqual(decode_code(0, 3, 2), (1, 1))
+        self.assertEqual(decode_code(3, 3, 2), (2, 1))
+        self.assertEqual(decode_code(8, 3, 2), (3, 3))
+
+    def test_scalar_roundtrip(self):
+        """Test that decoding an encoded code gives it back, beyond 64 bits too"""
+        for code, colors in [((1, 1, 2, 2), 6), ((6, 5, 4, 3), 6), ((9,) * 25, 10)]:
+            self.assertEqual(
+                decode_code(encode_code(code, colors), colors, len(code)), code
+            )
+
+    def test_vectorized_matches_scalar(self):
+        """Test that the vectorized variants agree with the scalar ones"""
+        indices = np.arange(6**4)
+        codes = decode_codes(indices, 6, 4)
+        self.assertEqual(codes.dtype, np.uint8)
+        self.assertEqual(codes.shape, (6**4, 4))
+        for index in [0, 7, 500, 6**4 - 1]:
+            self.assertEqual(tuple(codes[index]), decode_code(index, 6, 4))
+        np.testing.assert_array_equal(encode_codes(codes, 6), indices)
+
+    def test_vectorized_overflow(self):
+        """Test that dimensions beyond 64-bit indices are rejected"""
+        with self.assertRaises(ValueError):
+            decode_codes(np.arange(3), 10, 20)
+        with self.assertRaises(ValueError):
+            encode_codes(np.ones((1, 20), dtype=np.uint8), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,14 @@
+import itertools
 import unittest
 
-from mastermind.utils.get_feedback import generate_feedback
+import numpy as np
+
+from mastermind.utils.get_feedback import (
+    decode_feedback,
+    encode_feedback,
+    generate_feedback,
+    generate_feedback_matrix,
+)
 
 
 class TestGenerateFeedback(unittest.TestCase):
@@ -63,5 +71,43 @@ class TestGenerateFeedback(unittest.TestCase):
             self.assertEqual((black_pegs, white_pegs), (exp_black, exp_white))
 
 
+class TestGenerateFeedbackMatrix(unittest.TestCase):
+    """Test suite for the generate_feedback_matrix function"""
+
+    def test_matches_scalar_function(self):
+        """Test that every entry matches generate_feedback on the same pair"""
+        codes = np.array(list(itertools.product(range(1, 5), repeat=3)))
+        matrix = generate_feedback_matrix(codes, codes, 4)
+        self.assertEqual(matrix.shape, (len(codes), len(codes)))
+
+        for i, guess in enumerate(codes):
+            for j, secret in enumerate(codes):
+                expected = generate_feedback(tuple(guess), tuple(secret), 4)
+                self.assertEqual(decode_feedback(matrix[i, j], 3), expected)
+
+    def test_rectangular_input(self):
+        """Test that guesses and secrets can have different lengths"""
+        guesses = [(1, 2, 3, 4)]
+        secrets = [(1, 2, 3, 4), (1, 2, 4, 3), (5, 5, 5, 5)]
+        matrix = generate_feedback_matrix(guesses, secrets, 6)
+        self.assertEqual(matrix.shape, (1, 3))
+        self.assertEqual(
+            [decode_feedback(code, 4) for code in matrix[0]],
+            [(4, 0), (2, 2), (0, 0)],
+        )
+
+    def test_mismatched_dots(self):
+        """Test that guesses and secrets with different lengths are rejected"""
+        with self.assertRaises(ValueError):
+            generate_feedback_matrix([(1, 2, 3)], [(1, 2)], 3)
+
+    def test_encode_decode_roundtrip(self):
+        """Test that encode_feedback and decode_feedback are inverses"""
+        for black in range(5):
+            for white in range(5 - black):
+                code = encode_feedback(black, white, 4)
+                self.assertEqual(decode_feedback(code, 4), (black, white))
+
+
 if __name__ == "__main__":
     unittest.main()